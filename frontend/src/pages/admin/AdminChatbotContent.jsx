@@ -4,7 +4,7 @@ import { selectCurrentUser } from '../../store/slices/authSlice';
 import DashboardLayout from '../../components/DashboardLayout';
 import Modal from '../../components/Modal';
 import {
-    getChatbotContent, getChatbotContentStats, addChatbotContent,
+    getChatbotContent, getChatbotContentItem, getChatbotContentStats, addChatbotContent,
     updateChatbotContent, deleteChatbotContent, clearAllChatbotContent
 } from '../../utils/api';
 import gsap from 'gsap';
@@ -28,6 +28,8 @@ const AdminChatbotContent = () => {
     const [error, setError] = useState('');
     const [success, setSuccess] = useState('');
     const [expandedId, setExpandedId] = useState(null);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
 
     const [formData, setFormData] = useState({
         title: '',
@@ -58,15 +60,55 @@ const AdminChatbotContent = () => {
                 getChatbotContentStats()
             ]);
             setContent(Array.isArray(contentRes.data?.content) ? contentRes.data.content : []);
+            setNextCursor(contentRes.data?.next_cursor || null);
             setStats(statsRes.data || { total_entries: 0, total_chunks: 0, namespaces: [] });
         } catch (err) {
             console.error('Error fetching data:', err);
             setContent([]);
+            setNextCursor(null);
         } finally {
             setLoading(false);
         }
     };
 
+    // The list carries previews only; pages are fetched on demand by following next_cursor
+    const loadMore = async () => {
+        if (!nextCursor) return;
+        try {
+            setLoadingMore(true);
+            const res = await getChatbotContent({ cursor: nextCursor });
+            setContent(prev => [...prev, ...(res.data?.content || [])]);
+            setNextCursor(res.data?.next_cursor || null);
+        } catch (err) {
+            console.error('Error loading more content:', err);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
+    // Full chunk text is loaded per item (when expanded or edited) and kept in the list
+    const withFullText = async (item) => {
+        if (item.text !== undefined) return item;
+        try {
+            const res = await getChatbotContentItem(item.id, item.namespace);
+            const full = { ...item, ...res.data?.content };
+            setContent(prev => prev.map(c => (c.id === item.id && c.namespace === item.namespace ? full : c)));
+            return full;
+        } catch (err) {
+            console.error('Error loading content:', err);
+            return item;
+        }
+    };
+
+    const toggleExpanded = (item) => {
+        if (expandedId === item.id) {
+            setExpandedId(null);
+            return;
+        }
+        setExpandedId(item.id);
+        withFullText(item);
+    };
+
     const handleAdd = () => {
         setEditingItem(null);
         setFormData({ title: '', text: '', links: [] });
@@ -75,7 +117,8 @@ const AdminChatbotContent = () => {
         setShowModal(true);
     };
 
-    const handleEdit = (item) => {
+    const handleEdit = async (item) => {
+        item = await withFullText(item);
         setEditingItem(item);
         setFormData({
             title: item.title || '',
@@ -246,6 +289,7 @@ const AdminChatbotContent = () => {
                             </button>
                         </div>
                     ) : (
+                        <>
                         <div className="divide-y divide-zinc-100">
                             {content.map((item) => {
                                 const isExpanded = expandedId === item.id;
@@ -254,7 +298,7 @@ const AdminChatbotContent = () => {
                                         {/* Card Header - Always visible */}
                                         <div
                                             className={`p-4 cursor-pointer hover:bg-zinc-50 transition-colors ${isExpanded ? 'bg-violet-50/50' : ''}`}
-                                            onClick={() => setExpandedId(isExpanded ? null : item.id)}
+                                            onClick={() => toggleExpanded(item)}
                                         >
                                             <div className="flex items-center justify-between gap-3">
                                                 <div className="flex items-center gap-3 flex-1 min-w-0">
@@ -293,7 +337,7 @@ const AdminChatbotContent = () => {
                                                         <span className="text-[10px] text-zinc-400">ID: {item.id.slice(0, 20)}...</span>
                                                     </div>
                                                     <p className="text-sm text-zinc-700 whitespace-pre-wrap leading-relaxed">
-                                                        {item.text || 'No content available'}
+                                                        {item.text === undefined ? 'Loading...' : (item.text || 'No content available')}
                                                     </p>
                                                     {item.metadata && Object.keys(item.metadata).length > 0 && (
                                                         <div className="mt-3 pt-3 border-t border-zinc-100">
@@ -314,6 +358,14 @@ const AdminChatbotContent = () => {
                                 );
                             })}
                         </div>
+                        {nextCursor && (
+                            <div className="p-4 border-t border-zinc-100 text-center">
+                                <button onClick={loadMore} disabled={loadingMore} className="inline-flex items-center gap-2 px-4 py-2 text-sm font-medium text-zinc-600 bg-white border border-zinc-200 rounded-lg hover:bg-zinc-50 transition-all disabled:opacity-50">
+                                    {loadingMore ? 'Loading...' : 'Load more'}
+                                </button>
+                            </div>
+                        )}
+                        </>
                     )}
                 </div>
             </div>
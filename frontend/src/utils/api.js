@@ -272,7 +272,8 @@ const ZENITH_API = axios.create({
   baseURL: import.meta.env.VITE_ZENITH_API || 'http://localhost:8000',
 });
 
-export const getChatbotContent = () => ZENITH_API.get('/api/content');
+export const getChatbotContent = (params) => ZENITH_API.get('/api/content', { params }); // One page; pass { cursor: next_cursor } for the next
+export const getChatbotContentItem = (id, namespace) => ZENITH_API.get(`/api/content/${encodeURIComponent(id)}`, { params: { namespace } });
 export const getChatbotContentStats = () => ZENITH_API.get('/api/content/stats');
 export const addChatbotContent = (data) => ZENITH_API.post('/api/content', data);
 export const updateChatbotContent = (id, data) => ZENITH_API.put(`/api/content/${id}`, data);
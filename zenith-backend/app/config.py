@@ -3,7 +3,7 @@ Configuration module for MLRIT Chatbot
 Handles all environment variables and app settings
 """
 from pydantic_settings import BaseSettings
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from functools import lru_cache
 
 
@@ -13,6 +13,13 @@ class Settings(BaseSettings):
     # MongoDB Configuration
     MONGODB_URI: str
     MONGODB_DB_NAME: str = "mlrit_chatbot"
+    MONGO_MAX_POOL_SIZE: int = 100  # Connections per server, per worker process
+    MONGO_MIN_POOL_SIZE: int = 5  # Kept open so bursts don't wait on new TLS handshakes
+    MONGO_MAX_IDLE_TIME_MS: int = 300000  # Idle connections above the minimum are closed after this
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 10000  # Fail instead of waiting forever when the pool is exhausted
+    MONGO_COMPRESSORS: str = ""  # Opt-in wire compression, in preference order, e.g. "zstd,zlib" (zstd needs zstandard, snappy needs python-snappy)
+    MONGO_READ_PREFERENCE: str = "primary"  # primary, primaryPreferred, secondary, secondaryPreferred, nearest
+    MONGO_METRICS_ENABLED: bool = True  # Command latency / pool wait histograms at GET /metrics/mongo
     
     # Pinecone Configuration
     PINECONE_API_KEY: str
@@ -44,15 +51,44 @@ class Settings(BaseSettings):
     
     # API Configuration
     API_V1_PREFIX: str = "/api/v1"
+    COUNT_CACHE_SECONDS: float = 30.0  # How long filtered list totals are reused
+    BULK_MAX_ITEMS: int = 1000  # Per JSON bulk request (use /import for larger loads)
+    BULK_BATCH_SIZE: int = 1000  # Records per insert_many during /import
+    BULK_MAX_REPORTED_ERRORS: int = 100  # Per-item errors returned in a bulk response
     
-    # RAG Configuration
-    CHUNK_SIZE: int = 1000
-    CHUNK_OVERLAP: int = 200
+    # Read Cache (hot CRUD reads; any write to a collection invalidates its entries)
+    CACHE_ENABLED: bool = True
+    CACHE_BACKEND: str = "memory"  # "memory" (per worker) or "redis" (shared between workers)
+    CACHE_MAX_ENTRIES: int = 1024  # In-process LRU size
+    REDIS_URL: str = "redis://localhost:6379/0"
+    NAME_INDEX_REFRESH_SECONDS: float = 60.0  # Fuzzy company/role name index (rebuilt sooner after local writes)
+    
+    # RAG Configuration (chunk sizes are in embedding-model tokens)
+    CHUNK_MAX_TOKENS: int = 256
+    CHUNK_OVERLAP_TOKENS: int = 32
+    CHUNK_NAMESPACE_OVERRIDES: str = ""  # e.g. "events:128:16,placements:320:48"
     TOP_K_RESULTS: int = 5
+    SEARCH_NAMESPACE_TIMEOUT_SECONDS: float = 5.0  # Per-namespace limit for multi-namespace searches
+    MAINTENANCE_CONCURRENCY: int = 4  # Parallel Pinecone requests for bulk maintenance jobs
     
     # PDF Configuration
     PDF_OUTPUT_DIR: str = "generated_reports"
     
+    # Upload Limits (uploads are streamed to disk and rejected once they pass the limit)
+    MAX_PDF_UPLOAD_MB: int = 10
+    MAX_ADMIN_PDF_UPLOAD_MB: int = 50
+    MAX_IMAGE_UPLOAD_MB: int = 10
+    
+    # Image Variants (downscaled WebP/JPEG copies served via ?w=)
+    IMAGE_VARIANT_WIDTHS: str = "320,640,1280"
+    IMAGE_VARIANT_QUALITY: int = 80
+    IMAGE_VARIANT_WORKERS: int = 2
+    
+    # Image Index (in-process image metadata for chat; reloads when another worker changes images)
+    IMAGE_INDEX_REFRESH_SECONDS: float = 5.0
+    IMAGE_MATCH_MIN_SCORE: float = 0.3  # Minimum cosine similarity between question and image label/description
+    IMAGE_MATCH_FALLBACK: bool = True  # Still show a category's closest image when none reaches the minimum score
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -63,6 +99,21 @@ class Settings(BaseSettings):
         """Convert comma-separated origins to list"""
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
     
+    @property
+    def image_variant_widths(self) -> List[int]:
+        """Convert comma-separated variant widths to a list of ints"""
+        return [int(w) for w in self.IMAGE_VARIANT_WIDTHS.split(",") if w.strip()]
+    
+    @property
+    def chunk_namespace_overrides(self) -> Dict[str, Tuple[int, int]]:
+        """Parse "namespace:max_tokens:overlap_tokens" entries into a dict"""
+        overrides = {}
+        for entry in self.CHUNK_NAMESPACE_OVERRIDES.split(","):
+            parts = [p.strip() for p in entry.split(":")]
+            if len(parts) == 3 and parts[0]:
+                overrides[parts[0]] = (int(parts[1]), int(parts[2]))
+        return overrides
+    
     @property
     def llm_api_key(self) -> str:
         """Get the appropriate LLM API key based on provider"""
@@ -4,9 +4,12 @@ Handles MongoDB Atlas and Pinecone connections
 """
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pinecone import Pinecone, ServerlessSpec
-from typing import Optional
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+from typing import Dict, Iterable, List, Optional
 import logging
 from app.config import settings
+from app.monitoring import mongo_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -23,18 +26,30 @@ class MongoDB:
         try:
             # Workaround for Windows SSL issues with older OpenSSL
             # Note: tlsAllowInvalidCertificates is for development only
+            compressors = [c.strip() for c in settings.MONGO_COMPRESSORS.split(",") if c.strip()]
             cls.client = AsyncIOMotorClient(
                 settings.MONGODB_URI,
                 serverSelectionTimeoutMS=5000,
                 connectTimeoutMS=10000,
                 socketTimeoutMS=10000,
-                tlsAllowInvalidCertificates=True  # Development workaround
+                maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+                minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+                maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+                waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+                readPreference=settings.MONGO_READ_PREFERENCE,
+                event_listeners=[mongo_metrics] if settings.MONGO_METRICS_ENABLED else [],
+                tlsAllowInvalidCertificates=True,  # Development workaround
+                **({"compressors": compressors} if compressors else {})
             )
             cls.database = cls.client[settings.MONGODB_DB_NAME]
             
             # Test connection
             await cls.client.admin.command('ping')
             logger.info("✅ Connected to MongoDB Atlas successfully")
+            logger.info(
+                f"🔌 Mongo pool {settings.MONGO_MIN_POOL_SIZE}-{settings.MONGO_MAX_POOL_SIZE} | "
+                f"compression: {', '.join(compressors) or 'off'} | read preference: {settings.MONGO_READ_PREFERENCE}"
+            )
             logger.warning("⚠️  Using tlsAllowInvalidCertificates (development only)")
             
         except Exception as e:
@@ -52,6 +67,56 @@ class MongoDB:
             cls.client.close()
             logger.info("Disconnected from MongoDB")
     
+    @classmethod
+    async def ensure_indexes(cls, collections: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """
+        Create the indexes declared in COLLECTION_INDEXES (idempotent - existing indexes are kept)
+        
+        Args:
+            collections: Collection names to provision (defaults to every registered collection)
+        
+        Returns:
+            Dict of collection name -> names of the indexes that are in place
+        """
+        if cls.database is None:
+            return {}
+        
+        created = {}
+        for name in (collections if collections is not None else COLLECTION_INDEXES):
+            indexes = COLLECTION_INDEXES.get(name, [])
+            if not indexes:
+                continue
+            collection = cls.database[name]
+            try:
+                created[name] = await collection.create_indexes(indexes)
+            except Exception:
+                # One bad index (e.g. duplicate roll numbers blocking the unique index) fails the
+                # whole batch - retry one by one so the others still get created
+                created[name] = []
+                for index in indexes:
+                    try:
+                        created[name] += await cls._create_index(collection, index)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Could not create index {index.document['name']} on {name}: {e}")
+        
+        logger.info(f"✅ Indexes ready for {len(created)} collections")
+        return created
+    
+    @staticmethod
+    async def _create_index(collection, index: IndexModel) -> List[str]:
+        """Create one index, replacing an existing index on the same keys whose options changed (e.g. now unique)"""
+        try:
+            return await collection.create_indexes([index])
+        except OperationFailure as e:
+            if e.code not in (85, 86):  # IndexOptionsConflict, IndexKeySpecsConflict
+                raise
+        keys = list(index.document["key"].items())
+        for existing_name, info in (await collection.index_information()).items():
+            if existing_name != "_id_" and list(info["key"]) == keys:
+                logger.info(f"🔁 Replacing index {existing_name} on {collection.name} with {index.document['name']}")
+                await collection.drop_index(existing_name)
+        return await collection.create_indexes([index])
+    
     @classmethod
     def get_database(cls) -> AsyncIOMotorDatabase:
         """Get database instance"""
@@ -127,6 +192,106 @@ class Collections:
     SCHOLARSHIPS = "scholarships"
     STUDENTS = "students"
     STUDENT_REPORTS = "student_reports"
+    DOCUMENTS = "documents"
+    VECTOR_MANIFEST = "vector_manifest"
+    IMAGES = "images"
+    IMAGE_VECTORS = "image_vectors"
+    CACHE_VERSIONS = "cache_versions"
+    PLACEMENT_ANALYTICS = "placement_analytics"
+    MAINTENANCE_JOBS = "maintenance_jobs"
+
+
+
+def _newest(*keys: str) -> IndexModel:
+    """Equality keys followed by (created_at, _id) descending - the BaseCRUDService list sort and page cursor"""
+    return IndexModel([*((key, ASCENDING) for key in keys), ("created_at", DESCENDING), ("_id", DESCENDING)])
+
+
+# Indexes per collection, matching the queries each service runs
+# (applied at startup by MongoDB.ensure_indexes; check with scripts/index_report.py)
+COLLECTION_INDEXES: Dict[str, List[IndexModel]] = {
+    Collections.EVENTS: [
+        _newest(),
+        _newest("event_type"),
+        IndexModel([("is_active", ASCENDING), ("date", ASCENDING)]),  # Upcoming events
+    ],
+    Collections.PLACEMENTS: [
+        _newest(),
+        _newest("academic_year"),
+        _newest("academic_year", "department"),
+    ],
+    Collections.COMPANY_PACKAGES: [
+        _newest(),
+        _newest("academic_year"),
+        _newest("company_key"),  # Normalized company name - exact and prefix lookups
+        IndexModel([("package_offered", DESCENDING)]),  # Top packages
+    ],
+    Collections.INTERVIEW_QUESTIONS: [
+        _newest(),
+        _newest("question_category"),
+        _newest("difficulty_level"),
+        _newest("company_key"),  # Normalized company name - exact and prefix lookups
+    ],
+    Collections.INTERNSHIPS: [
+        _newest(),
+        IndexModel([("is_active", ASCENDING), ("application_deadline", ASCENDING)]),  # Active internships
+        _newest("company_key"),  # Normalized company name - exact and prefix lookups
+    ],
+    Collections.SKILL_ROADMAPS: [
+        _newest(),
+        _newest("department"),
+        _newest("role_key"),
+    ],
+    Collections.RESUME_GUIDES: [
+        _newest(),
+        _newest("category"),
+    ],
+    Collections.CLUBS: [
+        _newest(),
+        _newest("category"),
+        _newest("membership_open"),
+    ],
+    Collections.SCHOLARSHIPS: [
+        _newest(),
+        _newest("category"),
+        IndexModel([("is_active", ASCENDING), ("application_deadline", ASCENDING)]),  # Active scholarships
+    ],
+    Collections.STUDENTS: [
+        _newest(),
+        IndexModel([("roll_number", ASCENDING)], unique=True),
+        _newest("department"),
+        _newest("placement_status"),
+    ],
+    Collections.STUDENT_REPORTS: [
+        _newest(),
+        _newest("student_id"),
+    ],
+    Collections.DOCUMENTS: [
+        # Duplicate upload lookups; unique so concurrent identical uploads can't both claim the hash
+        IndexModel(
+            [("file_hash", ASCENDING), ("namespace", ASCENDING)],
+            unique=True, partialFilterExpression={"file_hash": {"$type": "string"}}
+        ),
+        IndexModel([("filename", ASCENDING), ("namespace", ASCENDING), ("updated_at", DESCENDING)]),  # Previous versions
+        _newest("namespace"),
+        _newest("status"),
+        _newest(),
+    ],
+    Collections.VECTOR_MANIFEST: [
+        IndexModel([("namespace", ASCENDING), ("vector_id", ASCENDING)], unique=True),
+        IndexModel([("category", ASCENDING), ("namespace", ASCENDING), ("vector_id", ASCENDING)]),
+    ],
+    Collections.IMAGES: [
+        IndexModel([("category", ASCENDING), ("uploaded_at", DESCENDING)]),
+        IndexModel([("label", ASCENDING), ("uploaded_at", DESCENDING)]),
+        IndexModel([("category", ASCENDING), ("label", ASCENDING), ("uploaded_at", DESCENDING)]),
+        IndexModel([("relative_path", ASCENDING), ("category", ASCENDING), ("label", ASCENDING)]),  # Dedup + GC
+    ],
+    Collections.MAINTENANCE_JOBS: [
+        IndexModel([("created_at", DESCENDING)]),
+        IndexModel([("finished_at", ASCENDING)], expireAfterSeconds=7 * 24 * 3600),  # Finished jobs kept a week
+    ],
+}
 
 
 # Pinecone namespaces
@@ -11,6 +11,10 @@ import sys
 
 from app.config import settings
 from app.database import mongodb, pinecone_db
+from app.monitoring import mongo_metrics
+from app.services import NAME_KEY_SERVICES
+from app.services.image_index import image_index
+from app.services.placement_analytics import placement_analytics
 
 # Import all routers
 from app.routers import (
@@ -50,6 +54,22 @@ async def lifespan(app: FastAPI):
         await mongodb.connect()
         logger.info("✅ MongoDB connected")
         
+        # Indexes for every collection (declared in app.database.COLLECTION_INDEXES)
+        await mongodb.ensure_indexes()
+        
+        # Name keys for records stored before company/role lookups used them
+        for service in NAME_KEY_SERVICES:
+            try:
+                await service.backfill_name_keys()
+            except Exception as e:
+                logger.warning(f"⚠️ Name key backfill for {service.collection_name} failed: {e}")
+        
+        # Materialized placement analytics (built once; kept current on every placement/package write)
+        await placement_analytics.ensure_built()
+        
+        # In-process image metadata for chat image matching
+        await image_index.load()
+        
         # Connect to Pinecone
         pinecone_db.connect()
         logger.info("✅ Pinecone connected")
@@ -165,6 +185,32 @@ async def detailed_health():
     }
 
 
+@app.get("/metrics/mongo", tags=["Health"])
+async def mongo_telemetry(reset: bool = False):
+    """
+    MongoDB latency per collection and command, plus connection pool checkout waits
+    
+    Pass ?reset=true to start a new measurement window after reading this one.
+    """
+    if not settings.MONGO_METRICS_ENABLED:
+        raise HTTPException(404, "MongoDB metrics are disabled (MONGO_METRICS_ENABLED=false)")
+    
+    snapshot = mongo_metrics.snapshot()
+    if reset:
+        mongo_metrics.reset()
+    return {
+        "pool_settings": {
+            "max_pool_size": settings.MONGO_MAX_POOL_SIZE,
+            "min_pool_size": settings.MONGO_MIN_POOL_SIZE,
+            "max_idle_time_ms": settings.MONGO_MAX_IDLE_TIME_MS,
+            "wait_queue_timeout_ms": settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            "compressors": settings.MONGO_COMPRESSORS,
+            "read_preference": settings.MONGO_READ_PREFERENCE
+        },
+        **snapshot
+    }
+
+
 # Register all routers
 app.include_router(events_router, prefix=settings.API_V1_PREFIX)
 app.include_router(placements_router, prefix=settings.API_V1_PREFIX)
@@ -4,6 +4,7 @@ MongoDB models and helper functions
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from bson import ObjectId
+import orjson
 
 
 class PyObjectId(ObjectId):
@@ -43,6 +44,28 @@ def serialize_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
     return doc
 
 
+def bson_default(value: Any) -> Any:
+    """orjson hook for the BSON types orjson doesn't encode natively (ObjectId, Decimal128, ...)"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if hasattr(value, "to_decimal"):  # Decimal128
+        return str(value.to_decimal())
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps_bson(obj: Any) -> bytes:
+    """
+    Encode raw MongoDB documents straight to JSON bytes
+    
+    For documents as MongoDB returns them (ObjectIds, naive or UTC datetimes, nested documents)
+    the JSON matches serialize_doc followed by FastAPI's encoder - ObjectIds as strings, datetimes
+    in ISO format - but is built by orjson's compiled encoder without walking the documents in Python.
+    It is not a drop-in for arbitrary Python values: NaN/Infinity encode as null, UTC offsets
+    with seconds are truncated to the minute and integers beyond 64 bits are rejected.
+    """
+    return orjson.dumps(obj, default=bson_default)
+
+
 def prepare_create_doc(data: Dict[str, Any]) -> Dict[str, Any]:
     """Prepare document for creation in MongoDB"""
     doc = data.copy()
@@ -3,7 +3,7 @@ Image Management Models
 Store metadata for images uploaded to MLRIT chatbot
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 
@@ -20,6 +20,9 @@ class ImageMetadata(BaseModel):
     page_num: Optional[int] = Field(None, description="PDF page number if extracted from PDF")
     uploaded_at: datetime = Field(default_factory=datetime.utcnow)
     description: Optional[str] = Field(None, description="Optional image description")
+    variants: List[Dict[str, Any]] = Field(default_factory=list, description="Downscaled WebP/JPEG variants")
+    content_hash: Optional[str] = Field(None, description="SHA-256 of the stored file (files are shared by identical uploads)")
+    size_bytes: Optional[int] = Field(None, description="Stored file size in bytes")
 
 
 class ContentUploadRequest(BaseModel):
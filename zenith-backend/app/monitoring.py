@@ -0,0 +1,197 @@
+"""
+MongoDB Telemetry - Per-collection command latency and connection pool wait histograms
+pymongo monitoring listeners registered on the Motor client (see MongoDB.connect) and exposed
+through GET /metrics/mongo. Listeners run on Motor's worker threads, so updates take a lock.
+"""
+from typing import Any, Dict, Optional, Tuple
+from datetime import datetime
+import threading
+import time
+
+from pymongo import monitoring
+
+# Histogram bucket upper bounds in milliseconds (the last bucket is everything above)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram"""
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float, error: bool = False):
+        position = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                position = i
+                break
+        self.buckets[position] += 1
+        self.count += 1
+        self.errors += error
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given fraction of observations (max for the last bucket)"""
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else round(self.max_ms, 2)
+        return round(self.max_ms, 2)
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"le_{bound}ms" for bound in LATENCY_BUCKETS_MS] + [f"gt_{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": {label: count for label, count in zip(labels, self.buckets) if count}
+        }
+
+
+def _collection_of(command_name: str, command: Dict[str, Any]) -> str:
+    """Collection a command targets ("-" for database/admin commands like ping)"""
+    if command_name == "getMore":
+        return str(command.get("collection", "-"))
+    target = command.get(command_name)
+    return target if isinstance(target, str) else "-"
+
+
+class MongoMetrics(monitoring.CommandListener, monitoring.ConnectionPoolListener):
+    """Command latency per (collection, command) and connection pool checkout waits"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()  # Checkout start time (checkout started/finished run on one thread)
+        self._pending: Dict[Tuple[int, Any], str] = {}  # (request_id, connection) -> collection
+        self.in_use = 0  # Connections checked out right now (a gauge - survives reset)
+        self.reset()
+
+    def reset(self):
+        """Start a fresh measurement window (in_use keeps tracking live checkouts; max_in_use restarts from it)"""
+        with self._lock:
+            self.since = datetime.utcnow()
+            self.commands: Dict[Tuple[str, str], Histogram] = {}
+            self.checkout_wait = Histogram()
+            self.pool_counters = {
+                "connections_created": 0, "connections_closed": 0,
+                "checkouts": 0, "checkout_failures": 0, "checked_in": 0, "pool_cleared": 0
+            }
+            self.max_in_use = self.in_use
+
+    # ---- Command events ----
+
+    def started(self, event):
+        collection = _collection_of(event.command_name, event.command)
+        with self._lock:
+            self._pending[(event.request_id, event.connection_id)] = collection
+
+    def _finished(self, event, error: bool):
+        with self._lock:
+            collection = self._pending.pop((event.request_id, event.connection_id), "-")
+            key = (collection, event.command_name)
+            histogram = self.commands.get(key)
+            if histogram is None:
+                histogram = self.commands[key] = Histogram()
+            histogram.observe(event.duration_micros / 1000, error=error)
+
+    def succeeded(self, event):
+        self._finished(event, error=False)
+
+    def failed(self, event):
+        self._finished(event, error=True)
+
+    # ---- Connection pool events ----
+
+    def _count(self, counter: str):
+        with self._lock:
+            self.pool_counters[counter] += 1
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._count("pool_cleared")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._count("connections_created")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._count("connections_closed")
+
+    def connection_check_out_started(self, event):
+        self._local.checkout_started = time.perf_counter()
+
+    def _checkout_done(self, failed: bool):
+        started = getattr(self._local, "checkout_started", None)
+        waited_ms = (time.perf_counter() - started) * 1000 if started is not None else 0.0
+        self._local.checkout_started = None
+        with self._lock:
+            self.checkout_wait.observe(waited_ms, error=failed)
+            if failed:
+                self.pool_counters["checkout_failures"] += 1
+            else:
+                self.pool_counters["checkouts"] += 1
+                self.in_use += 1
+                self.max_in_use = max(self.max_in_use, self.in_use)
+
+    def connection_check_out_failed(self, event):
+        self._checkout_done(failed=True)
+
+    def connection_checked_out(self, event):
+        self._checkout_done(failed=False)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.pool_counters["checked_in"] += 1
+            self.in_use = max(0, self.in_use - 1)
+
+    # ---- Reporting ----
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Metrics since the last reset
+
+        Returns:
+            {since, commands: {collection: {command: histogram}}, pool: {counters, in_use, checkout_wait}}
+        """
+        with self._lock:
+            commands: Dict[str, Dict[str, Any]] = {}
+            for (collection, command_name), histogram in sorted(self.commands.items()):
+                commands.setdefault(collection, {})[command_name] = histogram.snapshot()
+            return {
+                "since": self.since.isoformat(),
+                "commands": commands,
+                "pool": {
+                    **self.pool_counters,
+                    "in_use": self.in_use,
+                    "max_in_use": self.max_in_use,
+                    "checkout_wait": self.checkout_wait.snapshot()
+                }
+            }
+
+
+# Global instance
+mongo_metrics = MongoMetrics()
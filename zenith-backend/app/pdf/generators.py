@@ -140,7 +140,7 @@ class PlacementsPDFGenerator(BasePDFGenerator):
                     p.get('academic_year', 'N/A'),
                     str(p.get('total_students', 0)),
                     str(p.get('students_placed', 0)),
-                    f"{(p.get('students_placed', 0) / p.get('total_students', 1) * 100):.1f}%",
+                    f"{p['placement_percentage'] if 'placement_percentage' in p else p.get('students_placed', 0) / (p.get('total_students') or 1) * 100:.1f}%",
                     f"₹{p.get('average_package', 0):.2f}L",
                     f"₹{p.get('highest_package', 0):.2f}L"
                 ])
@@ -1,16 +1,24 @@
 """
 RAG module initialization
+
+Services are imported on first access, so importing a light submodule (chunker, registry,
+manifest) doesn't load the embedding model.
 """
-from app.rag.embeddings import embedding_service, vector_store, text_chunker
-from app.rag.llm import llm_service
-from app.rag.chat import rag_chat_service
-from app.rag.intent_handler import intent_handler
+from importlib import import_module
+
+_EXPORTS = {
+    "embedding_service": "app.rag.embeddings",
+    "vector_store": "app.rag.embeddings",
+    "text_chunker": "app.rag.chunker",
+    "llm_service": "app.rag.llm",
+    "rag_chat_service": "app.rag.chat",
+    "intent_handler": "app.rag.intent_handler"
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "embedding_service",
-    "vector_store",
-    "text_chunker",
-    "llm_service",
-    "rag_chat_service",
-    "intent_handler"
-]
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,7 @@ RAG Chat Service
 Combines vector search with LLM to answer questions
 """
 from typing import List, Dict, Any, Optional
+import asyncio
 import uuid
 from datetime import datetime
 from app.rag.embeddings import vector_store
@@ -14,6 +15,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+CHAT_IMAGE_WIDTH = 320  # Chat widget renders images at roughly 300px
+
 
 class RAGChatService:
     """Service for RAG-based chat"""
@@ -71,8 +74,15 @@ class RAGChatService:
                 detected_category = self.llm.detect_category(question)
                 logger.info(f"🎯 Detected category: {detected_category}")
                 
+                # Embed the question once - reused for text and image retrieval
+                query_embedding = await asyncio.to_thread(
+                    self.vector_store.embedding_service.generate_embedding, question
+                )
+                
                 # Step 2: Retrieval + Formatting: Search DB → Format with LLM
-                sources = await self._retrieve_relevant_context(question, category=detected_category)
+                sources = await self._retrieve_relevant_context(
+                    question, category=detected_category, query_embedding=query_embedding
+                )
                 
                 logger.info(f"🔍 Retrieved {len(sources)} sources from database")
                 if sources:
@@ -80,7 +90,7 @@ class RAGChatService:
                         logger.info(f"  Source {i+1}: score={src.get('score', 0):.3f}, namespace={src.get('namespace', 'N/A')}, text_len={len(src.get('text', ''))}")
                 
                 # Step 3: Retrieve associated images based on category and query
-                images = await self._retrieve_relevant_images(question, detected_category)
+                images = await self._retrieve_relevant_images(question, detected_category, query_embedding)
                 logger.info(f"🖼️ Found {len(images)} relevant images")
                 
                 if not sources:
@@ -139,7 +149,12 @@ class RAGChatService:
             logger.error(f"Error answering question: {str(e)}")
             raise
     
-    async def _retrieve_relevant_context(self, question: str, category: str = None) -> List[Dict[str, Any]]:
+    async def _retrieve_relevant_context(
+        self,
+        question: str,
+        category: str = None,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Retrieve relevant context from Pinecone.
         ALWAYS searches 'chatbot' and 'total' namespaces (where admin content lives)
@@ -148,12 +163,11 @@ class RAGChatService:
         Args:
             question: User question
             category: Detected category to search
+            query_embedding: Precomputed question embedding (embedded here if not given)
         
         Returns:
             List of relevant documents with scores
         """
-        all_results = []
-        
         # CRITICAL: Always include these namespaces where admin-uploaded content lives
         primary_namespaces = ["chatbot", "total", ""]  # "" is default namespace
         
@@ -179,28 +193,19 @@ class RAGChatService:
         namespaces = sorted(list(namespaces_to_search))
         logger.info(f"🔍 Searching namespaces: {namespaces} for question: '{question[:50]}...'")
         
-        # Search each namespace
-        for namespace in namespaces:
-            try:
-                results = await self.vector_store.search(
-                    query=question,
-                    namespace=namespace,
-                    top_k=10  # Get more results per namespace for better coverage
-                )
-                
-                # Add namespace to results and filter by minimum score
-                for result in results:
-                    result["namespace"] = namespace
-                    # Lower threshold to 0.15 to handle typos and variations
-                    if result.get("score", 0) >= 0.15:
-                        all_results.append(result)
-            
-            except Exception as e:
-                logger.warning(f"⚠️ Error searching namespace {namespace}: {str(e)}")
-                continue
+        # Search all namespaces concurrently with one question embedding
+        # (10 per namespace for better coverage; failed namespaces are skipped)
+        results, _, _ = await self.vector_store.search_namespaces(
+            query=question,
+            namespaces=namespaces,
+            top_k=len(namespaces) * 10,
+            per_namespace_top_k=10,
+            timeout=settings.SEARCH_NAMESPACE_TIMEOUT_SECONDS,
+            query_embedding=query_embedding
+        )
         
-        # Sort by score (highest first) and take top K
-        all_results.sort(key=lambda x: x.get("score", 0), reverse=True)
+        # Lower threshold to 0.15 to handle typos and variations (results are sorted by score)
+        all_results = [result for result in results if (result.get("score") or 0) >= 0.15]
         
         top_results = all_results[:self.top_k]
         
@@ -213,74 +218,61 @@ class RAGChatService:
         
         return top_results
     
-    async def _retrieve_relevant_images(self, question: str, category: str) -> List[Dict[str, str]]:
+    async def _retrieve_relevant_images(
+        self,
+        question: str,
+        category: str,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Dict[str, str]]:
         """
         Retrieve relevant images based on question and category
         
+        Images are ranked by cosine similarity between the question embedding and each image's
+        label/description embedding. Categories without embedded images fall back to label token
+        matching. When nothing matches, the category's best image is still shown
+        (IMAGE_MATCH_FALLBACK - the closest one by embedding, otherwise the newest).
+        
         Args:
             question: User question
             category: Detected category
+            query_embedding: Question embedding (shared with text retrieval)
             
         Returns:
             List of image URLs with labels
         """
         from app.services.image_service import image_storage
+        from app.services.image_index import image_index
         
         try:
-            images = []
+            # In-process index (reloads only when another worker changed images)
+            await image_index.ensure_fresh()
             
-            # Get images from the detected category
-            category_images = await image_storage.get_images_by_category(category)
-            
-            if category_images:
-                # Search for specific labels mentioned in question
-                question_lower = question.lower()
-                
-                # Common keywords for image matching
-                keywords = {
-                    "chairman": ["chairman", "chair"],
-                    "principal": ["principal", "head"],
-                    "director": ["director"],
-                    "hod": ["hod", "head of department"],
-                    "event": ["event", "festival", "function"],
-                    "sports": ["sports", "team", "match", "tournament"],
-                    "campus": ["campus", "building", "infrastructure"],
-                    "club": ["club"],
-                }
-                
-                # Try to match specific labels
-                for img in category_images[:5]:  # Limit to top 5 images
-                    label_lower = img.label.lower()
-                    
-                    # Check if label or any keyword appears in question
-                    if label_lower in question_lower:
-                        images.append({
-                            "url": image_storage.get_image_url(img.relative_path),
-                            "label": img.label,
-                            "description": img.description or "",
-                            "category": img.category
-                        })
-                    else:
-                        # Check keywords
-                        for keyword, synonyms in keywords.items():
-                            if any(syn in question_lower for syn in synonyms) and keyword in label_lower:
-                                images.append({
-                                    "url": image_storage.get_image_url(img.relative_path),
-                                    "label": img.label,
-                                    "description": img.description or "",
-                                    "category": img.category
-                                })
-                                break
+            if query_embedding is not None and image_index.has_vectors(category):
+                ranked = image_index.rank(query_embedding, category, limit=5, min_score=settings.IMAGE_MATCH_MIN_SCORE)
+                if not ranked and settings.IMAGE_MATCH_FALLBACK:
+                    # Nothing close enough - show the closest image, as label matching always showed one
+                    ranked = image_index.rank(query_embedding, category, limit=1, min_score=-1.0)
+                for img, score in ranked:
+                    logger.info(f"  Image match: {img.label} (score={score:.3f})")
+                matches = [img for img, _ in ranked]
+            else:
+                # Images stored before label embeddings existed (run scripts/backfill_image_embeddings.py)
+                matches = image_index.match(question, category, limit=5)
                 
                 # If no specific match, return first image from category
-                if not images and category_images:
-                    img = category_images[0]
-                    images.append({
-                        "url": image_storage.get_image_url(img.relative_path),
-                        "label": img.label,
-                        "description": img.description or "",
-                        "category": img.category
-                    })
+                if not matches and settings.IMAGE_MATCH_FALLBACK:
+                    matches = image_index.by_category(category)[:1]
+            
+            images = [
+                {
+                    "url": image_storage.get_image_url(img.relative_path),
+                    "thumbnail_url": image_storage.get_image_url(img.relative_path, width=CHAT_IMAGE_WIDTH),
+                    "label": img.label,
+                    "description": img.description or "",
+                    "category": img.category
+                }
+                for img in matches
+            ]
             
             return images
             
@@ -292,9 +284,7 @@ class RAGChatService:
         self,
         text: str,
         metadata: Dict[str, Any],
-        namespace: str = "default",
-        chunk_size: int = 1000,
-        chunk_overlap: int = 200
+        namespace: str = "default"
     ) -> List[str]:
         """
         Index a document into vector store (with chunking)
@@ -302,17 +292,15 @@ class RAGChatService:
         Args:
             text: Document text
             metadata: Metadata to attach
-            namespace: Pinecone namespace
-            chunk_size: Size of text chunks
-            chunk_overlap: Overlap between chunks
+            namespace: Pinecone namespace (also selects chunk sizing)
         
         Returns:
             List of document IDs
         """
-        from app.rag.embeddings import text_chunker
+        from app.rag.chunker import text_chunker
         
         # Chunk text
-        chunks = text_chunker.chunk_text(text, chunk_size, chunk_overlap)
+        chunks = text_chunker.chunk_text(text, namespace=namespace)
         
         # Prepare metadata for each chunk
         metadatas = []
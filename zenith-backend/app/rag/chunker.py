@@ -0,0 +1,341 @@
+"""
+Structure-aware Text Chunker
+Single chunking engine shared by every ingestion path (PDF uploads, admin text, RAG indexing)
+
+Chunks are measured in embedding-model (mpnet) tokens rather than characters and are built
+from structural blocks - headings, list items, table rows, paragraphs and "Page N —" markers -
+so a chunk never cuts a word, a list or a table row in half.
+"""
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+import logging
+import re
+
+from pydantic import BaseModel, Field
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Block kinds produced by the parser
+HEADING = "heading"
+PAGE = "page"
+LIST_ITEM = "list_item"
+TABLE_ROW = "table_row"
+PARAGRAPH = "paragraph"
+
+_PAGE_MARKER = re.compile(r"^(?:-{2,}\s*)?Page\s+(\d+)\s*(?:—|-{2,}|–)(.*)$", re.IGNORECASE)
+_MARKDOWN_HEADING = re.compile(r"^#{1,6}\s+\S")
+_LIST_ITEM = re.compile(r"^(?:[-*•▪●◦]|\d{1,3}[.)]|[a-zA-Z][.)])\s+\S")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(])")
+
+
+class ChunkingConfig(BaseModel):
+    """Chunk sizing for one namespace (all sizes in embedding tokens)"""
+    max_tokens: int = Field(256, gt=16, description="Upper bound per chunk (mpnet truncates at 384)")
+    overlap_tokens: int = Field(32, ge=0, description="Trailing context repeated at the start of the next chunk")
+    min_tokens: int = Field(24, ge=0, description="Chunks smaller than this are merged into the next one")
+
+
+class Block(NamedTuple):
+    """A structural unit of the input text"""
+    kind: str
+    text: str
+    page: Optional[int]
+
+
+class Chunk(NamedTuple):
+    """A chunk ready for embedding"""
+    text: str
+    tokens: int
+    page: Optional[int]
+    heading: Optional[str]
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield lines one at a time without materialising a list of all lines"""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find("\n", start)
+        if end == -1:
+            end = length
+        yield text[start:end].rstrip("\r")
+        start = end + 1
+
+
+def _is_heading(line: str) -> bool:
+    """Heuristic heading detection for PDF-extracted and markdown text"""
+    if _MARKDOWN_HEADING.match(line):
+        return True
+    if len(line) > 80 or line.endswith((".", ",", ";")):
+        return False
+    letters = [c for c in line if c.isalpha()]
+    # Short ALL-CAPS lines ("ABOUT MLRIT", "PLACEMENT STATISTICS")
+    return len(letters) >= 3 and all(c.isupper() for c in letters)
+
+
+def _is_table_row(line: str) -> bool:
+    """Pipe tables (markdown) or tab-separated rows with at least two cells"""
+    return line.count("|") >= 2 or line.count("\t") >= 1
+
+
+def iter_blocks(text: str) -> Iterator[Block]:
+    """
+    Parse text into structural blocks in a single pass
+    
+    Consecutive plain lines are joined into one paragraph; blank lines end a paragraph.
+    """
+    page: Optional[int] = None
+    paragraph: List[str] = []
+    
+    def flush_paragraph():
+        if paragraph:
+            block = Block(PARAGRAPH, " ".join(paragraph), page)
+            paragraph.clear()
+            return block
+        return None
+    
+    for raw in _iter_lines(text):
+        line = raw.strip()
+        
+        if not line:
+            block = flush_paragraph()
+            if block:
+                yield block
+            continue
+        
+        page_match = _PAGE_MARKER.match(line)
+        if page_match:
+            block = flush_paragraph()
+            if block:
+                yield block
+            page = int(page_match.group(1))
+            title = page_match.group(2).strip(" -—–")
+            yield Block(PAGE, title, page)
+            continue
+        
+        if _LIST_ITEM.match(line):
+            kind = LIST_ITEM
+        elif _is_table_row(line):
+            kind = TABLE_ROW
+        elif _is_heading(line):
+            kind = HEADING
+        else:
+            paragraph.append(line)
+            continue
+        
+        block = flush_paragraph()
+        if block:
+            yield block
+        yield Block(kind, line.lstrip("#").strip() if kind == HEADING else line, page)
+    
+    block = flush_paragraph()
+    if block:
+        yield block
+
+
+class TextChunker:
+    """Token-aware, structure-aware chunker with per-namespace configuration"""
+    
+    def __init__(
+        self,
+        default_config: Optional[ChunkingConfig] = None,
+        namespace_configs: Optional[Dict[str, ChunkingConfig]] = None,
+        token_counter: Optional[Callable[[str], int]] = None
+    ):
+        """
+        Initialize chunker
+        
+        Args:
+            default_config: Sizing used when a namespace has no override
+            namespace_configs: Per-namespace sizing overrides
+            token_counter: Function returning the token count of a string
+                (defaults to the embedding model's tokenizer, loaded lazily)
+        """
+        self.default_config = default_config or ChunkingConfig(
+            max_tokens=settings.CHUNK_MAX_TOKENS,
+            overlap_tokens=settings.CHUNK_OVERLAP_TOKENS
+        )
+        self.namespace_configs = namespace_configs
+        if self.namespace_configs is None:
+            self.namespace_configs = {
+                ns: ChunkingConfig(max_tokens=max_tokens, overlap_tokens=overlap)
+                for ns, (max_tokens, overlap) in settings.chunk_namespace_overrides.items()
+            }
+        self._token_counter = token_counter
+
+    def config_for(self, namespace: Optional[str] = None) -> ChunkingConfig:
+        """Get chunk sizing for a namespace"""
+        if namespace and namespace in self.namespace_configs:
+            return self.namespace_configs[namespace]
+        return self.default_config
+
+    def count_tokens(self, text: str) -> int:
+        """Count embedding-model tokens in text"""
+        if self._token_counter is None:
+            self._token_counter = self._load_token_counter()
+        return self._token_counter(text)
+
+    @staticmethod
+    def _load_token_counter() -> Callable[[str], int]:
+        """Use the mpnet tokenizer from the loaded embedding model"""
+        try:
+            from app.rag.embeddings import embedding_service
+            tokenizer = embedding_service.model.tokenizer
+            return lambda text: len(tokenizer.encode(text, add_special_tokens=False))
+        except Exception as e:
+            # Roughly 4 characters per token for English text
+            logger.warning(f"⚠️ Tokenizer unavailable, estimating token counts: {e}")
+            return lambda text: max(1, len(text) // 4)
+
+    def iter_chunks(self, text: str, namespace: Optional[str] = None) -> Iterator[Chunk]:
+        """
+        Stream chunks for text
+        
+        Args:
+            text: Text to chunk
+            namespace: Namespace whose chunk sizing applies
+        
+        Yields:
+            Chunk tuples in document order
+        """
+        config = self.config_for(namespace)
+        budget = config.max_tokens
+        buffer = _ChunkBuffer()
+        heading: Optional[str] = None
+        table_header: Optional[str] = None
+        
+        for block in iter_blocks(text):
+            if block.kind in (HEADING, PAGE):
+                # New section: close the current chunk and don't carry overlap across it
+                if buffer.fresh and buffer.tokens >= config.min_tokens:
+                    yield buffer.take(heading, 0)
+                elif not buffer.fresh:
+                    buffer.clear()
+                table_header = None
+                if block.kind == PAGE and not block.text:
+                    if not buffer.fresh:
+                        buffer.page = block.page
+                    continue
+                heading = block.text
+                buffer.add(block.text, self.count_tokens(block.text), block.page)
+                continue
+            
+            if block.kind != TABLE_ROW:
+                table_header = None
+            elif table_header is None:
+                table_header = block.text
+            
+            for piece in self._fit(block.text, budget):
+                size = self.count_tokens(piece)
+                if buffer.fresh and buffer.tokens + size > budget:
+                    yield buffer.take(heading, config.overlap_tokens)
+                    # Repeat the table header so split tables stay readable
+                    if block.kind == TABLE_ROW and piece != table_header:
+                        buffer.clear()
+                        buffer.add(table_header, self.count_tokens(table_header), block.page, fresh=False)
+                    buffer.trim_to(budget - size)
+                buffer.add(piece, size, block.page)
+        
+        if buffer.fresh:
+            yield buffer.take(heading, 0)
+
+    def chunk_text(self, text: str, namespace: Optional[str] = None) -> List[str]:
+        """
+        Split text into chunks
+        
+        Args:
+            text: Text to chunk
+            namespace: Namespace whose chunk sizing applies
+        
+        Returns:
+            List of chunk texts
+        """
+        if not text or not text.strip():
+            return []
+        chunks = [chunk.text for chunk in self.iter_chunks(text, namespace)]
+        logger.info(f"📝 Chunked text: {len(text)} chars → {len(chunks)} chunks (namespace: {namespace or 'default'})")
+        return chunks
+
+    def _fit(self, text: str, budget: int) -> Iterator[str]:
+        """Split a block that exceeds the token budget by sentence, then by word"""
+        if self.count_tokens(text) <= budget:
+            yield text
+            return
+        
+        sentences = _SENTENCE_END.split(text)
+        if len(sentences) > 1:
+            for sentence in sentences:
+                yield from self._fit(sentence, budget)
+            return
+        
+        # A single over-long "sentence" (tables flattened by PDF extraction, URLs, ...)
+        words = text.split()
+        start = 0
+        while start < len(words):
+            # Grow a window of words until it no longer fits
+            end = min(len(words), start + budget)
+            while end > start + 1 and self.count_tokens(" ".join(words[start:end])) > budget:
+                end = start + max(1, (end - start) * 3 // 4)
+            yield " ".join(words[start:end])
+            start = end
+
+
+class _ChunkBuffer:
+    """Accumulates block texts for the chunk being built"""
+    
+    __slots__ = ("parts", "sizes", "tokens", "fresh", "page")
+    
+    def __init__(self):
+        self.parts: List[str] = []
+        self.sizes: List[int] = []
+        self.tokens = 0
+        self.fresh = 0  # parts added since the last chunk (overlap parts don't count)
+        self.page: Optional[int] = None
+
+    def add(self, text: str, size: int, page: Optional[int], fresh: bool = True):
+        if fresh and not self.fresh:
+            self.page = page if page is not None else self.page
+        self.parts.append(text)
+        self.sizes.append(size)
+        self.tokens += size
+        if fresh:
+            self.fresh += 1
+
+    def take(self, heading: Optional[str], overlap_tokens: int) -> Chunk:
+        """Emit the buffered chunk, keeping whole trailing parts that fit in the overlap budget"""
+        chunk = Chunk("\n".join(self.parts), self.tokens, self.page, heading)
+        
+        keep = 0
+        carried = 0
+        for size in reversed(self.sizes):
+            if carried + size > overlap_tokens or keep == len(self.sizes) - 1:
+                break
+            carried += size
+            keep += 1
+        
+        if keep:
+            self.parts = self.parts[-keep:]
+            self.sizes = self.sizes[-keep:]
+        else:
+            self.parts = []
+            self.sizes = []
+        self.tokens = carried
+        self.fresh = 0
+        return chunk
+
+    def trim_to(self, limit: int):
+        """Drop leading overlap until the buffer fits within limit tokens"""
+        while self.parts and self.tokens > limit:
+            self.tokens -= self.sizes.pop(0)
+            self.parts.pop(0)
+
+    def clear(self):
+        self.parts = []
+        self.sizes = []
+        self.tokens = 0
+
+
+# Global instance
+text_chunker = TextChunker()
@@ -2,11 +2,15 @@
 RAG (Retrieval-Augmented Generation) Pipeline
 Handles embeddings using sentence-transformers (no LM Studio needed)
 """
-from typing import List, Dict, Any, Optional
-import uuid
+from typing import List, Dict, Any, Optional, Tuple
 from sentence_transformers import SentenceTransformer
 from app.config import settings
 from app.database import pinecone_db, Namespaces
+from app.rag.chunker import text_chunker  # Re-exported: shared chunker for all ingestion paths
+from app.rag.manifest import vector_manifest
+from app.utils import text_hash, chunk_id
+import asyncio
+import heapq
 import logging
 
 logger = logging.getLogger(__name__)
@@ -74,34 +78,18 @@ class VectorStore:
             text: Text to embed and store
             metadata: Metadata to associate with vector
             namespace: Pinecone namespace
-            doc_id: Optional document ID (generates UUID if not provided)
+            doc_id: Optional document ID (derived from source + text hash if not provided)
         
         Returns:
             Document ID
         """
-        try:
-            # Generate embedding
-            embedding = self.embedding_service.generate_embedding(text)
-            
-            # Generate ID if not provided
-            if not doc_id:
-                doc_id = str(uuid.uuid4())
-            
-            # Add text to metadata
-            metadata["text"] = text
-            
-            # Upsert to Pinecone
-            self.index.upsert(
-                vectors=[(doc_id, embedding, metadata)],
-                namespace=namespace
-            )
-            
-            logger.info(f"✅ Upserted vector {doc_id} to namespace {namespace}")
-            return doc_id
-            
-        except Exception as e:
-            logger.error(f"Error upserting vector: {str(e)}")
-            raise
+        doc_ids = await self.upsert_texts(
+            texts=[text],
+            metadatas=[metadata],
+            namespace=namespace,
+            doc_ids=[doc_id] if doc_id else None
+        )
+        return doc_ids[0]
     
     async def upsert_texts(
         self,
@@ -117,42 +105,102 @@ class VectorStore:
             texts: List of texts to embed and store
             metadatas: List of metadata dicts
             namespace: Pinecone namespace
-            doc_ids: Optional list of document IDs
+            doc_ids: Optional list of document IDs (derived from source + text hash if not provided)
         
         Returns:
             List of document IDs
         """
+        result = await self.upsert_chunks(texts, metadatas, namespace=namespace, doc_ids=doc_ids)
+        return result["ids"]
+    
+    async def upsert_chunks(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        namespace: str = "default",
+        doc_ids: Optional[List[str]] = None,
+        skip_existing: bool = True,
+        batch_size: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Idempotently store chunks as vectors
+        
+        Vector IDs are derived from the chunk source and text hash, so indexing the same
+        text twice maps to the same vector. With skip_existing, vectors whose ID already
+        exists with the same text hash are neither re-embedded nor re-upserted.
+        
+        Args:
+            texts: Chunk texts
+            metadatas: Metadata dict per chunk ("source" selects the ID prefix)
+            namespace: Pinecone namespace
+            doc_ids: Optional explicit IDs
+            skip_existing: Skip chunks already stored with identical text
+            batch_size: Chunks per fetch / embedding / upsert call
+        
+        Returns:
+            Dict with ids (all chunk IDs, in order), upserted and skipped counts
+        """
         try:
-            # Generate embeddings
-            embeddings = self.embedding_service.generate_embeddings(texts)
-            
-            # Generate IDs if not provided
+            hashes = [text_hash(text) for text in texts]
             if not doc_ids:
-                doc_ids = [str(uuid.uuid4()) for _ in texts]
-            
-            # Add texts to metadata
-            for i, text in enumerate(texts):
-                metadatas[i]["text"] = text
-            
-            # Prepare vectors for upsert
-            vectors = [
-                (doc_ids[i], embeddings[i], metadatas[i])
-                for i in range(len(texts))
-            ]
+                doc_ids = [
+                    chunk_id(str(meta.get("source") or namespace or "default"), h)
+                    for meta, h in zip(metadatas, hashes)
+                ]
             
-            # Upsert to Pinecone in batches
-            batch_size = 100
-            for i in range(0, len(vectors), batch_size):
-                batch = vectors[i:i + batch_size]
-                self.index.upsert(vectors=batch, namespace=namespace)
+            upserted = 0
+            skipped = 0
+            for start in range(0, len(texts), batch_size):
+                batch = range(start, min(start + batch_size, len(texts)))
+                
+                pending = list(batch)
+                if skip_existing:
+                    existing = await asyncio.to_thread(
+                        self._fetch_text_hashes, [doc_ids[i] for i in batch], namespace
+                    )
+                    pending = [i for i in batch if existing.get(doc_ids[i]) != hashes[i]]
+                    skipped += len(batch) - len(pending)
+                
+                if not pending:
+                    continue
+                
+                embeddings = await asyncio.to_thread(
+                    self.embedding_service.generate_embeddings, [texts[i] for i in pending]
+                )
+                vectors = [
+                    (doc_ids[i], embedding, {**metadatas[i], "text": texts[i], "text_hash": hashes[i]})
+                    for i, embedding in zip(pending, embeddings)
+                ]
+                
+                await self.upsert_vectors(vectors, namespace=namespace)
+                upserted += len(vectors)
             
-            logger.info(f"✅ Upserted {len(vectors)} vectors to namespace {namespace}")
-            return doc_ids
+            logger.info(f"✅ Upserted {upserted} vectors to namespace {namespace} ({skipped} unchanged, skipped)")
+            return {"ids": doc_ids, "upserted": upserted, "skipped": skipped}
             
         except Exception as e:
             logger.error(f"Error upserting vectors: {str(e)}")
             raise
     
+    async def upsert_vectors(self, vectors: List[Tuple[str, List[float], Dict[str, Any]]], namespace: str = "default"):
+        """
+        Upsert pre-embedded vectors and record them in the vector manifest
+        
+        Args:
+            vectors: (vector_id, embedding, metadata) tuples
+            namespace: Pinecone namespace
+        """
+        await asyncio.to_thread(self.index.upsert, vectors=vectors, namespace=namespace)
+        await vector_manifest.record(vectors, namespace)
+    
+    def _fetch_text_hashes(self, ids: List[str], namespace: str) -> Dict[str, Optional[str]]:
+        """Get the stored text hash for each existing vector ID"""
+        response = self.index.fetch(ids=ids, namespace=namespace)
+        return {
+            vid: (vec.metadata or {}).get("text_hash")
+            for vid, vec in (response.vectors or {}).items()
+        }
+    
     async def search(
         self,
         query: str,
@@ -176,30 +224,7 @@ class VectorStore:
             # Generate query embedding
             query_embedding = self.embedding_service.generate_embedding(query)
             
-            # Search Pinecone
-            results = self.index.query(
-                vector=query_embedding,
-                namespace=namespace,
-                top_k=top_k,
-                include_metadata=True,
-                filter=filter_metadata
-            )
-            
-            # Format results
-            formatted_results = []
-            for match in results.matches:
-                text_content = match.metadata.get("text", "")
-                formatted_results.append({
-                    "id": match.id,
-                    "score": match.score,
-                    "text": text_content,
-                    "metadata": {k: v for k, v in match.metadata.items() if k != "text"}
-                })
-                
-                # Debug logging
-                if formatted_results and len(formatted_results) <= 2:  # Log first 2 matches
-                    logger.info(f"  Match {len(formatted_results)}: id={match.id}, score={match.score:.3f}, text_len={len(text_content)}, has_metadata={bool(match.metadata)}")
-            
+            formatted_results = self.search_by_vector(query_embedding, namespace, top_k, filter_metadata)
             logger.info(f"Found {len(formatted_results)} results in namespace {namespace}")
             return formatted_results
             
@@ -207,10 +232,112 @@ class VectorStore:
             logger.error(f"Error searching vectors: {str(e)}")
             raise
     
+    def search_by_vector(
+        self,
+        query_embedding: List[float],
+        namespace: str = "default",
+        top_k: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search one namespace with a precomputed query embedding (blocking Pinecone call)
+        
+        Args:
+            query_embedding: Query vector
+            namespace: Pinecone namespace to search
+            top_k: Number of results to return
+            filter_metadata: Optional metadata filter
+        
+        Returns:
+            List of matching results with text and metadata
+        """
+        # Search Pinecone
+        results = self.index.query(
+            vector=query_embedding,
+            namespace=namespace,
+            top_k=top_k,
+            include_metadata=True,
+            filter=filter_metadata
+        )
+        
+        # Format results
+        formatted_results = []
+        for match in results.matches:
+            metadata = match.metadata or {}
+            text_content = metadata.get("text", "")
+            formatted_results.append({
+                "id": match.id,
+                "score": match.score,
+                "text": text_content,
+                "metadata": {k: v for k, v in metadata.items() if k != "text"}
+            })
+            
+            # Debug logging
+            if len(formatted_results) <= 2:  # Log first 2 matches
+                logger.debug(f"  Match {len(formatted_results)}: id={match.id}, score={match.score:.3f}, text_len={len(text_content)}")
+        
+        return formatted_results
+    
+    async def search_namespaces(
+        self,
+        query: str,
+        namespaces: List[str],
+        top_k: int = 20,
+        per_namespace_top_k: int = 10,
+        timeout: Optional[float] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None
+    ) -> Tuple[List[Dict[str, Any]], List[str], int]:
+        """
+        Search several namespaces concurrently with a single query embedding
+        
+        Args:
+            query: Query text (embedded once)
+            namespaces: Namespaces to search
+            top_k: Number of merged results to return
+            per_namespace_top_k: Results requested from each namespace
+            timeout: Seconds to wait for each namespace (slower namespaces are skipped)
+            filter_metadata: Optional metadata filter
+            query_embedding: Precomputed embedding of query (skips the model call)
+        
+        Returns:
+            (results sorted by score with "namespace" set, namespaces that timed out or failed,
+            number of candidates found before the top_k cut)
+        """
+        if query_embedding is None:
+            query_embedding = await asyncio.to_thread(self.embedding_service.generate_embedding, query)
+        
+        async def query_namespace(ns: str) -> List[Dict[str, Any]]:
+            results = await asyncio.wait_for(
+                asyncio.to_thread(self.search_by_vector, query_embedding, ns, per_namespace_top_k, filter_metadata),
+                timeout=timeout
+            )
+            for result in results:
+                result["namespace"] = ns
+            return results
+        
+        outcomes = await asyncio.gather(*(query_namespace(ns) for ns in namespaces), return_exceptions=True)
+        
+        failed = []
+        candidates = []
+        for ns, outcome in zip(namespaces, outcomes):
+            if isinstance(outcome, BaseException):
+                reason = "timed out" if isinstance(outcome, asyncio.TimeoutError) else str(outcome)
+                logger.warning(f"⚠️ Search in namespace '{ns or 'default'}' skipped: {reason}")
+                failed.append(ns)
+            else:
+                candidates.extend(outcome)
+        
+        # Bounded merge: only the best top_k survive
+        top = heapq.nlargest(top_k, candidates, key=lambda r: r.get("score") or 0)
+        logger.info(f"Found {len(candidates)} results across {len(namespaces) - len(failed)} namespaces, returning top {len(top)}")
+        return top, failed, len(candidates)
+    
     async def delete(self, doc_ids: List[str], namespace: str = "default"):
         """Delete vectors by IDs"""
         try:
-            self.index.delete(ids=doc_ids, namespace=namespace)
+            await asyncio.to_thread(self.index.delete, ids=doc_ids, namespace=namespace)
+            await vector_manifest.remove(doc_ids, namespace)
             logger.info(f"Deleted {len(doc_ids)} vectors from namespace {namespace}")
         except Exception as e:
             logger.error(f"Error deleting vectors: {str(e)}")
@@ -219,46 +346,14 @@ class VectorStore:
     async def delete_namespace(self, namespace: str):
         """Delete all vectors in a namespace"""
         try:
-            self.index.delete(delete_all=True, namespace=namespace)
+            await asyncio.to_thread(self.index.delete, delete_all=True, namespace=namespace)
+            await vector_manifest.clear(namespace)
             logger.info(f"Deleted all vectors from namespace {namespace}")
         except Exception as e:
             logger.error(f"Error deleting namespace: {str(e)}")
             raise
 
 
-class TextChunker:
-    """Service for chunking text into smaller pieces"""
-    
-    @staticmethod
-    def chunk_text(
-        text: str,
-        chunk_size: int = 1000,
-        chunk_overlap: int = 200
-    ) -> List[str]:
-        """
-        Split text into overlapping chunks
-        
-        Args:
-            text: Text to chunk
-            chunk_size: Size of each chunk
-            chunk_overlap: Overlap between chunks
-        
-        Returns:
-            List of text chunks
-        """
-        chunks = []
-        start = 0
-        
-        while start < len(text):
-            end = start + chunk_size
-            chunk = text[start:end]
-            chunks.append(chunk.strip())
-            start += chunk_size - chunk_overlap
-        
-        return chunks
-
-
 # Global instances
 embedding_service = EmbeddingService()
 vector_store = VectorStore()
-text_chunker = TextChunker()
@@ -6,8 +6,8 @@ from typing import List, Dict, Optional
 import logging
 from datetime import datetime
 
-from app.rag.embeddings import embedding_service
-from app.database import pinecone_db
+from app.rag.embeddings import vector_store
+from app.rag.chunker import TextChunker, text_chunker
 
 logger = logging.getLogger(__name__)
 
@@ -15,81 +15,27 @@ logger = logging.getLogger(__name__)
 class ContentIndexer:
     """Service for indexing text content to Pinecone vector database"""
     
-    def __init__(self, chunk_size: int = 300, chunk_overlap: int = 50):
+    def __init__(self, chunker: TextChunker = text_chunker):
         """
         Initialize content indexer
         
         Args:
-            chunk_size: Number of characters per chunk (reduced to 300 for better granularity)
-            chunk_overlap: Overlap between chunks
+            chunker: Shared token-aware chunker (sizing is configured per namespace)
         """
-        self.chunk_size = chunk_size
-        self.chunk_overlap = chunk_overlap
+        self.chunker = chunker
     
-    def chunk_text(self, text: str) -> List[str]:
+    def chunk_text(self, text: str, namespace: Optional[str] = None) -> List[str]:
         """
-        Split text into semantic chunks (smaller, focused chunks)
+        Split text into semantic chunks
         
         Args:
             text: Text to chunk
+            namespace: Namespace whose chunk sizing applies
             
         Returns:
             List of text chunks
         """
-        if not text or not text.strip():
-            return []
-        
-        chunks = []
-        text = text.strip()
-        
-        # Split by sections (Page markers, headers, or double newlines)
-        sections = []
-        
-        # Try splitting by "Page X —" markers first
-        if "Page " in text and "—" in text:
-            import re
-            parts = re.split(r'Page \d+ —[^\n]*\n', text)
-            sections = [p.strip() for p in parts if p.strip()]
-        else:
-            # Split by double newlines (paragraphs)
-            sections = [p.strip() for p in text.split('\n\n') if p.strip()]
-        
-        # Create smaller semantic chunks
-        current_chunk = ""
-        
-        for section in sections:
-            section = section.strip()
-            if not section:
-                continue
-            
-            # If section itself is too long, split it further
-            if len(section) > self.chunk_size:
-                # Split long sections by sentences
-                sentences = section.replace('. ', '.|').split('|')
-                for sent in sentences:
-                    sent = sent.strip()
-                    if not sent:
-                        continue
-                    
-                    if len(current_chunk) + len(sent) > self.chunk_size and current_chunk:
-                        chunks.append(current_chunk.strip())
-                        current_chunk = sent
-                    else:
-                        current_chunk = current_chunk + " " + sent if current_chunk else sent
-            else:
-                # Add section to current chunk
-                if len(current_chunk) + len(section) > self.chunk_size and current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = section
-                else:
-                    current_chunk = current_chunk + "\n\n" + section if current_chunk else section
-        
-        # Add remaining chunk
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-        
-        logger.info(f"📝 Chunked text: {len(text)} chars → {len(chunks)} chunks (semantic chunks)")
-        return chunks
+        return self.chunker.chunk_text(text, namespace=namespace)
     
     async def index_text(
         self,
@@ -123,55 +69,39 @@ class ContentIndexer:
             logger.info(f"🚀 Indexing text to namespace '{namespace}' | Category: {category}")
             
             # Chunk text
-            chunks = self.chunk_text(text)
+            chunks = self.chunk_text(text, namespace=namespace)
             
             if not chunks:
                 return {"success": False, "message": "No chunks created from text"}
             
-            # Generate embeddings for each chunk
-            vectors = []
-            
-            for idx, chunk in enumerate(chunks):
-                try:
-                    # Get embedding
-                    embedding = embedding_service.generate_embedding(chunk)
-                    
-                    # Create vector ID
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    vector_id = f"{category}_{timestamp}_{idx}"
-                    
-                    # Prepare metadata for this chunk
-                    chunk_meta = {
-                        **meta,
-                        "text": chunk,
-                        "chunk_index": idx,
-                        "total_chunks": len(chunks),
-                        "indexed_at": datetime.now().isoformat(),
-                        "namespace": namespace
-                    }
-                    
-                    vectors.append({
-                        "id": vector_id,
-                        "values": embedding,
-                        "metadata": chunk_meta
-                    })
-                    
-                except Exception as e:
-                    logger.error(f"❌ Error creating embedding for chunk {idx}: {e}")
-                    continue
-            
-            if not vectors:
-                return {"success": False, "message": "Failed to create embeddings"}
-            
-            # Upsert to Pinecone
-            pinecone_db.index.upsert(vectors=vectors, namespace=namespace)
-            
-            logger.info(f"✅ Indexed {len(vectors)} vectors to namespace '{namespace}'")
+            # Prepare metadata for each chunk
+            indexed_at = datetime.now().isoformat()
+            metadatas = [
+                {
+                    **meta,
+                    "chunk_index": idx,
+                    "total_chunks": len(chunks),
+                    "indexed_at": indexed_at,
+                    "namespace": namespace
+                }
+                for idx in range(len(chunks))
+            ]
+            
+            # Deterministic IDs (source + chunk hash): unchanged chunks are skipped, not duplicated
+            result = await vector_store.upsert_chunks(chunks, metadatas, namespace=namespace)
+            
+            logger.info(
+                f"✅ Indexed {len(chunks)} chunks to namespace '{namespace}' "
+                f"({result['upserted']} new, {result['skipped']} unchanged)"
+            )
             
             return {
                 "success": True,
-                "message": f"Indexed {len(vectors)} text chunks",
-                "chunks": len(vectors),
+                "message": f"Indexed {len(chunks)} text chunks",
+                "chunks": len(chunks),
+                "upserted": result["upserted"],
+                "skipped": result["skipped"],
+                "vector_ids": result["ids"],
                 "namespace": namespace,
                 "category": category
             }
@@ -0,0 +1,216 @@
+"""
+Vector Manifest - Local record of every vector stored in Pinecone
+Kept in sync whenever VectorStore upserts or deletes, so content listings can page through
+MongoDB instead of enumerating Pinecone with top_k=10000 random-vector queries
+"""
+from typing import List, Dict, Optional, Any, Tuple, Sequence
+from datetime import datetime
+import asyncio
+import base64
+import json
+import logging
+
+from pymongo import ASCENDING, UpdateOne
+
+from app.database import mongodb, Collections
+
+logger = logging.getLogger(__name__)
+
+
+def encode_cursor(namespace: str, vector_id: str) -> str:
+    """Opaque pagination cursor for the last item of a page"""
+    raw = json.dumps([namespace, vector_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor produced by encode_cursor (raises ValueError if malformed)"""
+    try:
+        namespace, vector_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return str(namespace), str(vector_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+class VectorManifest:
+    """MongoDB-backed manifest of vector IDs and metadata, keyed by (namespace, vector_id)"""
+
+    def __init__(self, collection_name: str = Collections.VECTOR_MANIFEST):
+        self.collection_name = collection_name
+
+    @property
+    def collection(self):
+        """Get manifest collection (None when MongoDB is unavailable)"""
+        db = mongodb.get_database()
+        if db is None:
+            return None
+        return db[self.collection_name]
+
+    async def ensure_indexes(self):
+        """Create the unique key and the category filter index (see COLLECTION_INDEXES)"""
+        if self.collection is None:
+            return
+        await mongodb.ensure_indexes([self.collection_name])
+
+    async def record(self, vectors: Sequence[Tuple[str, Any, Dict[str, Any]]], namespace: str):
+        """
+        Record upserted vectors
+
+        Args:
+            vectors: (vector_id, embedding, metadata) tuples as sent to Pinecone
+            namespace: Pinecone namespace
+        """
+        if self.collection is None or not vectors:
+            return
+
+        now = datetime.utcnow()
+        operations = []
+        for vector_id, _, metadata in vectors:
+            metadata = metadata or {}
+            text = metadata.get("text", "")
+            operations.append(UpdateOne(
+                {"namespace": namespace, "vector_id": vector_id},
+                {
+                    "$set": {
+                        "title": metadata.get("title") or metadata.get("category") or metadata.get("source") or "Unknown",
+                        "category": metadata.get("category", ""),
+                        "source": metadata.get("source", ""),
+                        "document_id": metadata.get("document_id"),
+                        "text": text,
+                        "text_length": len(text),
+                        "metadata": {k: v for k, v in metadata.items() if k != "text"},
+                        "updated_at": now
+                    },
+                    "$setOnInsert": {"created_at": now}
+                },
+                upsert=True
+            ))
+
+        try:
+            await self.collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            # Pinecone already has the vectors; a stale manifest only affects listings
+            logger.warning(f"⚠️ Vector manifest not updated for {len(operations)} vectors: {e}")
+
+    async def remove(self, vector_ids: List[str], namespace: str):
+        """Forget deleted vectors"""
+        if self.collection is None or not vector_ids:
+            return
+        try:
+            await self.collection.delete_many({"namespace": namespace, "vector_id": {"$in": vector_ids}})
+        except Exception as e:
+            logger.warning(f"⚠️ Vector manifest not updated for {len(vector_ids)} deleted vectors: {e}")
+
+    async def clear(self, namespace: Optional[str] = None):
+        """Forget every vector in a namespace (or all namespaces)"""
+        if self.collection is None:
+            return
+        try:
+            await self.collection.delete_many({} if namespace is None else {"namespace": namespace})
+        except Exception as e:
+            logger.warning(f"⚠️ Vector manifest not cleared: {e}")
+
+    async def forget(self, removed: Dict[str, Optional[List[str]]]):
+        """
+        Forget vectors deleted outside VectorStore
+
+        Args:
+            removed: Namespace -> deleted vector IDs (None when the whole namespace was cleared)
+        """
+        for namespace, vector_ids in removed.items():
+            if vector_ids is None:
+                await self.clear(namespace)
+            else:
+                await self.remove(vector_ids, namespace)
+
+    async def page(
+        self,
+        namespace: Optional[str] = None,
+        category: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of manifest entries ordered by (namespace, vector_id)
+
+        Args:
+            namespace: Only vectors in this namespace
+            category: Only vectors with this metadata category
+            cursor: Cursor returned with the previous page
+            limit: Page size
+
+        Returns:
+            (entries, next_cursor) - next_cursor is None on the last page
+        """
+        if self.collection is None:
+            return [], None
+
+        query: Dict[str, Any] = {}
+        if namespace is not None:
+            query["namespace"] = namespace
+        if category:
+            query["category"] = category
+        if cursor:
+            after_ns, after_id = decode_cursor(cursor)
+            query["$or"] = [
+                {"namespace": {"$gt": after_ns}},
+                {"namespace": after_ns, "vector_id": {"$gt": after_id}}
+            ]
+
+        # Fetch one extra entry to know whether another page exists
+        entries = await self.collection.find(query, {"_id": 0}).sort(
+            [("namespace", ASCENDING), ("vector_id", ASCENDING)]
+        ).limit(limit + 1).to_list(length=limit + 1)
+
+        next_cursor = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            next_cursor = encode_cursor(entries[-1]["namespace"], entries[-1]["vector_id"])
+        return entries, next_cursor
+
+    async def get(self, vector_id: str, namespace: str = "") -> Optional[Dict[str, Any]]:
+        """One manifest entry, or None"""
+        if self.collection is None:
+            return None
+        return await self.collection.find_one({"namespace": namespace, "vector_id": vector_id}, {"_id": 0})
+
+    async def count(self, namespace: Optional[str] = None, category: Optional[str] = None) -> int:
+        """Count manifest entries matching the filters"""
+        if self.collection is None:
+            return 0
+        query: Dict[str, Any] = {}
+        if namespace is not None:
+            query["namespace"] = namespace
+        if category:
+            query["category"] = category
+        return await self.collection.count_documents(query)
+
+    async def namespaces(self) -> List[str]:
+        """Namespaces that currently hold vectors"""
+        if self.collection is None:
+            return []
+        return sorted(await self.collection.distinct("namespace"))
+
+
+# Global instance
+vector_manifest = VectorManifest()
+
+
+def forget_deleted(removed: Dict[str, Optional[List[str]]]) -> bool:
+    """
+    Blocking VectorManifest.forget for maintenance scripts that delete straight from Pinecone
+
+    Connects to MongoDB for the call. Returns False when MongoDB isn't reachable
+    (the manifest can then be reseeded with scripts/rebuild_vector_manifest.py).
+    """
+    async def run() -> bool:
+        await mongodb.connect()
+        try:
+            if vector_manifest.collection is None:
+                return False
+            await vector_manifest.forget(removed)
+            return True
+        finally:
+            await mongodb.disconnect()
+
+    return asyncio.run(run())
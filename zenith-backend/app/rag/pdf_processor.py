@@ -11,6 +11,8 @@ import io
 from PIL import Image
 import hashlib
 from datetime import datetime
+from app.services.image_variants import image_variants
+from app.services.image_service import image_storage
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +75,7 @@ class PDFProcessor:
         
         Args:
             pdf_path: Path to PDF file
-            category: Category folder to save images in
+            category: Category recorded for the images (files are stored by content hash)
             min_width: Minimum image width to extract (filters small icons)
             min_height: Minimum image height to extract
             
@@ -88,9 +90,10 @@ class PDFProcessor:
             
             logger.info(f"🖼️ Extracting images from PDF: {pdf_path} ({pdf_document.page_count} pages)")
             
-            # Create category subdirectory
-            category_dir = self.image_output_dir / category
-            category_dir.mkdir(parents=True, exist_ok=True)
+            # Variants are resized on a thread pool while extraction continues
+            # (one job per distinct file - repeated logos share it)
+            pending_variants = []
+            variant_jobs = {}
             
             for page_num in range(pdf_document.page_count):
                 page = pdf_document[page_num]
@@ -115,29 +118,38 @@ class PDFProcessor:
                             logger.debug(f"  Skipping small image: {width}x{height}px")
                             continue
                         
-                        # Generate unique filename
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        hash_suffix = hashlib.md5(image_bytes).hexdigest()[:8]
-                        filename = f"{category}_page{page_num+1}_img{img_index+1}_{timestamp}_{hash_suffix}.{image_ext}"
+                        # Save image under its content hash (identical bytes are stored once)
+                        content_hash = hashlib.sha256(image_bytes).hexdigest()
+                        image_path, created = image_storage.store_bytes(image_bytes, image_ext, sha256=content_hash)
+                        filename = image_path.name
                         
-                        # Save image
-                        image_path = category_dir / filename
-                        with open(image_path, "wb") as img_file:
-                            img_file.write(image_bytes)
-                        
-                        extracted_images.append({
+                        entry = {
                             "filename": filename,
                             "path": str(image_path),
-                            "relative_path": f"{category}/{filename}",
+                            "relative_path": image_storage.relative_path(image_path),
                             "page_num": page_num + 1,
                             "size": f"{width}x{height}",
                             "width": width,
                             "height": height,
                             "format": image_ext,
-                            "category": category
-                        })
+                            "category": category,
+                            "content_hash": content_hash,
+                            "size_bytes": len(image_bytes)
+                        }
+                        
+                        if created:
+                            variant_jobs[filename] = image_variants.submit(image_path)
+                        if filename in variant_jobs:
+                            pending_variants.append((len(extracted_images), variant_jobs[filename]))
+                        else:
+                            entry["variants"] = image_variants.existing(image_path, width, height)
                         
-                        logger.info(f"  ✅ Saved image: {filename} ({width}x{height}px)")
+                        extracted_images.append(entry)
+                        
+                        if created:
+                            logger.info(f"  ✅ Saved image: {filename} ({width}x{height}px)")
+                        else:
+                            logger.info(f"  ♻️ Image already stored: {filename} ({width}x{height}px)")
                     
                     except Exception as e:
                         logger.warning(f"  ⚠️ Could not extract image {img_index+1} from page {page_num+1}: {e}")
@@ -145,6 +157,13 @@ class PDFProcessor:
             
             pdf_document.close()
             
+            for position, future in pending_variants:
+                try:
+                    extracted_images[position]["variants"] = future.result()
+                except Exception as e:
+                    logger.warning(f"  ⚠️ Could not generate variants for {extracted_images[position]['filename']}: {e}")
+                    extracted_images[position]["variants"] = []
+            
             logger.info(f"✅ Extracted {len(extracted_images)} images from PDF")
             return extracted_images
             
@@ -160,6 +179,7 @@ class PDFProcessor:
     ) -> Dict:
         """
         Process PDF to extract both text and images
+        Blocks until every image variant is written - call it from a worker thread in async code
         
         Args:
             pdf_path: Path to PDF file
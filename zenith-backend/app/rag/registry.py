@@ -0,0 +1,290 @@
+"""
+Document Registry - Track ingested documents by content hash
+Lets re-uploads skip embedding entirely and changed documents re-index only the chunks that changed.
+Each record doubles as the document's vector manifest, so deletes go straight to Pinecone by ID,
+and as the uploaded-file catalog (stored path, size, page count, indexing status).
+"""
+from typing import List, Dict, Optional, Any, Tuple
+from datetime import datetime, timedelta
+import asyncio
+import logging
+import re
+
+from pymongo.errors import DuplicateKeyError
+
+from app.database import mongodb, Collections
+from app.utils import text_hash
+
+logger = logging.getLogger(__name__)
+
+# Document indexing status
+STATUS_UPLOADED = "uploaded"
+STATUS_INDEXING = "indexing"
+STATUS_INDEXED = "indexed"
+STATUS_PARTIAL = "partial"  # some chunks failed to embed - re-upload or reindex retries them
+STATUS_FAILED = "failed"
+
+# An upload's claim on its file hash is taken over after this long without progress (crashed worker)
+CLAIM_TIMEOUT = timedelta(minutes=30)
+
+# Fields returned by catalog listings (the chunk manifest can be large)
+CATALOG_PROJECTION = {"chunks": 0}
+
+
+class DocumentRegistry:
+    """MongoDB-backed registry of uploaded documents, keyed by file SHA-256 and per-chunk text hash"""
+    
+    def __init__(self, collection_name: str = Collections.DOCUMENTS):
+        self.collection_name = collection_name
+
+    @property
+    def collection(self):
+        """Get registry collection (None when MongoDB is unavailable)"""
+        db = mongodb.get_database()
+        if db is None:
+            return None
+        return db[self.collection_name]
+
+    async def ensure_indexes(self):
+        """Create the indexes used by hash lookups, version lookups and catalog listings (see COLLECTION_INDEXES)"""
+        if self.collection is None:
+            return
+        await mongodb.ensure_indexes([self.collection_name])
+
+    async def find_by_file_hash(self, file_hash: str, namespace: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a document with identical bytes already indexed into a namespace
+        
+        Args:
+            file_hash: SHA-256 of the uploaded file
+            namespace: Pinecone namespace
+        
+        Returns:
+            Registry record or None
+        """
+        if self.collection is None:
+            return None
+        return await self.collection.find_one({"file_hash": file_hash, "namespace": namespace})
+
+    async def claim(
+        self,
+        document_id: str,
+        file_hash: str,
+        namespace: str,
+        fields: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Reserve (file_hash, namespace) for an upload before embedding it
+        
+        The registry's unique (file_hash, namespace) index makes this atomic, so of two identical
+        uploads arriving together only one embeds. The claim is released by saving the document
+        without a hash (failed or partial indexing) or by deleting it.
+        
+        Args:
+            document_id: Document ID the upload will be stored under
+            file_hash: SHA-256 of the uploaded file
+            namespace: Pinecone namespace
+            fields: Catalog fields to set with the claim (status, filename, path, ...)
+        
+        Returns:
+            None when the claim was taken, otherwise the record already holding the hash
+        """
+        if self.collection is None:
+            return None
+        
+        for attempt in range(2):
+            now = datetime.utcnow()
+            try:
+                # A record that already holds this exact hash fails the filter, so the upsert
+                # collides on _id instead of overwriting it
+                await self.collection.update_one(
+                    {"_id": document_id, "file_hash": {"$ne": file_hash}},
+                    {
+                        "$set": {**fields, "file_hash": file_hash, "namespace": namespace, "updated_at": now},
+                        "$setOnInsert": {"created_at": now}
+                    },
+                    upsert=True
+                )
+                return None
+            except DuplicateKeyError:
+                existing = await self.find_by_file_hash(file_hash, namespace)
+                if existing is None:
+                    continue  # Holder went away in between - try again
+                stale = (
+                    existing.get("status") == STATUS_INDEXING
+                    and existing.get("updated_at", now) < now - CLAIM_TIMEOUT
+                )
+                if not stale or attempt:
+                    return existing
+                logger.warning(f"⚠️ Taking over stale indexing claim of document {existing['_id']}")
+                await self.collection.update_one(
+                    {"_id": existing["_id"], "file_hash": file_hash, "updated_at": existing.get("updated_at")},
+                    {"$set": {"file_hash": None, "status": STATUS_FAILED, "error": "Indexing interrupted"}}
+                )
+        return await self.find_by_file_hash(file_hash, namespace)
+
+    async def find_previous_version(self, filename: str, namespace: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the most recent document uploaded under the same filename and namespace
+        A match means the new upload is a changed version of that document
+        """
+        if self.collection is None:
+            return None
+        return await self.collection.find_one(
+            {"filename": filename, "namespace": namespace},
+            sort=[("updated_at", -1)]
+        )
+
+    async def get(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """Get registry record by document ID"""
+        if self.collection is None:
+            return None
+        return await self.collection.find_one({"_id": document_id})
+
+    async def save(
+        self,
+        document_id: str,
+        file_hash: Optional[str],
+        namespace: str,
+        filename: str,
+        chunks: List[Dict[str, Any]],
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Create or replace the registry record for a document
+        
+        Args:
+            document_id: Document ID (also used as the vector ID prefix)
+            file_hash: SHA-256 of the file bytes (None until every chunk is indexed)
+            namespace: Pinecone namespace
+            filename: Original filename
+            chunks: List of {hash, id, size} for every chunk currently stored in Pinecone
+            extra: Additional fields (title, total_pages, path, status, ...)
+        """
+        fields = {
+            "file_hash": file_hash,
+            "namespace": namespace,
+            "filename": filename,
+            "chunks": chunks,
+            **(extra or {})
+        }
+        try:
+            await self.update(document_id, fields)
+        except DuplicateKeyError:
+            # Another document already holds these bytes in this namespace (e.g. indexed into it
+            # via /documents/index) - keep the record, just without claiming the hash
+            logger.warning(f"⚠️ Document {document_id} duplicates another in {namespace} - file hash not recorded")
+            await self.update(document_id, {**fields, "file_hash": None})
+
+    async def update(self, document_id: str, fields: Dict[str, Any]):
+        """
+        Set fields on a document record, creating it if needed
+        
+        Args:
+            document_id: Document ID
+            fields: Fields to set (updated_at is added automatically)
+        """
+        if self.collection is None:
+            logger.warning("MongoDB not available - document registry not updated")
+            return
+        
+        now = datetime.utcnow()
+        await self.collection.update_one(
+            {"_id": document_id},
+            {
+                "$set": {**fields, "updated_at": now},
+                "$setOnInsert": {"created_at": now}
+            },
+            upsert=True
+        )
+
+    async def set_status(self, document_id: str, status: str, error: Optional[str] = None):
+        """Record a document's indexing status"""
+        await self.update(document_id, {"status": status, "error": error})
+
+    async def list_documents(
+        self,
+        skip: int = 0,
+        limit: int = 50,
+        namespace: Optional[str] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        List catalog entries, newest first
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum records to return
+            namespace: Only documents in this namespace
+            status: Only documents with this indexing status
+            search: Case-insensitive substring of the filename or title
+        
+        Returns:
+            (total matching, records without their chunk manifests)
+        """
+        if self.collection is None:
+            return 0, []
+        
+        query: Dict[str, Any] = {}
+        if namespace:
+            query["namespace"] = namespace
+        if status:
+            query["status"] = status
+        if search:
+            pattern = {"$regex": re.escape(search), "$options": "i"}
+            query["$or"] = [{"filename": pattern}, {"title": pattern}]
+        
+        # Count and page concurrently; the page sort uses the (created_at, _id) indexes
+        total, records = await asyncio.gather(
+            self.collection.count_documents(query),
+            self.collection.find(query, CATALOG_PROJECTION).sort("created_at", -1).skip(skip).limit(limit).to_list(length=limit)
+        )
+        return total, records
+
+    async def delete(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """Remove a document from the registry, returning the removed record"""
+        if self.collection is None:
+            return None
+        return await self.collection.find_one_and_delete({"_id": document_id})
+
+    @staticmethod
+    def diff_chunks(
+        previous_chunks: List[Dict[str, Any]],
+        new_chunks: List[str]
+    ) -> Tuple[List[Tuple[int, str, str]], List[Dict[str, Any]], List[str]]:
+        """
+        Compare stored chunks against freshly chunked text
+        
+        Args:
+            previous_chunks: Stored {hash, id} records
+            new_chunks: Chunk texts from the new upload
+        
+        Returns:
+            (added, kept, removed_ids)
+            added: (chunk_index, chunk_hash, text) for chunks that need embedding
+            kept: {hash, id} records whose vectors can be reused as-is
+            removed_ids: vector IDs whose text no longer appears in the document
+        """
+        previous_by_hash = {c["hash"]: c for c in previous_chunks if c["hash"]}
+        
+        added = []
+        kept = []
+        seen = set()
+        for idx, chunk in enumerate(new_chunks):
+            chunk_hash = text_hash(chunk)
+            if chunk_hash in seen:
+                continue  # Same text twice in one document - one vector is enough
+            seen.add(chunk_hash)
+            
+            if chunk_hash in previous_by_hash:
+                kept.append(previous_by_hash[chunk_hash])
+            else:
+                added.append((idx, chunk_hash, chunk))
+        
+        removed_ids = [c["id"] for c in previous_chunks if c["hash"] not in seen]
+        return added, kept, removed_ids
+
+
+# Global instance
+document_registry = DocumentRegistry()
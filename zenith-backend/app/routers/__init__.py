@@ -2,8 +2,16 @@
 All API Routers
 Complete CRUD endpoints for all 10 modules
 """
-from fastapi import APIRouter, HTTPException, Query, File, UploadFile
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, File, UploadFile, Body
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+from typing import Any, Dict, List, Optional, Union
+from app.config import settings
+from app.models import dumps_bson
+from app.utils.records import iter_records, read_batch, detect_format, NDJSON, CSV
+from app.services.name_search import MATCH_AUTO, MATCH_MODES
+from app.services.placement_analytics import placement_analytics
 from app.schemas import *
 from app.services import *
 
@@ -21,6 +29,225 @@ students_router = APIRouter(prefix="/students", tags=["Students"])
 reports_router = APIRouter(prefix="/reports", tags=["Student Reports"])
 
 
+class BSONJSONResponse(JSONResponse):
+    """
+    JSON response rendered straight from raw MongoDB documents with orjson
+    
+    Returning a Response skips FastAPI's response_model validation and jsonable_encoder pass,
+    so only use it where the documents don't need validating (the paginated list endpoints).
+    response_model still documents the shape in OpenAPI: full documents or the module's
+    <Module>Summary (?fields=summary).
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return dumps_bson(content)
+
+
+MATCH_PATTERN = f"^({'|'.join(MATCH_MODES)})$"
+MATCH_DESCRIPTION = "exact, prefix, contains, fuzzy (closest names), or auto (first of those with results)"
+FIELDS_DESCRIPTION = '"summary" for the lightweight list view, or a comma-separated list of fields'
+
+
+def _projection(fields: Optional[str], response_model, summary_model) -> Optional[dict]:
+    """
+    Mongo projection for a list endpoint's ?fields= parameter
+    
+    Args:
+        fields: None (whole documents), "summary", or comma-separated field names
+        response_model: The module's full response schema (defines the valid field names)
+        summary_model: The module's summary schema
+    
+    Returns:
+        Projection dict, or None for whole documents
+    """
+    if not fields:
+        return None
+    if fields.strip() == "summary":
+        names = list(summary_model.model_fields)
+    else:
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(names) - set(response_model.model_fields) - {"_id"})
+        if unknown:
+            raise HTTPException(400, f"Unknown fields: {', '.join(unknown)}")
+    # _id always comes back; "id" is its response name
+    return {name: 1 for name in names if name not in ("id", "_id")} or {"_id": 1}
+
+
+async def _paginate(
+    service,
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    filters: Optional[dict] = None,
+    projection: Optional[dict] = None
+) -> BSONJSONResponse:
+    """One list page and its total, fetched concurrently (keyset when a cursor is given, offset otherwise)"""
+    try:
+        data, total, next_cursor = await service.page(
+            cursor=cursor, limit=limit, filters=filters, skip=skip, projection=projection, serialize=False
+        )
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    return BSONJSONResponse({"total": total, "skip": skip, "limit": limit, "next_cursor": next_cursor, "data": data})
+
+
+def _validation_message(e: ValidationError) -> str:
+    """One-line summary of a Pydantic validation error"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'item'}: {err['msg']}" for err in e.errors()
+    )
+
+
+def _bulk_result(succeeded: int, errors: List[dict], failed: Optional[int] = None) -> dict:
+    """Bulk response; failed defaults to len(errors) (pass it when errors was already capped)"""
+    errors = sorted(errors, key=lambda err: (err.get("line") or 0, err.get("index") or 0))
+    return {
+        "succeeded": succeeded,
+        "failed": len(errors) if failed is None else failed,
+        "errors": errors[:settings.BULK_MAX_REPORTED_ERRORS]
+    }
+
+
+def _check_bulk_size(items: list):
+    if len(items) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(413, f"At most {settings.BULK_MAX_ITEMS} items per request - use /import for larger loads")
+
+
+def _add_bulk_routes(router: APIRouter, service, create_model, update_model, name: str):
+    """
+    Register bulk create/update/delete and NDJSON/CSV import on a module router
+    
+    Must run before the router's /{id} routes so PUT /bulk isn't matched as an ID.
+    Items are validated one by one, so a bad item is reported instead of failing the request.
+    
+    Args:
+        router: Module router
+        service: The module's BaseCRUDService
+        create_model: Schema each created item must satisfy
+        update_model: Schema for the fields of each update
+        name: Plural module name for route names and docs
+    """
+    async def bulk_create(items: List[Dict[str, Any]] = Body(..., description=f"{create_model.__name__} objects")):
+        _check_bulk_size(items)
+        docs, positions, errors = [], [], []
+        for index, item in enumerate(items):
+            try:
+                docs.append(create_model.model_validate(item).model_dump())
+                positions.append(index)
+            except ValidationError as e:
+                errors.append({"index": index, "error": _validation_message(e)})
+        
+        result = await service.bulk_create(docs)
+        errors.extend({"index": positions[err["index"]], "error": err["error"]} for err in result["errors"])
+        return _bulk_result(result["succeeded"], errors)
+    
+    async def bulk_update(items: List[Dict[str, Any]] = Body(..., description=f'{update_model.__name__} fields plus "id"')):
+        _check_bulk_size(items)
+        updates, positions, errors = [], [], []
+        for index, item in enumerate(items):
+            fields = dict(item)
+            doc_id = fields.pop("id", None) or fields.pop("_id", None)
+            if not doc_id:
+                errors.append({"index": index, "error": "Missing id"})
+                continue
+            try:
+                updates.append((str(doc_id), update_model.model_validate(fields).model_dump(exclude_unset=True)))
+                positions.append(index)
+            except ValidationError as e:
+                errors.append({"index": index, "id": str(doc_id), "error": _validation_message(e)})
+        
+        result = await service.bulk_update(updates)
+        errors.extend({**err, "index": positions[err["index"]]} for err in result["errors"])
+        return _bulk_result(result["succeeded"], errors)
+    
+    async def bulk_delete(request: BulkDeleteRequest):
+        _check_bulk_size(request.ids)
+        result = await service.bulk_delete(request.ids)
+        return _bulk_result(result["succeeded"], result["errors"])
+    
+    async def import_records(
+        file: UploadFile = File(..., description="NDJSON (one object per line) or CSV with a header row"),
+        format: Optional[str] = Query(None, pattern=f"^({NDJSON}|{CSV})$", description="Defaults to the file extension")
+    ):
+        fmt = format or detect_format(file.filename, file.content_type)
+        if fmt is None:
+            raise HTTPException(400, "Unknown file format - upload .ndjson/.jsonl or .csv, or pass ?format=")
+        
+        succeeded = failed = 0
+        errors: List[dict] = []  # Only the first BULK_MAX_REPORTED_ERRORS are kept; failed counts them all
+        batch, lines = [], []
+        
+        def report(error: dict):
+            nonlocal failed
+            failed += 1
+            if len(errors) < settings.BULK_MAX_REPORTED_ERRORS:
+                errors.append(error)
+        
+        async def flush():
+            nonlocal succeeded
+            result = await service.bulk_create(batch)
+            succeeded += result["succeeded"]
+            for err in result["errors"]:
+                report({"line": lines[err["index"]], "error": err["error"]})
+            batch.clear()
+            lines.clear()
+        
+        # File reads and parsing block, so they run in a worker thread a batch at a time.
+        # Listeners (e.g. placement analytics) rebuild once for the whole import, not per batch
+        records = iter_records(file.file, fmt)
+        async with service.deferred_changes():
+            while True:
+                results, read_error = await run_in_threadpool(read_batch, records, settings.BULK_BATCH_SIZE)
+                for line, record, error in results:
+                    if error is None:
+                        try:
+                            batch.append(create_model.model_validate(record).model_dump())
+                            lines.append(line)
+                        except ValidationError as e:
+                            error = _validation_message(e)
+                    if error is not None:
+                        report({"line": line, "error": error})
+                    if len(batch) >= settings.BULK_BATCH_SIZE:
+                        await flush()
+                if read_error is not None:
+                    # Earlier batches are already stored; report how far the import got (always listed)
+                    failed += 1
+                    errors.append({"error": read_error})
+                    break
+                if not results:
+                    break
+            if batch:
+                await flush()
+        return _bulk_result(succeeded, errors, failed)
+    
+    routes = (
+        ("/bulk", bulk_create, "POST", f"bulk_create_{name}", f"Create many {name}"),
+        ("/bulk", bulk_update, "PUT", f"bulk_update_{name}", f"Update many {name}"),
+        ("/bulk/delete", bulk_delete, "POST", f"bulk_delete_{name}", f"Delete many {name} by ID"),
+        ("/import", import_records, "POST", f"import_{name}", f"Import {name} from NDJSON or CSV"),
+    )
+    for path, endpoint, method, route_name, summary in routes:
+        router.add_api_route(
+            path, endpoint, methods=[method], name=route_name, summary=summary,
+            response_model=BulkResult, response_model_exclude_none=True
+        )
+
+
+# ==================== BULK ENDPOINTS ====================
+# Registered first so they take precedence over each router's /{id} routes
+
+_add_bulk_routes(events_router, event_service, EventCreate, EventUpdate, "events")
+_add_bulk_routes(placements_router, placement_service, PlacementCreate, PlacementUpdate, "placements")
+_add_bulk_routes(companies_router, company_package_service, CompanyPackageCreate, CompanyPackageUpdate, "company_packages")
+_add_bulk_routes(interviews_router, interview_question_service, InterviewQuestionCreate, InterviewQuestionUpdate, "interview_questions")
+_add_bulk_routes(internships_router, internship_service, InternshipCreate, InternshipUpdate, "internships")
+_add_bulk_routes(roadmaps_router, skill_roadmap_service, SkillRoadmapCreate, SkillRoadmapUpdate, "roadmaps")
+_add_bulk_routes(guides_router, resume_guide_service, ResumeGuideCreate, ResumeGuideUpdate, "guides")
+_add_bulk_routes(clubs_router, club_service, ClubCreate, ClubUpdate, "clubs")
+_add_bulk_routes(scholarships_router, scholarship_service, ScholarshipCreate, ScholarshipUpdate, "scholarships")
+_add_bulk_routes(students_router, student_service, StudentCreate, StudentUpdate, "students")
+
+
 # ==================== EVENTS ENDPOINTS ====================
 
 @events_router.post("/", response_model=EventResponse, status_code=201)
@@ -29,12 +256,16 @@ async def create_event(event: EventCreate):
     result = await event_service.create(event.model_dump())
     return result
 
-@events_router.get("/", response_model=PaginatedResponse)
-async def get_events(skip: int = 0, limit: int = 10):
-    """Get all events"""
-    events = await event_service.get_all(skip=skip, limit=limit)
-    total = await event_service.count()
-    return {"total": total, "skip": skip, "limit": limit, "data": events}
+@events_router.get("/", response_model=PaginatedResponse[Union[EventResponse, EventSummary]])
+async def get_events(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """Get all events (newest first)"""
+    projection = _projection(fields, EventResponse, EventSummary)
+    return await _paginate(event_service, skip, limit, cursor, projection=projection)
 
 @events_router.get("/upcoming", response_model=List[EventResponse])
 async def get_upcoming_events(limit: int = 10):
@@ -74,18 +305,67 @@ async def create_placement(placement: PlacementCreate):
     result = await placement_service.create(placement.model_dump())
     return result
 
-@placements_router.get("/", response_model=PaginatedResponse)
-async def get_placements(skip: int = 0, limit: int = 10):
-    """Get all placements"""
-    placements = await placement_service.get_all(skip=skip, limit=limit)
-    total = await placement_service.count()
-    return {"total": total, "skip": skip, "limit": limit, "data": placements}
+@placements_router.get("/", response_model=PaginatedResponse[Union[PlacementResponse, PlacementSummary]])
+async def get_placements(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """Get all placements (newest first)"""
+    projection = _projection(fields, PlacementResponse, PlacementSummary)
+    return await _paginate(placement_service, skip, limit, cursor, projection=projection)
 
 @placements_router.get("/year/{year}", response_model=List[PlacementResponse])
 async def get_placements_by_year(year: str):
     """Get placements by year"""
     return await placement_service.get_year_wise_stats(year)
 
+@placements_router.get("/analytics")
+async def get_placement_analytics():
+    """Placement summary of every academic year (precomputed), newest first"""
+    return await placement_analytics.get_years()
+
+@placements_router.post("/analytics/rebuild")
+async def rebuild_placement_analytics():
+    """Recompute all placement analytics from placement and company package records"""
+    years = await placement_analytics.rebuild()
+    return {"message": "Placement analytics rebuilt", "academic_years": years}
+
+@placements_router.get("/analytics/{year}")
+async def get_year_analytics(year: str):
+    """Year summary, per-department statistics and per-company offers for one academic year"""
+    analytics = await placement_analytics.get_year(year)
+    if not analytics:
+        raise HTTPException(404, "No placement analytics for this year")
+    return analytics
+
+@placements_router.get("/analytics/{year}/departments/{department}")
+async def get_department_analytics(year: str, department: Department):
+    """Placement statistics of one department in one academic year"""
+    analytics = await placement_analytics.get_year(year)
+    stats = (analytics or {}).get("departments", {}).get(department.value)
+    if not stats:
+        raise HTTPException(404, "No placement analytics for this department and year")
+    return {"academic_year": year, "department": department.value, **stats}
+
+@placements_router.get("/analytics/{year}/companies")
+async def get_company_analytics(
+    year: str,
+    sort: str = Query("offers", pattern="^(offers|highest_package|average_package|median_package)$"),
+    limit: int = Query(20, ge=1, le=500)
+):
+    """Offers and package statistics per company in one academic year"""
+    analytics = await placement_analytics.get_year(year)
+    if not analytics:
+        raise HTTPException(404, "No placement analytics for this year")
+    companies = sorted(
+        analytics["companies"].values(),
+        key=lambda company: company.get(sort) or 0,
+        reverse=True
+    )
+    return {"academic_year": year, "total": len(companies), "companies": companies[:limit]}
+
 @placements_router.get("/{placement_id}", response_model=PlacementResponse)
 async def get_placement(placement_id: str):
     """Get placement by ID"""
@@ -119,12 +399,16 @@ async def create_company_package(package: CompanyPackageCreate):
     result = await company_package_service.create(package.model_dump())
     return result
 
-@companies_router.get("/", response_model=PaginatedResponse)
-async def get_company_packages(skip: int = 0, limit: int = 10):
-    """Get all company packages"""
-    packages = await company_package_service.get_all(skip=skip, limit=limit)
-    total = await company_package_service.count()
-    return {"total": total, "skip": skip, "limit": limit, "data": packages}
+@companies_router.get("/", response_model=PaginatedResponse[Union[CompanyPackageResponse, CompanyPackageSummary]])
+async def get_company_packages(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """Get all company packages (newest first)"""
+    projection = _projection(fields, CompanyPackageResponse, CompanyPackageSummary)
+    return await _paginate(company_package_service, skip, limit, cursor, projection=projection)
 
 @companies_router.get("/top", response_model=List[CompanyPackageResponse])
 async def get_top_packages(limit: int = 10):
@@ -132,9 +416,12 @@ async def get_top_packages(limit: int = 10):
     return await company_package_service.get_top_packages(limit=limit)
 
 @companies_router.get("/company/{company_name}", response_model=List[CompanyPackageResponse])
-async def get_company_packages_by_name(company_name: str):
+async def get_company_packages_by_name(
+    company_name: str,
+    match: str = Query(MATCH_AUTO, pattern=MATCH_PATTERN, description=MATCH_DESCRIPTION)
+):
     """Get packages by company name"""
-    return await company_package_service.get_by_company(company_name)
+    return await company_package_service.get_by_company(company_name, match)
 
 @companies_router.get("/{package_id}", response_model=CompanyPackageResponse)
 async def get_company_package(package_id: str):
@@ -169,17 +456,24 @@ async def create_interview_question(question: InterviewQuestionCreate):
     result = await interview_question_service.create(question.model_dump())
     return result
 
-@interviews_router.get("/", response_model=PaginatedResponse)
-async def get_interview_questions(skip: int = 0, limit: int = 10):
-    """Get all interview questions"""
-    questions = await interview_question_service.get_all(skip=skip, limit=limit)
-    total = await interview_question_service.count()
-    return {"total": total, "skip": skip, "limit": limit, "data": questions}
+@interviews_router.get("/", response_model=PaginatedResponse[Union[InterviewQuestionResponse, InterviewQuestionSummary]])
+async def get_interview_questions(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """Get all interview questions (newest first)"""
+    projection = _projection(fields, InterviewQuestionResponse, InterviewQuestionSummary)
+    return await _paginate(interview_question_service, skip, limit, cursor, projection=projection)
 
 @interviews_router.get("/company/{company_name}", response_model=List[InterviewQuestionResponse])
-async def get_questions_by_company(company_name: str):
+async def get_questions_by_company(
+    company_name: str,
+    match: str = Query(MATCH_AUTO, pattern=MATCH_PATTERN, description=MATCH_DESCRIPTION)
+):
     """Get questions by company"""
-    return await interview_question_service.get_by_company(company_name)
+    return await interview_question_service.get_by_company(company_name, match)
 
 @interviews_router.get("/category/{category}", response_model=List[InterviewQuestionResponse])
 async def get_questions_by_category(category: str):
@@ -219,12 +513,16 @@ async def create_internship(internship: InternshipCreate):
     result = await internship_service.create(internship.model_dump())
     return result
 
-@internships_router.get("/", response_model=PaginatedResponse)
-async def get_internships(skip: int = 0, limit: int = 10):
-    """Get all internships"""
-    internships = await internship_service.get_all(skip=skip, limit=limit)
-    total = await internship_service.count()
-    return {"total": total, "skip": skip, "limit": limit, "data": internships}
+@internships_router.get("/", response_model=PaginatedResponse[Union[InternshipResponse, InternshipSummary]])
+async def get_internships(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """Get all internships (newest first)"""
+    projection = _projection(fields, InternshipResponse, InternshipSummary)
+    return await _paginate(internship_service, skip, limit, cursor, projection=projection)
 
 @internships_router.get("/active", response_model=List[InternshipResponse])
 async def get_active_internships():
@@ -264,12 +562,16 @@ async def create_roadmap(roadmap: SkillRoadmapCreate):
     result = await skill_roadmap_service.create(roadmap.model_dump())
     return result
 
-@roadmaps_router.get("/", response_model=PaginatedResponse)
-async def get_roadmaps(skip: int = 0, limit: int = 10):
-    """Get all roadmaps"""
-    roadmaps = await skill_roadmap_service.get_all(skip=skip, limit=limit)
-    total = await skill_roadmap_service.count()
-    return {"total": total, "skip": skip, "limit": limit, "data": roadmaps}
+@roadmaps_router.get("/", response_model=PaginatedResponse[Union[SkillRoadmapResponse, SkillRoadmapSummary]])
+async def get_roadmaps(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """Get all roadmaps (newest first)"""
+    projection = _projection(fields, SkillRoadmapResponse, SkillRoadmapSummary)
+    return await _paginate(skill_roadmap_service, skip, limit, cursor, projection=projection)
 
 @roadmaps_router.get("/department/{department}", response_model=List[SkillRoadmapResponse])
 async def get_roadmaps_by_department(department: str):
@@ -309,12 +611,16 @@ async def create_guide(guide: ResumeGuideCreate):
     result = await resume_guide_service.create(guide.model_dump())
     return result
 
-@guides_router.get("/", response_model=PaginatedResponse)
-async def get_guides(skip: int = 0, limit: int = 10):
-    """Get all guides"""
-    guides = await resume_guide_service.get_all(skip=skip, limit=limit)
-    total = await resume_guide_service.count()
-    return {"total": total, "skip": skip, "limit": limit, "data": guides}
+@guides_router.get("/", response_model=PaginatedResponse[Union[ResumeGuideResponse, ResumeGuideSummary]])
+async def get_guides(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """Get all guides (newest first)"""
+    projection = _projection(fields, ResumeGuideResponse, ResumeGuideSummary)
+    return await _paginate(resume_guide_service, skip, limit, cursor, projection=projection)
 
 @guides_router.get("/{guide_id}", response_model=ResumeGuideResponse)
 async def get_guide(guide_id: str):
@@ -349,12 +655,16 @@ async def create_club(club: ClubCreate):
     result = await club_service.create(club.model_dump())
     return result
 
-@clubs_router.get("/", response_model=PaginatedResponse)
-async def get_clubs(skip: int = 0, limit: int = 10):
-    """Get all clubs"""
-    clubs = await club_service.get_all(skip=skip, limit=limit)
-    total = await club_service.count()
-    return {"total": total, "skip": skip, "limit": limit, "data": clubs}
+@clubs_router.get("/", response_model=PaginatedResponse[Union[ClubResponse, ClubSummary]])
+async def get_clubs(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """Get all clubs (newest first)"""
+    projection = _projection(fields, ClubResponse, ClubSummary)
+    return await _paginate(club_service, skip, limit, cursor, projection=projection)
 
 @clubs_router.get("/open-membership", response_model=List[ClubResponse])
 async def get_open_membership_clubs():
@@ -394,12 +704,16 @@ async def create_scholarship(scholarship: ScholarshipCreate):
     result = await scholarship_service.create(scholarship.model_dump())
     return result
 
-@scholarships_router.get("/", response_model=PaginatedResponse)
-async def get_scholarships(skip: int = 0, limit: int = 10):
-    """Get all scholarships"""
-    scholarships = await scholarship_service.get_all(skip=skip, limit=limit)
-    total = await scholarship_service.count()
-    return {"total": total, "skip": skip, "limit": limit, "data": scholarships}
+@scholarships_router.get("/", response_model=PaginatedResponse[Union[ScholarshipResponse, ScholarshipSummary]])
+async def get_scholarships(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """Get all scholarships (newest first)"""
+    projection = _projection(fields, ScholarshipResponse, ScholarshipSummary)
+    return await _paginate(scholarship_service, skip, limit, cursor, projection=projection)
 
 @scholarships_router.get("/active", response_model=List[ScholarshipResponse])
 async def get_active_scholarships():
@@ -439,12 +753,16 @@ async def create_student(student: StudentCreate):
     result = await student_service.create(student.model_dump())
     return result
 
-@students_router.get("/", response_model=PaginatedResponse)
-async def get_students(skip: int = 0, limit: int = 10):
-    """Get all students"""
-    students = await student_service.get_all(skip=skip, limit=limit)
-    total = await student_service.count()
-    return {"total": total, "skip": skip, "limit": limit, "data": students}
+@students_router.get("/", response_model=PaginatedResponse[Union[StudentResponse, StudentSummary]])
+async def get_students(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+):
+    """Get all students (newest first)"""
+    projection = _projection(fields, StudentResponse, StudentSummary)
+    return await _paginate(student_service, skip, limit, cursor, projection=projection)
 
 @students_router.get("/roll/{roll_number}", response_model=StudentResponse)
 async def get_student_by_roll(roll_number: str):
@@ -2,8 +2,9 @@
 Admin Content Management Router
 Handle admin uploads of text and images for MLRIT chatbot
 """
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query
 from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Optional
 import logging
 from pathlib import Path
@@ -12,6 +13,8 @@ from app.services.image_service import image_storage
 from app.models.image import ContentUploadRequest, ContentUploadResponse
 from app.rag.indexer import indexer
 from app.rag.pdf_processor import pdf_processor
+from app.config import settings
+from app.utils.uploads import save_upload, discard_upload
 
 logger = logging.getLogger(__name__)
 
@@ -139,21 +142,25 @@ async def upload_pdf(
         if not file.filename.endswith('.pdf'):
             raise HTTPException(status_code=400, detail="File must be a PDF")
         
-        # Save uploaded PDF temporarily
-        temp_dir = Path("uploads/temp")
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_pdf = temp_dir / file.filename
-        
-        with open(temp_pdf, "wb") as f:
-            f.write(await file.read())
-        
-        # Process PDF
-        pdf_result = pdf_processor.process_pdf(
-            pdf_path=str(temp_pdf),
-            category=category,
-            extract_images=extract_images
+        # Stream uploaded PDF to a temp file (never holds the whole file in memory)
+        upload = await save_upload(
+            file,
+            Path("uploads/temp"),
+            max_bytes=settings.MAX_ADMIN_PDF_UPLOAD_MB * 1024 * 1024
         )
         
+        # Process PDF in a worker thread - extraction and image variants block until done
+        try:
+            pdf_result = await run_in_threadpool(
+                pdf_processor.process_pdf,
+                pdf_path=str(upload.path),
+                category=category,
+                extract_images=extract_images
+            )
+        finally:
+            # Clean up temp file
+            discard_upload(upload.path)
+        
         result = ContentUploadResponse(
             success=False,
             message="Processing PDF..."
@@ -193,13 +200,14 @@ async def upload_pdf(
                     height=img_data["height"],
                     format=img_data["format"],
                     source=file.filename,
-                    page_num=img_data["page_num"]
+                    page_num=img_data["page_num"],
+                    variants=img_data.get("variants", []),
+                    content_hash=img_data.get("content_hash"),
+                    size_bytes=img_data.get("size_bytes")
                 )
                 
-                # Save to database
-                from app.database import mongodb
-                if mongodb.client:
-                    await mongodb.db.images.insert_one(metadata.dict())
+                # Save to database and the image index
+                await image_storage.save_metadata(metadata)
                 
                 image_url = image_storage.get_image_url(img_data["relative_path"])
                 result.image_urls.append(image_url)
@@ -208,9 +216,6 @@ async def upload_pdf(
             except Exception as e:
                 logger.warning(f"⚠️ Could not save image metadata: {e}")
         
-        # Clean up temp file
-        temp_pdf.unlink()
-        
         result.success = True
         result.message = f"Successfully processed PDF: {file.filename}"
         
@@ -231,14 +236,15 @@ async def get_categories():
     Get list of all categories currently in use
     (Admin can create any category, no predefined list)
     """
-    from app.database import mongodb
+    from app.database import mongodb, Collections
     
     try:
         categories = []
         
-        if mongodb.client:
+        db = mongodb.get_database()
+        if db is not None:
             # Get unique categories from images collection
-            categories = await mongodb.db.images.distinct("category")
+            categories = await db[Collections.IMAGES].distinct("category")
         
         return {
             "message": "Categories are dynamic - admin can create any category name",
@@ -260,6 +266,45 @@ async def get_categories():
         }
 
 
+@router.get("/images/storage")
+async def get_image_storage():
+    """Disk usage of stored images (originals, variants, and files no image record references)"""
+    try:
+        return await image_storage.storage_report()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/images/search")
+async def search_images(
+    q: str = Query(..., min_length=1, description="Search text (matches label, category and description; prefixes allowed)"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Search images, best matches first"""
+    try:
+        total, images = await image_storage.search_images(q, skip=skip, limit=limit)
+        
+        return {
+            "query": q,
+            "total": total,
+            "skip": skip,
+            "limit": limit,
+            "images": [
+                {
+                    "label": img.label,
+                    "category": img.category,
+                    "url": image_storage.get_image_url(img.relative_path),
+                    "description": img.description,
+                    "uploaded_at": img.uploaded_at
+                }
+                for img in images
+            ]
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/images/{category}")
 async def get_category_images(category: str):
     """Get all images for a specific category"""
@@ -1,18 +1,22 @@
 """
 Content Management Router
 Handles chatbot content CRUD operations with Pinecone vector database
-Reads existing content directly from Pinecone, stores new content to both Pinecone and MongoDB
+Lists content from the vector manifest, stores new content to both Pinecone and MongoDB
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 import logging
 from datetime import datetime
+import asyncio
 import uuid
 
 from app.rag.indexer import indexer
 from app.rag.embeddings import vector_store, embedding_service
+from app.rag.manifest import vector_manifest
+from app.services.maintenance_service import maintenance_service
 from app.database import pinecone_db, mongodb
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -159,55 +163,114 @@ def group_vectors_by_source(vectors: List[Dict]) -> List[Dict]:
     return result
 
 
+def _content_item(entry: Dict[str, Any], preview_chars: int, include_text: bool) -> Dict[str, Any]:
+    """Shape a manifest entry (or Pinecone scan result) for the content admin screen"""
+    text = entry.get('text', '')
+    item = {
+        'id': entry.get('vector_id') or entry.get('id'),
+        'title': entry.get('title') or entry.get('category') or entry.get('source', 'Unknown'),
+        'namespace': entry.get('namespace') or 'default',
+        'category': entry.get('category', ''),
+        'source': entry.get('source', ''),
+        'text_preview': text[:preview_chars] + '...' if len(text) > preview_chars else text,
+        'text_length': len(text),
+        'chunk_count': 1,  # Each is one chunk
+        'metadata': entry.get('metadata', {})
+    }
+    if include_text:
+        item['text'] = text  # Full text for expansion
+    return item
+
+
+LIST_DEFAULT_LIMIT = 200  # Page size when no limit is given
+PINECONE_SCAN_LIMIT = 500  # Vectors sampled per namespace by the Pinecone fallback
+
+
 @router.get("")
-async def list_content():
+async def list_content(
+    namespace: Optional[str] = None,
+    category: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(LIST_DEFAULT_LIMIT, ge=1, le=1000, description="Page size"),
+    preview_chars: int = Query(150, ge=0, le=2000),
+    include_text: bool = Query(False, description="Include full chunk text (GET /api/content/{id} fetches one)")
+):
     """
-    List all indexed chatbot content directly from Pinecone.
-    Returns individual vectors with their text content.
+    List indexed chatbot content, one item per vector, a page at a time.
+    Served from the vector manifest; Pinecone is not queried. Follow next_cursor for the next page.
     """
     try:
-        all_content = []
+        if namespace == 'default':
+            namespace = ''
         
-        # Get all namespaces
-        namespaces = get_all_namespaces()
-        logger.info(f"📋 Found namespaces: {namespaces}")
+        if vector_manifest.collection is None:
+            # MongoDB unavailable - fall back to scanning Pinecone
+            return _list_content_from_pinecone(namespace, category, limit, preview_chars, include_text)
         
-        for namespace in namespaces:
-            vectors = fetch_pinecone_vectors_by_namespace(namespace, limit=500)
-            
-            # Return each vector as an individual item
-            for vec in vectors:
-                text = vec.get('text', '')
-                all_content.append({
-                    'id': vec['id'],
-                    'title': vec.get('title') or vec.get('category') or vec.get('source', 'Unknown'),
-                    'namespace': namespace or 'default',
-                    'category': vec.get('category', ''),
-                    'source': vec.get('source', ''),
-                    'text': text,  # Full text for expansion
-                    'text_preview': text[:150] + '...' if len(text) > 150 else text,  # Short preview
-                    'chunk_count': 1,  # Each is one chunk
-                    'metadata': vec.get('metadata', {})
-                })
+        try:
+            entries, next_cursor = await vector_manifest.page(
+                namespace=namespace,
+                category=category,
+                cursor=cursor,
+                limit=limit
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
-        # Sort by title/category for better organization
-        all_content.sort(key=lambda x: (x.get('namespace', ''), x.get('title', '')))
+        content = [_content_item(entry, preview_chars, include_text) for entry in entries]
+        total = await vector_manifest.count(namespace=namespace, category=category)
+        namespaces = await vector_manifest.namespaces()
         
-        logger.info(f"✅ Listed {len(all_content)} individual vectors")
+        logger.info(f"✅ Listed {len(content)} of {total} vectors from manifest")
         
         return {
             "success": True,
-            "content": all_content,
-            "total": len(all_content),
-            "total_vectors": len(all_content),
-            "namespaces": namespaces
+            "content": content,
+            "total": total,
+            "total_vectors": total,
+            "namespaces": namespaces,
+            "next_cursor": next_cursor,
+            "limit": limit
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing content: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _list_content_from_pinecone(
+    namespace: Optional[str],
+    category: Optional[str],
+    limit: int,
+    preview_chars: int,
+    include_text: bool
+) -> Dict[str, Any]:
+    """Legacy enumeration via random-vector queries (single page, no cursor)"""
+    namespaces = [namespace] if namespace is not None else get_all_namespaces()
+    
+    content = []
+    for ns in namespaces:
+        for vec in fetch_pinecone_vectors_by_namespace(ns, limit=max(limit, PINECONE_SCAN_LIMIT)):
+            if category and vec.get('category') != category:
+                continue
+            content.append(_content_item(vec, preview_chars, include_text))
+    
+    content.sort(key=lambda x: (x.get('namespace', ''), x.get('title', '')))
+    content = content[:limit]
+    
+    return {
+        "success": True,
+        "content": content,
+        "total": len(content),
+        "total_vectors": len(content),
+        "namespaces": namespaces,
+        "next_cursor": None,
+        "limit": limit
+    }
+
+
 @router.post("")
 async def add_content(request: ContentCreate):
     """
@@ -291,10 +354,8 @@ async def delete_content(vector_id: str, namespace: str = ""):
     Delete specific content by vector ID from Pinecone
     """
     try:
-        index = pinecone_db.get_index()
-        
-        # Delete from Pinecone
-        index.delete(ids=[vector_id], namespace=namespace)
+        # Delete from Pinecone (and the vector manifest)
+        await vector_store.delete([vector_id], namespace=namespace)
         
         logger.info(f"✅ Deleted vector: {vector_id} from namespace: {namespace or 'default'}")
         
@@ -314,10 +375,8 @@ async def delete_namespace_content(namespace: str):
     Delete all content from a specific namespace
     """
     try:
-        index = pinecone_db.get_index()
-        
         # Delete all vectors in namespace
-        index.delete(delete_all=True, namespace=namespace)
+        await vector_store.delete_namespace(namespace)
         
         logger.info(f"✅ Cleared namespace: {namespace}")
         
@@ -331,35 +390,31 @@ async def delete_namespace_content(namespace: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.delete("/clear/all")
+@router.delete("/clear/all", status_code=202)
 async def clear_all_content():
     """
-    Clear all chatbot content from all namespaces in Pinecone
+    Clear all chatbot content from all namespaces in Pinecone.
+    Runs as a background job; poll GET /api/content/jobs/{job_id} for progress.
     """
     try:
-        index = pinecone_db.get_index()
         namespaces = get_all_namespaces()
         
-        cleared_count = 0
-        for namespace in namespaces:
-            try:
-                index.delete(delete_all=True, namespace=namespace)
-                cleared_count += 1
-                logger.info(f"✅ Cleared namespace: {namespace}")
-            except Exception as e:
-                logger.warning(f"Could not clear namespace {namespace}: {e}")
+        async def clear_content_collection(job: Dict[str, Any]):
+            # Only drop content metadata once every namespace is gone
+            if job["failed"]:
+                return
+            collection = await get_content_collection()
+            if collection is not None:
+                await collection.delete_many({})
         
-        # Also clear MongoDB collection
-        collection = await get_content_collection()
-        if collection is not None:
-            await collection.delete_many({})
-        
-        logger.info(f"✅ Cleared all content from {cleared_count} namespaces")
+        job = maintenance_service.start_clear_namespaces(namespaces, on_complete=clear_content_collection)
         
         return {
             "success": True,
-            "message": f"Cleared all content from {cleared_count} namespaces",
-            "cleared_namespaces": cleared_count
+            "message": f"Clearing {len(namespaces)} namespaces in the background",
+            "job_id": job["job_id"],
+            "status_url": f"/api/content/jobs/{job['job_id']}",
+            "total_namespaces": len(namespaces)
         }
         
     except Exception as e:
@@ -367,6 +422,53 @@ async def clear_all_content():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/jobs")
+async def list_maintenance_jobs():
+    """
+    List recent content maintenance jobs
+    """
+    jobs = await maintenance_service.list_jobs()
+    return {
+        "success": True,
+        "jobs": [_job_summary(job) for job in jobs]
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_maintenance_job(job_id: str):
+    """
+    Get progress of a content maintenance job, per namespace
+    """
+    job = await maintenance_service.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return {
+        "success": True,
+        **_job_summary(job),
+        "namespaces": [
+            {"name": ns or 'default', **state}
+            for ns, state in list(job["namespaces"].items())
+        ]
+    }
+
+
+def _job_summary(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Job fields without the per-namespace breakdown"""
+    return {
+        "job_id": job["job_id"],
+        "type": job["type"],
+        "status": job["status"],
+        "total": job["total"],
+        "completed": job["completed"],
+        "failed": job["failed"],
+        "error": job["error"],
+        "created_at": job["created_at"].isoformat(),
+        "started_at": job["started_at"].isoformat() if job["started_at"] else None,
+        "finished_at": job["finished_at"].isoformat() if job["finished_at"] else None
+    }
+
+
 @router.get("/stats")
 async def get_content_stats():
     """
@@ -429,7 +531,12 @@ async def list_namespaces():
 
 
 @router.get("/search/{query}")
-async def search_content(query: str, namespace: str = ""):
+async def search_content(
+    query: str,
+    namespace: str = "",
+    top_k: int = Query(20, ge=1, le=100),
+    timeout: float = Query(settings.SEARCH_NAMESPACE_TIMEOUT_SECONDS, gt=0, le=30, description="Seconds to wait per namespace")
+):
     """
     Search Pinecone for content matching a query.
     Useful for verifying what data exists.
@@ -441,30 +548,21 @@ async def search_content(query: str, namespace: str = ""):
         else:
             namespaces = [namespace]
         
-        all_results = []
-        
-        for ns in namespaces:
-            try:
-                results = await vector_store.search(
-                    query=query,
-                    namespace=ns,
-                    top_k=10
-                )
-                
-                for result in results:
-                    result['namespace'] = ns
-                    all_results.append(result)
-            except Exception as e:
-                logger.warning(f"Error searching namespace {ns}: {e}")
-        
-        # Sort by score
-        all_results.sort(key=lambda x: x.get('score', 0), reverse=True)
+        # Embed once, query every namespace concurrently, keep the best top_k
+        results, skipped, total_found = await vector_store.search_namespaces(
+            query=query,
+            namespaces=namespaces,
+            top_k=top_k,
+            per_namespace_top_k=top_k,
+            timeout=timeout
+        )
         
         return {
             "success": True,
             "query": query,
-            "results": all_results[:20],  # Top 20
-            "total_found": len(all_results)
+            "results": results,
+            "total_found": total_found,  # Candidates across namespaces, before the top_k cut
+            "skipped_namespaces": skipped
         }
         
     except Exception as e:
@@ -472,5 +570,33 @@ async def search_content(query: str, namespace: str = ""):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{vector_id}")
+async def get_content(vector_id: str, namespace: str = "", preview_chars: int = Query(150, ge=0, le=2000)):
+    """
+    One content item with its full text (the list returns previews only)
+    """
+    if namespace == 'default':
+        namespace = ''
+    
+    if vector_manifest.collection is not None:
+        entry = await vector_manifest.get(vector_id, namespace)
+    else:
+        # MongoDB unavailable - read the vector's metadata from Pinecone
+        try:
+            response = await asyncio.to_thread(pinecone_db.get_index().fetch, ids=[vector_id], namespace=namespace)
+        except Exception as e:
+            logger.error(f"Error fetching content {vector_id}: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+        vector = response.vectors.get(vector_id)
+        metadata = dict(vector.metadata or {}) if vector is not None else None
+        entry = None if metadata is None else {
+            **metadata, 'id': vector_id, 'namespace': namespace, 'metadata': metadata
+        }
+    
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Content not found")
+    return {"success": True, "content": _content_item(entry, preview_chars, include_text=True)}
+
+
 # Export router
 content_router = router
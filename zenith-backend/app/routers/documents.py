@@ -2,13 +2,19 @@
 Document Management Router
 Handles PDF uploads and vector store indexing for RAG
 """
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from typing import Optional, List, Dict, Any
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query
+from typing import Optional, List, Dict, Any, Tuple
 import os
+import asyncio
 import logging
 from datetime import datetime
 from app.rag.embeddings import embedding_service, vector_store, text_chunker
+from app.rag.registry import (
+    document_registry, STATUS_INDEXING, STATUS_INDEXED, STATUS_PARTIAL, STATUS_FAILED
+)
 from app.config import settings
+from app.utils import chunk_id
+from app.utils.uploads import save_upload, discard_upload, file_sha256
 import uuid
 
 from pydantic import BaseModel
@@ -50,6 +56,9 @@ async def upload_pdf(
     - Stores in Pinecone index 'mlrit' with namespace organization
     - Namespaces: events, placements, interviews, internships, skills, resume_guides, clubs, scholarships
     
+    Re-uploading identical bytes is a no-op. Re-uploading a changed version of a file
+    (same filename + namespace) only embeds new chunks and deletes the ones that disappeared.
+    
     This is a ONE-STEP process - upload and index automatically!
     """
     try:
@@ -57,61 +66,68 @@ async def upload_pdf(
         if not file.filename.endswith('.pdf'):
             raise HTTPException(400, "Only PDF files are allowed")
         
-        # Generate unique filename
-        file_id = str(uuid.uuid4())
         original_filename = file.filename
-        safe_filename = f"{file_id}_{original_filename}"
-        filepath = os.path.join(UPLOAD_DIR, safe_filename)
-        
-        # Save file
-        content = await file.read()
         
-        # Check file size (max 10MB)
-        if len(content) > 10 * 1024 * 1024:
-            raise HTTPException(400, "File size exceeds 10MB limit")
+        # Stream to a temp file, hashing as we go (rejects files over the size limit early)
+        upload = await save_upload(file, UPLOAD_DIR, max_bytes=settings.MAX_PDF_UPLOAD_MB * 1024 * 1024)
+        file_hash = upload.sha256
         
-        with open(filepath, "wb") as f:
-            f.write(content)
+        try:
+            # Identical bytes already indexed into this namespace - nothing to do
+            existing = await document_registry.find_by_file_hash(file_hash, namespace)
+            if existing:
+                discard_upload(upload.path)
+                return _unchanged_response(existing, original_filename, namespace, upload.size, file_hash)
+            
+            # Same filename in the same namespace - treat as a new version of that document
+            previous = await document_registry.find_previous_version(original_filename, namespace)
+            
+            file_id = previous["_id"] if previous else str(uuid.uuid4())
+            safe_filename = f"{file_id}_{original_filename}"
+            filepath = os.path.join(UPLOAD_DIR, safe_filename)
+            
+            # Claim the file hash before embedding (catalogued right away so listings show it
+            # while it indexes); an identical upload that got there first wins
+            doc_title = title or original_filename
+            catalog_fields = {
+                "filename": original_filename,
+                "path": safe_filename,
+                "size_bytes": upload.size,
+                "title": doc_title,
+                "description": description,
+                "status": STATUS_INDEXING,
+                "error": None
+            }
+            if not previous:
+                catalog_fields["chunks"] = []
+            existing = await document_registry.claim(file_id, file_hash, namespace, catalog_fields)
+            if existing:
+                discard_upload(upload.path)
+                return _unchanged_response(existing, original_filename, namespace, upload.size, file_hash)
+            
+            try:
+                os.replace(upload.path, filepath)
+            except OSError as e:
+                await _indexing_failed(file_id, filepath, previous, e)
+                raise
+        except BaseException:
+            discard_upload(upload.path)
+            raise
         
-        logger.info(f"📄 Uploaded PDF: {original_filename} ({len(content)} bytes) to namespace: {namespace}")
+        logger.info(f"📄 Uploaded PDF: {original_filename} ({upload.size} bytes) to namespace: {namespace}")
         
         # ===== AUTOMATIC INDEXING STARTS HERE =====
         
-        # Extract text from PDF
-        from PyPDF2 import PdfReader
-        
         try:
-            reader = PdfReader(filepath)
-            text = ""
-            for page_num, page in enumerate(reader.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    text += f"\n--- Page {page_num + 1} ---\n{page_text}"
-            
-            if not text.strip():
-                raise HTTPException(400, "Could not extract text from PDF. Ensure it's a text-based PDF.")
-        
+            text, total_pages = await asyncio.to_thread(_extract_pdf_text, filepath)
+            chunks = await asyncio.to_thread(text_chunker.chunk_text, text, namespace=namespace)
+            if not chunks:
+                raise HTTPException(400, "No text content found in PDF")
         except Exception as e:
-            logger.error(f"❌ Error extracting text from PDF: {str(e)}")
-            # Clean up file
-            os.remove(filepath)
-            raise HTTPException(400, f"Error reading PDF: {str(e)}")
-        
-        # Chunk the text
-        chunks = text_chunker.chunk_text(
-            text=text,
-            chunk_size=1000,
-            chunk_overlap=200
-        )
-        
-        if not chunks:
-            os.remove(filepath)
-            raise HTTPException(400, "No text content found in PDF")
-        
-        logger.info(f"📝 Created {len(chunks)} chunks from PDF")
+            await _indexing_failed(file_id, filepath, previous, e)
+            raise
         
         # Prepare metadata for all chunks
-        doc_title = title or original_filename
         base_metadata = {
             "namespace": namespace,
             "title": doc_title,
@@ -119,71 +135,57 @@ async def upload_pdf(
             "filename": original_filename,
             "document_id": file_id,
             "uploaded_at": datetime.utcnow().isoformat(),
-            "total_pages": len(reader.pages),
+            "total_pages": total_pages,
             "source": "mlrit_admin_upload"
         }
         
-        # Generate embeddings and store in Pinecone (768 dimensions)
-        stored_count = 0
-        failed_chunks = []
-        
-        for i, chunk in enumerate(chunks):
-            try:
-                # Generate 768-dimensional embedding via LM Studio
-                embedding = embedding_service.generate_embedding(chunk)
-                
-                # Verify embedding dimensions
-                if len(embedding) != 768:
-                    logger.error(f"⚠️ Embedding dimension mismatch! Got {len(embedding)}, expected 768")
-                    raise ValueError(f"Embedding dimension must be 768, got {len(embedding)}")
-                
-                # Create unique ID for this chunk
-                chunk_id = f"{file_id}_chunk_{i}"
-                
-                # Prepare metadata for this chunk
-                chunk_metadata = {
-                    **base_metadata,
-                    "chunk_index": i,
-                    "chunk_id": chunk_id,
-                    "text": chunk  # Store full chunk text for RAG retrieval
-                }
-                
-                # Store in Pinecone with namespace (using single 'mlrit' index)
-                vector_store.index.upsert(
-                    vectors=[(chunk_id, embedding, chunk_metadata)],
-                    namespace=namespace  # events, placements, interviews, etc.
-                )
-                stored_count += 1
-                
-            except Exception as e:
-                logger.error(f"❌ Error storing chunk {i}: {str(e)}")
-                failed_chunks.append(i)
-                continue
-        
-        if stored_count == 0:
-            os.remove(filepath)
-            raise HTTPException(500, "Failed to index any document chunks")
-        
-        success_rate = (stored_count / len(chunks)) * 100
-        logger.info(f"✅ Successfully indexed {stored_count}/{len(chunks)} chunks ({success_rate:.1f}%) to namespace '{namespace}'")
+        # Generate embeddings for new chunks only and store in Pinecone (768 dimensions)
+        try:
+            sync = await _sync_chunks(chunks, base_metadata, namespace, previous)
+            if sync["added"] and not sync["stored"]:
+                raise HTTPException(500, "Failed to index any document chunks")
+        except Exception as e:
+            await _indexing_failed(file_id, filepath, previous, e)
+            raise
+        
+        # Only record the file hash when every chunk made it in, so a retry re-embeds failures
+        await document_registry.save(
+            document_id=file_id,
+            file_hash=None if sync["failed"] else file_hash,
+            namespace=namespace,
+            filename=original_filename,
+            chunks=sync["chunks"],
+            extra={
+                "title": doc_title,
+                "description": description,
+                "total_pages": total_pages,
+                "size_bytes": upload.size,
+                "path": safe_filename,
+                "status": STATUS_PARTIAL if sync["failed"] else STATUS_INDEXED
+            }
+        )
         
         return {
             "success": True,
             "message": f"PDF uploaded and indexed successfully to {namespace}",
+            "status": "updated" if previous else "created",
             "document_id": file_id,
             "filename": original_filename,
             "namespace": namespace,
             "title": doc_title,
             "description": description,
-            "size_bytes": len(content),
-            "total_pages": len(reader.pages),
+            "size_bytes": upload.size,
+            "total_pages": total_pages,
             "total_chunks": len(chunks),
-            "indexed_chunks": stored_count,
-            "failed_chunks": failed_chunks if failed_chunks else [],
-            "success_rate": f"{success_rate:.1f}%",
+            "indexed_chunks": len(sync["stored"]),
+            "reused_chunks": len(sync["kept"]),
+            "removed_chunks": len(sync["removed_ids"]),
+            "failed_chunks": sync["failed"],
+            "success_rate": sync["success_rate"],
             "text_length": len(text),
             "embedding_dimension": 768,
             "pinecone_index": "mlrit",
+            "file_hash": file_hash,
             "uploaded_at": datetime.utcnow().isoformat()
         }
         
@@ -194,6 +196,207 @@ async def upload_pdf(
         raise HTTPException(500, f"Error uploading PDF: {str(e)}")
 
 
+def _unchanged_response(
+    existing: Dict[str, Any],
+    filename: str,
+    namespace: str,
+    size_bytes: int,
+    file_hash: str
+) -> Dict[str, Any]:
+    """Upload response for bytes already indexed (or being indexed) into the namespace"""
+    indexing = existing.get("status") == STATUS_INDEXING
+    logger.info(
+        f"♻️ Skipping re-upload of {filename}: identical to document {existing['_id']}"
+        f"{' (still indexing)' if indexing else ''}"
+    )
+    return {
+        "success": True,
+        "message": f"Document {'is already being indexed' if indexing else 'already indexed'} in {namespace} - no changes",
+        "status": "indexing" if indexing else "unchanged",
+        "document_id": existing["_id"],
+        "filename": existing.get("filename", filename),
+        "namespace": namespace,
+        "title": existing.get("title"),
+        "size_bytes": size_bytes,
+        "total_pages": existing.get("total_pages"),
+        "total_chunks": len(existing.get("chunks", [])),
+        "indexed_chunks": 0,
+        "reused_chunks": len(existing.get("chunks", [])),
+        "removed_chunks": 0,
+        "file_hash": file_hash
+    }
+
+
+async def _indexing_failed(
+    file_id: str,
+    filepath: str,
+    previous: Optional[Dict[str, Any]],
+    error: Exception
+):
+    """Roll back a failed upload: drop a brand-new document, or flag an existing one as failed (releasing its hash claim)"""
+    if previous:
+        await document_registry.update(file_id, {"status": STATUS_FAILED, "error": str(error), "file_hash": None})
+        return
+    if os.path.exists(filepath):
+        os.remove(filepath)
+    await document_registry.delete(file_id)
+
+
+def _extract_pdf_text(filepath: str) -> Tuple[str, int]:
+    """
+    Extract text from a stored PDF with "--- Page N ---" markers for the chunker
+    
+    Returns:
+        (text, total_pages)
+    """
+    from PyPDF2 import PdfReader
+    
+    try:
+        reader = PdfReader(filepath)
+        text = ""
+        for page_num, page in enumerate(reader.pages):
+            page_text = page.extract_text()
+            if page_text:
+                text += f"\n--- Page {page_num + 1} ---\n{page_text}"
+    except Exception as e:
+        logger.error(f"❌ Error extracting text from PDF: {str(e)}")
+        raise HTTPException(400, f"Error reading PDF: {str(e)}")
+    
+    if not text.strip():
+        raise HTTPException(400, "Could not extract text from PDF. Ensure it's a text-based PDF.")
+    
+    return text, len(reader.pages)
+
+
+async def _sync_chunks(
+    chunks: List[str],
+    base_metadata: Dict[str, Any],
+    namespace: str,
+    previous: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Bring a document's vectors in line with its current chunks
+    
+    Embeds only chunks whose text hash is not already on record, and deletes
+    vectors for chunks that disappeared (or all old vectors if the document moved namespace).
+    
+    Args:
+        chunks: Current chunk texts
+        base_metadata: Metadata shared by every chunk (must include document_id)
+        namespace: Target Pinecone namespace
+        previous: Existing registry record for the document, if any
+    
+    Returns:
+        Dict with the new chunk manifest and added/stored/kept/removed/failed details
+    """
+    previous_chunks = previous.get("chunks", []) if previous else []
+    moved = previous is not None and previous.get("namespace") != namespace
+    
+    # Only chunks whose text hash is new need embedding
+    added, kept, removed_ids = document_registry.diff_chunks(
+        [] if moved else previous_chunks,
+        chunks
+    )
+    
+    logger.info(
+        f"📝 {len(chunks)} chunks ({len(added)} new, {len(kept)} unchanged, "
+        f"{len(removed_ids)} removed) for document {base_metadata['document_id']}"
+    )
+    
+    stored, failed = await _embed_and_upsert(added, base_metadata, namespace)
+    
+    # Drop vectors for chunks that no longer exist in the document
+    manifest = kept + stored
+    stale = [(previous["namespace"], [c["id"] for c in previous_chunks])] if moved else [(namespace, removed_ids)]
+    for stale_namespace, stale_ids in stale:
+        if not stale_ids:
+            continue
+        try:
+            await vector_store.delete(stale_ids, namespace=stale_namespace)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not delete {len(stale_ids)} stale chunks: {str(e)}")
+            if not moved:
+                # Keep them on record (without a hash) so the next version retries the delete
+                manifest.extend({"hash": None, "id": vid, "size": 0} for vid in stale_ids)
+    
+    total = len(added) + len(kept)
+    success_rate = ((len(stored) + len(kept)) / total * 100) if total else 100.0
+    logger.info(f"✅ Indexed {len(stored)}/{len(added)} new chunks ({success_rate:.1f}%) to namespace '{namespace}'")
+    
+    return {
+        "chunks": manifest,
+        "added": added,
+        "stored": stored,
+        "kept": kept,
+        "removed_ids": removed_ids,
+        "failed": failed,
+        "success_rate": f"{success_rate:.1f}%"
+    }
+
+
+async def _embed_and_upsert(
+    chunks: List[Tuple[int, str, str]],
+    base_metadata: Dict[str, Any],
+    namespace: str,
+    batch_size: int = 100
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """
+    Embed chunks in batches and upsert them to Pinecone
+    
+    Args:
+        chunks: (chunk_index, chunk_hash, text) tuples
+        base_metadata: Metadata shared by every chunk of the document
+        namespace: Pinecone namespace
+        batch_size: Chunks per embedding call / upsert request
+    
+    Returns:
+        (stored, failed) - stored {hash, id, size} manifest records and failed chunk indexes
+    """
+    stored = []
+    failed = []
+    document_id = base_metadata["document_id"]
+    
+    for start in range(0, len(chunks), batch_size):
+        batch = chunks[start:start + batch_size]
+        try:
+            embeddings = await asyncio.to_thread(
+                embedding_service.generate_embeddings, [text for _, _, text in batch]
+            )
+            
+            vectors = []
+            records = []
+            for (idx, chunk_hash, chunk), embedding in zip(batch, embeddings):
+                # Verify embedding dimensions
+                if len(embedding) != 768:
+                    raise ValueError(f"Embedding dimension must be 768, got {len(embedding)}")
+                
+                # Chunk ID derived from content so unchanged chunks keep their vector
+                vector_id = chunk_id(document_id, chunk_hash)
+                vectors.append((vector_id, embedding, {
+                    **base_metadata,
+                    "chunk_index": idx,
+                    "chunk_id": vector_id,
+                    "text_hash": chunk_hash,
+                    "text": chunk  # Store full chunk text for RAG retrieval
+                }))
+                records.append({"hash": chunk_hash, "id": vector_id, "size": len(chunk.encode("utf-8"))})
+            
+            # Store in Pinecone with namespace (using single 'mlrit' index)
+            await vector_store.upsert_vectors(vectors, namespace=namespace)
+            stored.extend(records)
+            
+        except Exception as e:
+            logger.error(f"❌ Error storing chunks {start}-{start + len(batch) - 1}: {str(e)}")
+            failed.extend(idx for idx, _, _ in batch)
+    
+    return stored, failed
+
+
+def _stored_path(record: Dict[str, Any]) -> str:
+    """Path of a catalogued document's PDF on disk"""
+    return os.path.join(UPLOAD_DIR, record.get("path") or f"{record['_id']}_{record['filename']}")
+
+
 @documents_router.post("/index")
 async def index_document(request: IndexDocumentRequest):
     """
@@ -207,89 +410,63 @@ async def index_document(request: IndexDocumentRequest):
         document_id = request.document_id
         namespace = request.namespace
         
-        # Find the file
-        filepath = None
-        filename = None
-        for fname in os.listdir(UPLOAD_DIR):
-            if fname.startswith(document_id):
-                filepath = os.path.join(UPLOAD_DIR, fname)
-                filename = fname
-                break
+        # Look the file up in the catalog (exact ID match, no directory scan)
+        record = await document_registry.get(document_id)
+        if not record:
+            raise HTTPException(404, "Document not found in catalog. Please upload again.")
         
-        if not filepath or not os.path.exists(filepath):
+        filepath = _stored_path(record)
+        filename = record["filename"]
+        if not os.path.exists(filepath):
             raise HTTPException(404, "Uploaded file not found. Please upload again.")
         
-        # Extract text from PDF
-        from PyPDF2 import PdfReader
+        await document_registry.set_status(document_id, STATUS_INDEXING)
         
         try:
-            reader = PdfReader(filepath)
-            text = ""
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+            # Extract text from PDF
+            text, total_pages = await asyncio.to_thread(_extract_pdf_text, filepath)
             
-            if not text.strip():
-                raise HTTPException(400, "Could not extract text from PDF. Make sure it's a text-based PDF, not a scanned image.")
-        
+            # Chunk the text
+            chunks = await asyncio.to_thread(text_chunker.chunk_text, text, namespace=namespace)
+            
+            if not chunks:
+                raise HTTPException(400, "No text content found in PDF")
+            
+            logger.info(f"Created {len(chunks)} chunks from PDF")
+            
+            # Generate embeddings and store in vector database
+            metadata = {
+                "namespace": namespace,
+                "filename": filename,
+                "document_id": document_id,
+                "indexed_at": datetime.utcnow().isoformat()
+            }
+            
+            doc_title = request.title or record.get("title") or filename
+            sync = await _sync_chunks(chunks, {**metadata, "title": doc_title}, namespace, record)
+            
+            if sync["added"] and not sync["stored"]:
+                raise HTTPException(500, "Failed to index any document chunks")
         except Exception as e:
-            logger.error(f"Error extracting text from PDF: {str(e)}")
-            raise HTTPException(400, f"Error reading PDF: {str(e)}")
-        
-        # Chunk the text
-        chunks = text_chunker.chunk_text(
-            text=text,
-            chunk_size=1000,
-            chunk_overlap=200
+            await document_registry.set_status(document_id, STATUS_FAILED, error=str(e))
+            raise
+        
+        await document_registry.save(
+            document_id=document_id,
+            file_hash=None if sync["failed"] else file_sha256(filepath),
+            namespace=namespace,
+            filename=filename,
+            chunks=sync["chunks"],
+            extra={
+                "title": doc_title,
+                "description": request.description or record.get("description"),
+                "total_pages": total_pages,
+                "size_bytes": os.path.getsize(filepath),
+                "status": STATUS_PARTIAL if sync["failed"] else STATUS_INDEXED,
+                "error": None
+            }
         )
         
-        if not chunks:
-            raise HTTPException(400, "No text content found in PDF")
-        
-        logger.info(f"Created {len(chunks)} chunks from PDF")
-        
-        # Generate embeddings and store in vector database
-        metadata = {
-            "namespace": namespace,
-            "filename": filename,
-            "document_id": document_id,
-            "indexed_at": datetime.utcnow().isoformat()
-        }
-        
-        # Store each chunk
-        stored_count = 0
-        for i, chunk in enumerate(chunks):
-            try:
-                # Generate embedding
-                embedding = embedding_service.generate_embedding(chunk)
-                
-                # Create unique ID for this chunk
-                chunk_id = f"{document_id}_chunk_{i}"
-                
-                # Prepare metadata for this chunk
-                chunk_metadata = {
-                    **metadata,
-                    "chunk_index": i,
-                    "text": chunk  # Full text for retrieval
-                }
-                
-                # Store in vector database using Pinecone's upsert with namespace
-                vector_store.index.upsert(
-                    vectors=[(chunk_id, embedding, chunk_metadata)],
-                    namespace=namespace
-                )
-                stored_count += 1
-                
-            except Exception as e:
-                logger.error(f"Error storing chunk {i}: {str(e)}")
-                continue
-        
-        if stored_count == 0:
-            raise HTTPException(500, "Failed to index any document chunks")
-        
-        logger.info(f"Successfully indexed {stored_count}/{len(chunks)} chunks to namespace '{namespace}'")
-        
         return {
             "success": True,
             "message": f"Document indexed successfully to {namespace}",
@@ -297,7 +474,9 @@ async def index_document(request: IndexDocumentRequest):
             "filename": filename,
             "namespace": namespace,
             "total_chunks": len(chunks),
-            "indexed_chunks": stored_count,
+            "indexed_chunks": len(sync["stored"]),
+            "skipped_chunks": len(sync["kept"]),
+            "removed_chunks": len(sync["removed_ids"]),
             "text_length": len(text),
             "metadata": metadata
         }
@@ -309,36 +488,168 @@ async def index_document(request: IndexDocumentRequest):
         raise HTTPException(500, f"Error indexing document: {str(e)}")
 
 
+@documents_router.post("/{file_id}/reindex")
+async def reindex_document(file_id: str, force: bool = False):
+    """
+    Re-index a registered document from its stored PDF
+    
+    Uses the document's vector manifest: only changed chunks are embedded and stale
+    ones deleted by ID. With force=true every vector is deleted and re-embedded
+    (e.g. after changing the embedding model).
+    """
+    try:
+        record = await document_registry.get(file_id)
+        if not record:
+            raise HTTPException(404, "Document not found")
+        
+        filepath = _stored_path(record)
+        if not os.path.exists(filepath):
+            raise HTTPException(404, "Stored PDF is missing. Please upload again.")
+        
+        namespace = record["namespace"]
+        if not namespace:
+            raise HTTPException(400, "Document has never been indexed - use /documents/index with a namespace")
+        
+        await document_registry.set_status(file_id, STATUS_INDEXING)
+        
+        try:
+            text, total_pages = await asyncio.to_thread(_extract_pdf_text, filepath)
+            chunks = await asyncio.to_thread(text_chunker.chunk_text, text, namespace=namespace)
+            if not chunks:
+                raise HTTPException(400, "No text content found in PDF")
+            
+            if force:
+                await _delete_vectors(record)
+                await document_registry.update(file_id, {"chunks": []})
+                record = {**record, "chunks": []}
+            
+            base_metadata = {
+                "namespace": namespace,
+                "title": record.get("title") or record["filename"],
+                "description": record.get("description") or f"Document from {namespace} category",
+                "filename": record["filename"],
+                "document_id": file_id,
+                "uploaded_at": datetime.utcnow().isoformat(),
+                "total_pages": total_pages,
+                "source": "mlrit_admin_upload"
+            }
+            sync = await _sync_chunks(chunks, base_metadata, namespace, record)
+        except Exception as e:
+            await document_registry.set_status(file_id, STATUS_FAILED, error=str(e))
+            raise
+        
+        await document_registry.save(
+            document_id=file_id,
+            file_hash=None if sync["failed"] else file_sha256(filepath),
+            namespace=namespace,
+            filename=record["filename"],
+            chunks=sync["chunks"],
+            extra={
+                "total_pages": total_pages,
+                "status": STATUS_PARTIAL if sync["failed"] else STATUS_INDEXED,
+                "error": None
+            }
+        )
+        
+        return {
+            "success": True,
+            "message": f"Document re-indexed in {namespace}",
+            "document_id": file_id,
+            "namespace": namespace,
+            "total_chunks": len(chunks),
+            "indexed_chunks": len(sync["stored"]),
+            "reused_chunks": len(sync["kept"]),
+            "removed_chunks": len(sync["removed_ids"]),
+            "failed_chunks": sync["failed"]
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error re-indexing document: {str(e)}")
+        raise HTTPException(500, f"Error re-indexing document: {str(e)}")
+
+
+@documents_router.get("/{file_id}/size")
+async def get_document_size(file_id: str):
+    """
+    Report how much vector storage a document uses, from its vector manifest
+    """
+    record = await document_registry.get(file_id)
+    if not record:
+        raise HTTPException(404, "Document not found")
+    
+    chunks = record.get("chunks", [])
+    text_bytes = sum(c.get("size", 0) for c in chunks)
+    vector_bytes = len(chunks) * 768 * 4  # float32 values per vector
+    
+    return {
+        "success": True,
+        "document_id": file_id,
+        "filename": record.get("filename"),
+        "namespace": record.get("namespace"),
+        "vector_count": len(chunks),
+        "text_bytes": text_bytes,
+        "vector_bytes": vector_bytes,
+        "estimated_total_bytes": text_bytes + vector_bytes,
+        "file_size_bytes": record.get("size_bytes")
+    }
+
+
+async def _delete_vectors(record: Dict[str, Any], batch_size: int = 1000) -> int:
+    """Delete every vector in a document's manifest with batched ID deletes"""
+    ids = [c["id"] for c in record.get("chunks", [])]
+    for start in range(0, len(ids), batch_size):
+        await vector_store.delete(ids[start:start + batch_size], namespace=record["namespace"])
+    return len(ids)
+
+
 @documents_router.get("/list")
-async def list_documents():
+async def list_documents(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    namespace: Optional[str] = None,
+    status: Optional[str] = None,
+    search: Optional[str] = Query(None, description="Filename or title contains")
+):
     """
-    List all uploaded documents
+    List uploaded documents from the document catalog
+    
+    Filterable by namespace and indexing status (uploaded, indexing, indexed, partial, failed).
     """
     try:
-        documents = []
+        total, records = await document_registry.list_documents(
+            skip=skip,
+            limit=limit,
+            namespace=namespace,
+            status=status,
+            search=search
+        )
         
-        if os.path.exists(UPLOAD_DIR):
-            for filename in os.listdir(UPLOAD_DIR):
-                if filename.endswith('.pdf'):
-                    filepath = os.path.join(UPLOAD_DIR, filename)
-                    file_stat = os.stat(filepath)
-                    
-                    # Extract file_id from filename (format: file_id_originalname.pdf)
-                    parts = filename.split('_', 1)
-                    file_id = parts[0] if len(parts) > 0 else filename
-                    original_name = parts[1] if len(parts) > 1 else filename
-                    
-                    documents.append({
-                        "file_id": file_id,
-                        "filename": original_name,
-                        "filepath": filepath,
-                        "size_bytes": file_stat.st_size,
-                        "uploaded_at": datetime.fromtimestamp(file_stat.st_ctime).isoformat()
-                    })
+        documents = []
+        for record in records:
+            created_at = record.get("created_at")
+            updated_at = record.get("updated_at")
+            documents.append({
+                "file_id": record["_id"],
+                "filename": record.get("filename"),
+                "title": record.get("title"),
+                "namespace": record.get("namespace"),
+                "status": record.get("status"),
+                "error": record.get("error"),
+                "filepath": _stored_path(record),
+                "size_bytes": record.get("size_bytes"),
+                "total_pages": record.get("total_pages"),
+                "file_hash": record.get("file_hash"),
+                "uploaded_at": created_at.isoformat() if created_at else None,
+                "updated_at": updated_at.isoformat() if updated_at else None
+            })
         
         return {
             "success": True,
-            "total": len(documents),
+            "total": total,
+            "skip": skip,
+            "limit": limit,
             "documents": documents
         }
         
@@ -353,32 +664,36 @@ async def delete_document(file_id: str):
     Delete uploaded document and its vector embeddings
     """
     try:
-        # Find and delete file
-        deleted_file = None
-        if os.path.exists(UPLOAD_DIR):
-            for filename in os.listdir(UPLOAD_DIR):
-                if filename.startswith(file_id):
-                    filepath = os.path.join(UPLOAD_DIR, filename)
-                    os.remove(filepath)
-                    deleted_file = filename
-                    break
-        
-        if not deleted_file:
+        record = await document_registry.get(file_id)
+        if not record:
             raise HTTPException(404, "Document not found")
         
-        # Delete from vector store (delete all chunks)
+        # Delete the stored file (exact path from the catalog)
+        deleted_file = None
+        filepath = _stored_path(record)
+        if os.path.exists(filepath):
+            os.remove(filepath)
+            deleted_file = record["filename"]
+        
+        # Delete from vector store by ID using the document's vector manifest
         try:
-            # Note: This requires Pinecone delete by metadata filter
-            # If not available, chunks will remain until manual cleanup
-            logger.info(f"Document file deleted: {deleted_file}")
+            deleted_vectors = await _delete_vectors(record)
         except Exception as e:
-            logger.warning(f"Could not delete vectors from Pinecone: {str(e)}")
+            logger.error(f"Could not delete vectors from Pinecone: {str(e)}")
+            await document_registry.set_status(file_id, STATUS_FAILED, error=f"Delete failed: {str(e)}")
+            raise HTTPException(500, f"Document file deleted but vectors could not be removed: {str(e)}")
+        
+        # Forget the content hash so re-uploading the same file indexes it again
+        await document_registry.delete(file_id)
+        
+        logger.info(f"Document deleted: {deleted_file} ({deleted_vectors} vectors)")
         
         return {
             "success": True,
             "message": "Document deleted successfully",
             "file_id": file_id,
-            "filename": deleted_file
+            "filename": deleted_file,
+            "deleted_vectors": deleted_vectors
         }
         
     except HTTPException:
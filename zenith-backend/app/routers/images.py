@@ -1,11 +1,23 @@
 """
 Image Serving Router
 Serve uploaded images for MLRIT chatbot
+
+Stored filenames end in a content-hash suffix, so a URL always maps to the same bytes:
+responses are cached as immutable, carry a hash-based ETag and answer If-None-Match with 304.
 """
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, JSONResponse
+from email.utils import formatdate
 from pathlib import Path
+from typing import Dict, Optional
 import logging
+import os
+import re
+
+import anyio
+
+from app.services.image_variants import image_variants
+from app.utils.stat_cache import stat_cache
 
 logger = logging.getLogger(__name__)
 
@@ -14,37 +26,114 @@ router = APIRouter(prefix="/api/v1/images", tags=["Images"])
 # Base directory for images
 IMAGE_BASE_DIR = Path("uploads/images")
 
+# "<label>_<timestamp>_<hash8>.<ext>" originals and "<stem>_w<width>.<fmt>" variants
+_HASHED_NAME = re.compile(r"_([0-9a-f]{8,64})(?:_w(\d+))?\.[A-Za-z0-9]+$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MUTABLE_CACHE_CONTROL = "public, max-age=3600"
+
+
+class _ImageFileResponse(FileResponse):
+    """FileResponse that answers 404 (and drops the cached stat) when the file is gone by send time"""
+
+    async def __call__(self, scope, receive, send):
+        try:
+            file = await anyio.open_file(self.path, mode="rb")
+        except OSError:
+            stat_cache.invalidate(self.path)
+            response = JSONResponse(status_code=404, content={"detail": "Image not found"})
+            await response(scope, receive, send)
+            return
+        await file.aclose()
+
+        try:
+            await super().__call__(scope, receive, send)
+        except OSError:
+            # Removed between the check and the read - headers are already sent
+            stat_cache.invalidate(self.path)
+            raise
+
+
+def _cache_headers(path: Path, stat_result: os.stat_result) -> Dict[str, str]:
+    """ETag / Cache-Control / Last-Modified for a stored image"""
+    match = _HASHED_NAME.search(path.name)
+    if match:
+        content_hash, width = match.groups()
+        etag = f'"{content_hash}-{width or "orig"}-{path.suffix.lstrip(".").lower()}"'
+        cache_control = IMMUTABLE_CACHE_CONTROL
+    else:
+        # Legacy names without a hash: fall back to size + mtime and a shorter lifetime
+        etag = f'"{stat_result.st_size:x}-{int(stat_result.st_mtime):x}"'
+        cache_control = MUTABLE_CACHE_CONTROL
+    return {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True)
+    }
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 7232 weak comparison of an If-None-Match header against our ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
 
 @router.get("/{category}/{filename}")
-async def serve_image(category: str, filename: str):
+async def serve_image(
+    category: str,
+    filename: str,
+    request: Request,
+    w: Optional[int] = Query(None, ge=1, le=4096, description="Display width in px - serves the closest downscaled variant")
+):
     """
     Serve an image file
-    
+
     Args:
         category: Image category (management, events, sports, etc.)
         filename: Image filename
-        
+        w: Optional display width; picks a WebP (or JPEG) variant at least this wide
+
     Returns:
-        Image file
+        Image file (or 304 Not Modified when the client's ETag matches)
     """
     try:
         # Construct file path
         file_path = IMAGE_BASE_DIR / category / filename
-        
-        # Check if file exists
-        if not file_path.exists():
+
+        # Check if file exists (stat results are cached in memory)
+        stat_result = stat_cache.stat(file_path)
+        if stat_result is None:
             raise HTTPException(status_code=404, detail=f"Image not found: {category}/{filename}")
-        
-        # Check if it's actually a file (not a directory)
-        if not file_path.is_file():
-            raise HTTPException(status_code=400, detail="Invalid file path")
-        
-        # Return image file
-        return FileResponse(
+
+        vary = None
+        if w:
+            # WebP for clients that accept it, JPEG otherwise
+            accept_webp = "image/webp" in request.headers.get("accept", "")
+            variant = image_variants.pick(category, filename, w, accept_webp, exists=stat_cache.exists)
+            vary = "Accept"
+            if variant is not None:
+                file_path = variant
+                stat_result = stat_cache.stat(variant)
+
+        headers = _cache_headers(file_path, stat_result)
+        if vary:
+            headers["Vary"] = vary
+
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        # Return image file (stat_result given, so FileResponse doesn't stat again)
+        return _ImageFileResponse(
             path=str(file_path),
-            media_type=f"image/{file_path.suffix.lstrip('.')}"
+            media_type=image_variants.media_type(file_path),
+            headers=headers,
+            stat_result=stat_result
         )
-        
+
     except HTTPException:
         raise
     except Exception as e:
@@ -3,7 +3,7 @@ Pydantic schemas for all modules
 Defines request/response models with validation
 """
 from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Generic, TypeVar
 from datetime import datetime
 from enum import Enum
 
@@ -49,6 +49,20 @@ class BaseSchema(BaseModel):
         }
 
 
+class SummarySchema(BaseModel):
+    """
+    Base for lightweight list views (GET /<module>/?fields=summary)
+    
+    Subclasses define the summary field set and document it as the alternative item shape
+    of the list endpoints' PaginatedResponse.
+    """
+    id: Optional[str] = Field(None, alias="_id")
+    created_at: Optional[datetime] = None
+    
+    class Config:
+        populate_by_name = True
+
+
 # ==================== 1. EVENTS ====================
 
 class EventBase(BaseModel):
@@ -81,6 +95,14 @@ class EventResponse(EventBase, BaseSchema):
     pass
 
 
+class EventSummary(SummarySchema):
+    title: str
+    event_type: EventType
+    date: datetime
+    venue: str
+    is_active: bool = True
+
+
 # ==================== 2. PLACEMENTS ====================
 
 class PlacementBase(BaseModel):
@@ -115,6 +137,15 @@ class PlacementResponse(PlacementBase, BaseSchema):
     placement_percentage: float = 0.0
 
 
+class PlacementSummary(SummarySchema):
+    academic_year: str
+    department: Department
+    total_students: int
+    students_placed: int
+    average_package: float
+    highest_package: float
+
+
 # ==================== 3. COMPANY PACKAGES ====================
 
 class CompanyPackageBase(BaseModel):
@@ -149,6 +180,13 @@ class CompanyPackageResponse(CompanyPackageBase, BaseSchema):
     pass
 
 
+class CompanyPackageSummary(SummarySchema):
+    company_name: str
+    academic_year: str
+    package_offered: float
+    role: str
+
+
 # ==================== 4. INTERVIEW QUESTIONS ====================
 
 class InterviewQuestionBase(BaseModel):
@@ -179,6 +217,14 @@ class InterviewQuestionResponse(InterviewQuestionBase, BaseSchema):
     pass
 
 
+class InterviewQuestionSummary(SummarySchema):
+    company_name: str
+    role: str
+    question_category: str
+    question: str
+    difficulty_level: str
+
+
 # ==================== 5. INTERNSHIPS ====================
 
 class InternshipBase(BaseModel):
@@ -213,6 +259,15 @@ class InternshipResponse(InternshipBase, BaseSchema):
     pass
 
 
+class InternshipSummary(SummarySchema):
+    company_name: str
+    role: str
+    stipend: Optional[float] = None
+    location: str
+    application_deadline: datetime
+    is_active: bool = True
+
+
 # ==================== 6. SKILL ROADMAPS ====================
 
 class SkillRoadmapBase(BaseModel):
@@ -245,6 +300,12 @@ class SkillRoadmapResponse(SkillRoadmapBase, BaseSchema):
     pass
 
 
+class SkillRoadmapSummary(SummarySchema):
+    department: Department
+    role_title: str
+    duration: str
+
+
 # ==================== 7. RESUME GUIDES ====================
 
 class ResumeGuideBase(BaseModel):
@@ -275,6 +336,11 @@ class ResumeGuideResponse(ResumeGuideBase, BaseSchema):
     pass
 
 
+class ResumeGuideSummary(SummarySchema):
+    title: str
+    category: str
+
+
 # ==================== 8. CLUBS ====================
 
 class ClubBase(BaseModel):
@@ -309,6 +375,12 @@ class ClubResponse(ClubBase, BaseSchema):
     pass
 
 
+class ClubSummary(SummarySchema):
+    name: str
+    category: str
+    membership_open: bool = True
+
+
 # ==================== 9. SCHOLARSHIPS ====================
 
 class ScholarshipBase(BaseModel):
@@ -343,6 +415,14 @@ class ScholarshipResponse(ScholarshipBase, BaseSchema):
     pass
 
 
+class ScholarshipSummary(SummarySchema):
+    name: str
+    provider: str
+    amount: float
+    application_deadline: datetime
+    is_active: bool = True
+
+
 # ==================== 10. STUDENTS ====================
 
 class StudentBase(BaseModel):
@@ -381,6 +461,14 @@ class StudentResponse(StudentBase, BaseSchema):
     pass
 
 
+class StudentSummary(SummarySchema):
+    name: str
+    roll_number: str
+    department: Department
+    cgpa: float
+    placement_status: PlacementStatus = PlacementStatus.NOT_PLACED
+
+
 # ==================== STUDENT REPORTS ====================
 
 class StudentReportBase(BaseModel):
@@ -436,8 +524,32 @@ class PaginationParams(BaseModel):
     limit: int = Field(10, ge=1, le=100)
 
 
-class PaginatedResponse(BaseModel):
-    total: int
+PageItem = TypeVar("PageItem")
+
+
+class PaginatedResponse(BaseModel, Generic[PageItem]):
+    """List page; list endpoints declare PaginatedResponse[Union[<Module>Response, <Module>Summary]]"""
+    total: int  # Estimated for unfiltered lists, cached briefly for filtered ones
     skip: int
     limit: int
-    data: List[Any]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page; None on the last page
+    data: List[PageItem]
+
+
+# ==================== BULK OPERATIONS ====================
+
+class BulkDeleteRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1)
+
+
+class BulkItemError(BaseModel):
+    index: Optional[int] = None  # Position in the request body
+    line: Optional[int] = None  # Line number in an imported file
+    id: Optional[str] = None
+    error: str
+
+
+class BulkResult(BaseModel):
+    succeeded: int
+    failed: int
+    errors: List[BulkItemError] = []  # First BULK_MAX_REPORTED_ERRORS failures
@@ -5,6 +5,9 @@ Each service handles business logic and database operations
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from app.services.base import BaseCRUDService
+from app.services.cache import cached
+from app.services.name_search import MATCH_AUTO
+from app.services.placement_analytics import placement_analytics, percentage
 from app.database import Collections
 
 
@@ -16,6 +19,7 @@ class EventService(BaseCRUDService):
     def __init__(self):
         super().__init__(Collections.EVENTS)
     
+    @cached(ttl=60)
     async def get_upcoming_events(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get upcoming events"""
         query = {
@@ -37,6 +41,8 @@ class EventService(BaseCRUDService):
 class PlacementService(BaseCRUDService):
     """Service for placement statistics"""
     
+    CHANGE_KEY = "academic_year"  # Placement analytics are rebuilt per academic year
+    
     def __init__(self):
         super().__init__(Collections.PLACEMENTS)
     
@@ -50,10 +56,8 @@ class PlacementService(BaseCRUDService):
         return await self.search({"academic_year": year})
     
     async def calculate_placement_percentage(self, doc: Dict[str, Any]) -> float:
-        """Calculate placement percentage"""
-        total = doc.get("total_students", 0)
-        placed = doc.get("students_placed", 0)
-        return (placed / total * 100) if total > 0 else 0.0
+        """Calculate placement percentage (year/department totals are precomputed in placement_analytics)"""
+        return percentage(doc.get("students_placed", 0), doc.get("total_students", 0))
 
 
 # ==================== 3. COMPANY PACKAGES SERVICE ====================
@@ -61,13 +65,17 @@ class PlacementService(BaseCRUDService):
 class CompanyPackageService(BaseCRUDService):
     """Service for company package details"""
     
+    NAME_KEYS = {"company_name": "company_key"}
+    CHANGE_KEY = "academic_year"
+    
     def __init__(self):
         super().__init__(Collections.COMPANY_PACKAGES)
     
-    async def get_by_company(self, company_name: str) -> List[Dict[str, Any]]:
-        """Get packages by company name"""
-        return await self.search({"company_name": {"$regex": company_name, "$options": "i"}})
+    async def get_by_company(self, company_name: str, match: str = MATCH_AUTO) -> List[Dict[str, Any]]:
+        """Get packages by company name (exact, prefix or fuzzy - see find_by_name)"""
+        return await self.find_by_name("company_name", company_name, match)
     
+    @cached(ttl=300)
     async def get_top_packages(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get top packages"""
         cursor = self.collection.find({}).sort("package_offered", -1).limit(limit)
@@ -85,12 +93,14 @@ class CompanyPackageService(BaseCRUDService):
 class InterviewQuestionService(BaseCRUDService):
     """Service for interview questions"""
     
+    NAME_KEYS = {"company_name": "company_key"}
+    
     def __init__(self):
         super().__init__(Collections.INTERVIEW_QUESTIONS)
     
-    async def get_by_company(self, company_name: str) -> List[Dict[str, Any]]:
-        """Get questions by company"""
-        return await self.search({"company_name": {"$regex": company_name, "$options": "i"}})
+    async def get_by_company(self, company_name: str, match: str = MATCH_AUTO) -> List[Dict[str, Any]]:
+        """Get questions by company (exact, prefix or fuzzy - see find_by_name)"""
+        return await self.find_by_name("company_name", company_name, match)
     
     async def get_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Get questions by category"""
@@ -106,9 +116,12 @@ class InterviewQuestionService(BaseCRUDService):
 class InternshipService(BaseCRUDService):
     """Service for internship opportunities"""
     
+    NAME_KEYS = {"company_name": "company_key"}
+    
     def __init__(self):
         super().__init__(Collections.INTERNSHIPS)
     
+    @cached(ttl=60)
     async def get_active_internships(self) -> List[Dict[str, Any]]:
         """Get active internships"""
         query = {
@@ -120,9 +133,9 @@ class InternshipService(BaseCRUDService):
         from app.models import serialize_doc
         return [serialize_doc(doc) for doc in docs]
     
-    async def get_by_company(self, company_name: str) -> List[Dict[str, Any]]:
-        """Get internships by company"""
-        return await self.search({"company_name": {"$regex": company_name, "$options": "i"}})
+    async def get_by_company(self, company_name: str, match: str = MATCH_AUTO) -> List[Dict[str, Any]]:
+        """Get internships by company (exact, prefix or fuzzy - see find_by_name)"""
+        return await self.find_by_name("company_name", company_name, match)
 
 
 # ==================== 6. SKILL ROADMAPS SERVICE ====================
@@ -130,6 +143,8 @@ class InternshipService(BaseCRUDService):
 class SkillRoadmapService(BaseCRUDService):
     """Service for skill roadmaps"""
     
+    NAME_KEYS = {"role_title": "role_key"}
+    
     def __init__(self):
         super().__init__(Collections.SKILL_ROADMAPS)
     
@@ -137,9 +152,9 @@ class SkillRoadmapService(BaseCRUDService):
         """Get roadmaps by department"""
         return await self.search({"department": department})
     
-    async def get_by_role(self, role: str) -> List[Dict[str, Any]]:
-        """Get roadmap by role title"""
-        return await self.search({"role_title": {"$regex": role, "$options": "i"}})
+    async def get_by_role(self, role: str, match: str = MATCH_AUTO) -> List[Dict[str, Any]]:
+        """Get roadmap by role title (exact, prefix or fuzzy - see find_by_name)"""
+        return await self.find_by_name("role_title", role, match)
 
 
 # ==================== 7. RESUME GUIDES SERVICE ====================
@@ -167,6 +182,7 @@ class ClubService(BaseCRUDService):
         """Get clubs by category"""
         return await self.search({"category": category})
     
+    @cached(ttl=300)
     async def get_open_memberships(self) -> List[Dict[str, Any]]:
         """Get clubs with open membership"""
         return await self.search({"membership_open": True})
@@ -180,6 +196,7 @@ class ScholarshipService(BaseCRUDService):
     def __init__(self):
         super().__init__(Collections.SCHOLARSHIPS)
     
+    @cached(ttl=60)
     async def get_active_scholarships(self) -> List[Dict[str, Any]]:
         """Get active scholarships"""
         query = {
@@ -245,3 +262,10 @@ club_service = ClubService()
 scholarship_service = ScholarshipService()
 student_service = StudentService()
 student_report_service = StudentReportService()
+
+# Services with normalized name keys (backfilled at startup - see BaseCRUDService.backfill_name_keys)
+NAME_KEY_SERVICES = [company_package_service, interview_question_service, internship_service, skill_roadmap_service]
+
+# Keep materialized placement analytics in step with their source collections
+placement_service.on_change(placement_analytics.refresh_years)
+company_package_service.on_change(placement_analytics.refresh_years)
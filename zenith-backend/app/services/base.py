@@ -2,18 +2,89 @@
 Base CRUD service class
 Provides common database operations for all modules
 """
-from typing import Optional, List, Dict, Any, Type
+from typing import Optional, List, Dict, Any, Type, Tuple, Callable, Awaitable, Iterable, Set, AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from motor.motor_asyncio import AsyncIOMotorCollection
 from bson import ObjectId
+from bson.errors import InvalidId
+from datetime import datetime
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+import asyncio
+import base64
+import json
+import logging
+import time
+from app.config import settings
 from app.database import mongodb
 from app.models import serialize_doc, prepare_create_doc, prepare_update_doc
+from app.services.cache import invalidate as invalidate_cache
+from app.services.name_search import (
+    TrigramIndex, normalize_name, prefix_filter, contains_filter, raw_name_filter,
+    MATCH_AUTO, MATCH_EXACT, MATCH_PREFIX, MATCH_CONTAINS
+)
+
+logger = logging.getLogger(__name__)
+
+# Newest first; _id breaks created_at ties so skip and cursor pages agree
+LIST_SORT = [("created_at", -1), ("_id", -1)]
+
+
+def encode_cursor(doc: Dict[str, Any]) -> str:
+    """Opaque cursor pointing just after doc in LIST_SORT order"""
+    created_at = doc.get("created_at")
+    raw = json.dumps(
+        [created_at.isoformat() if isinstance(created_at, datetime) else None, str(doc["_id"])],
+        separators=(",", ":")
+    ).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], ObjectId]:
+    """Decode a cursor produced by encode_cursor (raises ValueError if malformed)"""
+    try:
+        created_at, doc_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return (datetime.fromisoformat(created_at) if created_at else None), ObjectId(doc_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def _after(cursor: str) -> Dict[str, Any]:
+    """Filter for documents after the cursor in LIST_SORT order"""
+    created_at, doc_id = decode_cursor(cursor)
+    if created_at is None:
+        # Documents without created_at sort last; page through them by _id
+        return {"created_at": None, "_id": {"$lt": doc_id}}
+    return {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "_id": {"$lt": doc_id}},
+        {"created_at": None}
+    ]}
+
+
+def _keep_sort_keys(projection: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Make sure an inclusion projection keeps created_at, which next_cursor is built from"""
+    if projection and any(projection.values()):
+        return {**projection, "created_at": 1}
+    return projection
 
 
 class BaseCRUDService:
     """Base class for CRUD operations"""
     
+    # Name field -> normalized lookup key kept in sync on every write (see find_by_name)
+    NAME_KEYS: Dict[str, str] = {}
+    # Field whose values are reported to on_change listeners for every created/updated/deleted document
+    CHANGE_KEY: Optional[str] = None
+    
     def __init__(self, collection_name: str):
         self.collection_name = collection_name
+        self._counts: Dict[str, Tuple[float, int]] = {}  # filter -> (counted at, total)
+        self._name_indexes: Dict[str, Tuple[float, TrigramIndex]] = {}  # key field -> (built at, index)
+        self._change_listeners: List[Callable[[Set[Any]], Awaitable[None]]] = []
+        # Values collected by deferred_changes() in the current task (None when notifying per write)
+        self._deferred: ContextVar[Optional[Set[Any]]] = ContextVar(f"{collection_name}_deferred", default=None)
     
     @property
     def collection(self) -> AsyncIOMotorCollection:
@@ -21,13 +92,199 @@ class BaseCRUDService:
         db = mongodb.get_database()
         return db[self.collection_name]
     
+    def on_change(self, listener: Callable[[Set[Any]], Awaitable[None]]):
+        """
+        Call listener after every write with the CHANGE_KEY values of the documents it touched
+        (before and after the write, so moving a document between values reports both)
+        """
+        self._change_listeners.append(listener)
+    
+    @asynccontextmanager
+    async def deferred_changes(self) -> AsyncIterator[None]:
+        """
+        Hold on_change notifications for writes made inside the block (by this task only)
+        and notify listeners once on exit with every value touched - for imports that
+        write in many batches but only need derived data rebuilt at the end
+        """
+        if self._deferred.get() is not None:
+            yield  # Already deferring - the outer block notifies
+            return
+        
+        values: Set[Any] = set()
+        token = self._deferred.set(values)
+        try:
+            yield
+        finally:
+            self._deferred.reset(token)
+            if values:
+                await self._notify(values)
+    
+    def _tracks_changes(self) -> bool:
+        return bool(self._change_listeners and self.CHANGE_KEY)
+    
+    async def _change_values(self, query: Dict[str, Any]) -> List[Any]:
+        """CHANGE_KEY values of the documents a write is about to touch (empty when nobody listens)"""
+        if not self._tracks_changes():
+            return []
+        return await self.collection.distinct(self.CHANGE_KEY, query)
+    
+    async def _written(self, changed: Iterable[Any] = ()):
+        """
+        Forget cached totals and cached reads (@cached) of this collection after a write,
+        then notify on_change listeners
+        """
+        self._counts.clear()
+        self._name_indexes.clear()
+        await invalidate_cache(self.collection_name)
+        
+        if not self._tracks_changes():
+            return
+        values = {value for value in changed if value is not None}
+        deferred = self._deferred.get()
+        if deferred is not None:
+            deferred.update(values)
+        else:
+            await self._notify(values)
+    
+    async def _notify(self, values: Set[Any]):
+        """Call every on_change listener with the changed CHANGE_KEY values"""
+        for listener in self._change_listeners:
+            try:
+                await listener(values)
+            except Exception as e:
+                logger.warning(f"⚠️ Change listener for {self.collection_name} failed: {e}")
+    
+    def _with_name_keys(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the normalized NAME_KEYS lookup keys for any name fields present in data"""
+        keys = {
+            key_field: normalize_name(str(data[field]))
+            for field, key_field in self.NAME_KEYS.items()
+            if data.get(field) is not None
+        }
+        return {**data, **keys} if keys else data
+    
     async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new document"""
-        doc = prepare_create_doc(data)
+        doc = prepare_create_doc(self._with_name_keys(data))
         result = await self.collection.insert_one(doc)
+        await self._written([doc.get(self.CHANGE_KEY)])
         doc["_id"] = str(result.inserted_id)
         return serialize_doc(doc)
     
+    async def bulk_create(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Insert many documents in one unordered insert_many
+        
+        Unordered, so one bad document (e.g. a duplicate roll number) doesn't stop the rest.
+        
+        Args:
+            items: Validated documents to insert
+        
+        Returns:
+            {"succeeded": inserted count, "errors": [{"index": position in items, "error": message}]}
+        """
+        if not items:
+            return {"succeeded": 0, "errors": []}
+        
+        docs = [prepare_create_doc(self._with_name_keys(item)) for item in items]
+        try:
+            result = await self.collection.insert_many(docs, ordered=False)
+            succeeded, errors = len(result.inserted_ids), []
+        except BulkWriteError as e:
+            succeeded = e.details.get("nInserted", 0)
+            errors = [
+                {"index": err["index"], "error": err.get("errmsg", "Write failed")}
+                for err in e.details.get("writeErrors", [])
+            ]
+        await self._written(doc.get(self.CHANGE_KEY) for doc in docs)
+        return {"succeeded": succeeded, "errors": errors}
+    
+    async def bulk_update(self, updates: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Apply many partial updates in one unordered bulk_write
+        
+        Args:
+            updates: (document ID, fields to set) pairs
+        
+        Returns:
+            {"succeeded": matched count, "errors": [{"index": position in updates, "id": ..., "error": message}]}
+        """
+        errors: List[Dict[str, Any]] = []
+        operations, positions, object_ids = [], [], []
+        for index, (doc_id, fields) in enumerate(updates):
+            try:
+                object_id = ObjectId(doc_id)
+                operations.append(UpdateOne({"_id": object_id}, prepare_update_doc(self._with_name_keys(fields))))
+                positions.append(index)
+                object_ids.append(object_id)
+            except (InvalidId, TypeError):
+                errors.append({"index": index, "id": doc_id, "error": "Invalid ID"})
+        if not operations:
+            return {"succeeded": 0, "errors": errors}
+        
+        changed = await self._change_values({"_id": {"$in": object_ids}})
+        changed += [fields.get(self.CHANGE_KEY) for _, fields in updates]
+        
+        failed = set()
+        try:
+            result = await self.collection.bulk_write(operations, ordered=False)
+            matched = result.matched_count
+        except BulkWriteError as e:
+            matched = e.details.get("nMatched", 0)
+            for err in e.details.get("writeErrors", []):
+                index = positions[err["index"]]
+                failed.add(index)
+                errors.append({"index": index, "id": updates[index][0], "error": err.get("errmsg", "Write failed")})
+        await self._written(changed)
+        
+        if matched + len(failed) < len(operations):
+            # Some IDs matched nothing - look up which (only paid when it happens)
+            ids = [ObjectId(updates[i][0]) for i in positions if i not in failed]
+            found = {str(doc_id) for doc_id in await self.collection.distinct("_id", {"_id": {"$in": ids}})}
+            errors.extend(
+                {"index": i, "id": updates[i][0], "error": "Not found"}
+                for i in positions
+                if i not in failed and updates[i][0] not in found
+            )
+        errors.sort(key=lambda err: err["index"])
+        return {"succeeded": matched, "errors": errors}
+    
+    async def bulk_delete(self, doc_ids: List[str]) -> Dict[str, Any]:
+        """
+        Delete many documents by ID in one delete_many
+        
+        Args:
+            doc_ids: Document IDs
+        
+        Returns:
+            {"succeeded": deleted count, "errors": [{"index": position in doc_ids, "id": ..., "error": message}]}
+        """
+        errors: List[Dict[str, Any]] = []
+        ids = {}
+        for index, doc_id in enumerate(doc_ids):
+            try:
+                ids[index] = ObjectId(doc_id)
+            except (InvalidId, TypeError):
+                errors.append({"index": index, "id": doc_id, "error": "Invalid ID"})
+        if not ids:
+            return {"succeeded": 0, "errors": errors}
+        
+        # Resolve which IDs exist first so missing ones can be reported per item
+        found = set(await self.collection.distinct("_id", {"_id": {"$in": list(ids.values())}}))
+        errors.extend(
+            {"index": index, "id": doc_ids[index], "error": "Not found"}
+            for index, oid in ids.items()
+            if oid not in found
+        )
+        deleted = 0
+        if found:
+            changed = await self._change_values({"_id": {"$in": list(found)}})
+            result = await self.collection.delete_many({"_id": {"$in": list(found)}})
+            deleted = result.deleted_count
+            await self._written(changed)
+        errors.sort(key=lambda err: err["index"])
+        return {"succeeded": deleted, "errors": errors}
+    
     async def get_by_id(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """Get document by ID"""
         doc = await self.collection.find_one({"_id": ObjectId(doc_id)})
@@ -37,14 +294,121 @@ class BaseCRUDService:
         self, 
         skip: int = 0, 
         limit: int = 10,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """Get all documents with pagination"""
+        """Get all documents with pagination (projection limits the fields returned)"""
         query = filters or {}
-        cursor = self.collection.find(query).skip(skip).limit(limit).sort("created_at", -1)
+        cursor = self.collection.find(query, projection).skip(skip).limit(limit).sort(LIST_SORT)
         docs = await cursor.to_list(length=limit)
         return [serialize_doc(doc) for doc in docs]
     
+    async def get_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        projection: Optional[Dict[str, Any]] = None,
+        serialize: bool = True
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of documents, newest first, using keyset pagination
+        
+        Pages after the first seek straight to the cursor on the (created_at, _id) index
+        instead of skipping over every earlier document.
+        
+        Args:
+            cursor: next_cursor from the previous page (None for the first page)
+            limit: Page size
+            filters: Optional query filters
+            skip: Offset for clients that don't send a cursor (ignored with a cursor)
+            projection: Fields to return, e.g. {"name": 1} (None for whole documents)
+            serialize: False returns raw BSON documents (for dumps_bson responses)
+        
+        Returns:
+            (documents, cursor for the next page or None on the last page)
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = filters or {}
+        if cursor:
+            query = {"$and": [query, _after(cursor)]} if query else _after(cursor)
+            skip = 0
+        
+        # One extra document tells us whether another page exists
+        docs = await self.collection.find(query, _keep_sort_keys(projection)).sort(LIST_SORT).skip(skip).limit(limit + 1).to_list(length=limit + 1)
+        next_cursor = encode_cursor(docs[limit - 1]) if len(docs) > limit else None
+        docs = docs[:limit]
+        return ([serialize_doc(doc) for doc in docs] if serialize else docs), next_cursor
+    
+    async def page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        projection: Optional[Dict[str, Any]] = None,
+        serialize: bool = True
+    ) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
+        """
+        One list page and the total, fetched concurrently
+        
+        The page is an indexed find().sort() on (created_at, _id) and the total comes from
+        estimated_count (collection metadata when unfiltered, a cached count_documents otherwise);
+        both requests are in flight at once. A $facet would match the filter once, but its $sort
+        can't use an index, so large filtered lists would be sorted in memory.
+        
+        Args:
+            cursor: next_cursor from the previous page (None for the first page)
+            limit: Page size
+            filters: Optional query filters
+            skip: Offset for clients that don't send a cursor (ignored with a cursor)
+            projection: Fields to return, e.g. {"name": 1} (None for whole documents)
+            serialize: False returns raw BSON documents (for dumps_bson responses)
+        
+        Returns:
+            (documents, total, cursor for the next page or None on the last page)
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        (data, next_cursor), total = await asyncio.gather(
+            self.get_page(cursor=cursor, limit=limit, filters=filters, skip=skip, projection=projection, serialize=serialize),
+            self.estimated_count(filters)
+        )
+        return data, total, next_cursor
+    
+    @staticmethod
+    def _count_key(filters: Dict[str, Any]) -> str:
+        return repr(sorted(filters.items()))
+    
+    def _cached_count(self, filters: Dict[str, Any]) -> Optional[int]:
+        """Cached total for a filter, if counted within COUNT_CACHE_SECONDS"""
+        cached = self._counts.get(self._count_key(filters))
+        if cached and time.monotonic() - cached[0] < settings.COUNT_CACHE_SECONDS:
+            return cached[1]
+        return None
+    
+    async def estimated_count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Total for list responses without counting on every request
+        
+        Unfiltered totals come from collection metadata (estimated_document_count); filtered
+        totals are counted and reused for COUNT_CACHE_SECONDS (cleared on create/delete).
+        """
+        if not filters:
+            return await self.collection.estimated_document_count()
+        
+        cached = self._cached_count(filters)
+        if cached is not None:
+            return cached
+        
+        total = await self.count(filters)
+        self._counts[self._count_key(filters)] = (time.monotonic(), total)
+        return total
+    
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count documents"""
         query = filters or {}
@@ -52,26 +416,142 @@ class BaseCRUDService:
     
     async def update(self, doc_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update document by ID"""
-        update_doc = prepare_update_doc(data)
+        update_doc = prepare_update_doc(self._with_name_keys(data))
+        changed = []
+        if self._tracks_changes() and self.CHANGE_KEY in data:
+            changed = await self._change_values({"_id": ObjectId(doc_id)})  # Value it moves away from
         result = await self.collection.find_one_and_update(
             {"_id": ObjectId(doc_id)},
             update_doc,
             return_document=True
         )
+        await self._written(changed + ([result.get(self.CHANGE_KEY)] if result else []))
         return serialize_doc(result) if result else None
     
     async def delete(self, doc_id: str) -> bool:
         """Delete document by ID"""
+        if self._tracks_changes():
+            deleted_doc = await self.collection.find_one_and_delete(
+                {"_id": ObjectId(doc_id)}, projection={self.CHANGE_KEY: 1}
+            )
+            await self._written([deleted_doc.get(self.CHANGE_KEY)] if deleted_doc else [])
+            return deleted_doc is not None
+        
         result = await self.collection.delete_one({"_id": ObjectId(doc_id)})
+        await self._written()
         return result.deleted_count > 0
     
     async def search(
         self, 
         query: Dict[str, Any], 
         skip: int = 0, 
-        limit: int = 10
+        limit: int = 10,
+        projection: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """Search documents with custom query"""
-        cursor = self.collection.find(query).skip(skip).limit(limit).sort("created_at", -1)
+        """Search documents with custom query (projection limits the fields returned)"""
+        cursor = self.collection.find(query, projection).skip(skip).limit(limit).sort(LIST_SORT)
         docs = await cursor.to_list(length=limit)
         return [serialize_doc(doc) for doc in docs]
+    
+    async def find_by_name(
+        self,
+        field: str,
+        name: str,
+        match: str = MATCH_AUTO,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Look documents up by a NAME_KEYS field without $regex over user input
+        
+        Records without the key (stored before keys existed, or written around the service)
+        are still found by exact, prefix and contains lookups through an escaped case-insensitive
+        match on the raw name; backfill_name_keys runs at startup to keep those rare.
+        
+        Args:
+            field: Name field, e.g. "company_name" (must be in NAME_KEYS)
+            name: Name as typed by the user
+            match: "exact" or "prefix" (indexed lookups on the normalized key), "contains"
+                (substring of the key), "fuzzy" (closest distinct names by trigram similarity),
+                or "auto" (first of those that finds anything)
+            limit: Maximum documents to return
+        
+        Returns:
+            Serialized documents (fuzzy matches ordered by similarity, others newest first)
+        """
+        key_field = self.NAME_KEYS[field]
+        key = normalize_name(name)
+        if not key:
+            return []
+        
+        lookups = (
+            (MATCH_EXACT, key),
+            (MATCH_PREFIX, prefix_filter(key)),
+            (MATCH_CONTAINS, contains_filter(key)),
+        )
+        for mode, condition in lookups:
+            if match not in (MATCH_AUTO, mode):
+                continue
+            docs = await self.search({"$or": [
+                {key_field: condition},
+                {key_field: None, field: raw_name_filter(name, mode)}
+            ]}, limit=limit)
+            if docs or match == mode:
+                return docs
+        
+        index = await self._name_index(key_field)
+        rank = {similar: position for position, (similar, _) in enumerate(index.suggest(key))}
+        if not rank:
+            return []
+        docs = await self.search({key_field: {"$in": list(rank)}}, limit=limit)
+        docs.sort(key=lambda doc: rank.get(doc.get(key_field), len(rank)))
+        return docs
+    
+    async def backfill_name_keys(self, recompute: bool = False, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Set NAME_KEYS lookup keys on records stored without them
+        
+        Args:
+            recompute: Also rewrite keys that exist but differ (after changing normalize_name)
+            dry_run: Only count what would change
+        
+        Returns:
+            Dict of key field -> records updated (or that would be)
+        """
+        if not self.NAME_KEYS or mongodb.get_database() is None:
+            return {}
+        
+        updated: Dict[str, int] = {}
+        for field, key_field in self.NAME_KEYS.items():
+            query = {field: {"$type": "string"}}
+            if not recompute:
+                query[key_field] = {"$exists": False}
+            
+            updated[key_field] = 0
+            batch = []
+            async for doc in self.collection.find(query, {field: 1, key_field: 1}):
+                key = normalize_name(doc[field])
+                if doc.get(key_field) == key:
+                    continue
+                updated[key_field] += 1
+                batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": {key_field: key}}))
+                if len(batch) >= settings.BULK_BATCH_SIZE:
+                    if not dry_run:
+                        await self.collection.bulk_write(batch, ordered=False)
+                    batch = []
+            if batch and not dry_run:
+                await self.collection.bulk_write(batch, ordered=False)
+        
+        if any(updated.values()) and not dry_run:
+            await self._written()
+            logger.info(f"🔤 Name keys added to {self.collection_name}: {updated}")
+        return updated
+    
+    async def _name_index(self, key_field: str) -> TrigramIndex:
+        """Trigram index over the distinct values of a key field (rebuilt after writes or NAME_INDEX_REFRESH_SECONDS)"""
+        cached = self._name_indexes.get(key_field)
+        if cached and time.monotonic() - cached[0] < settings.NAME_INDEX_REFRESH_SECONDS:
+            return cached[1]
+        
+        index = TrigramIndex(await self.collection.distinct(key_field))
+        self._name_indexes[key_field] = (time.monotonic(), index)
+        return index
@@ -0,0 +1,147 @@
+"""
+Read Cache - Read-through cache for hot CRUD reads
+Entries are keyed by collection generation: any write to a collection bumps its generation,
+so every cached read of that collection misses from then on (including reads that were
+already in flight when the write happened). In-process LRU by default; CACHE_BACKEND=redis
+shares entries and generations between uvicorn workers.
+"""
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from collections import OrderedDict
+import functools
+import logging
+import time
+
+import orjson
+
+from app.config import settings
+from app.models import dumps_bson
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "zenith:cache"
+
+
+class MemoryCache:
+    """In-process LRU with per-entry expiry (each worker has its own)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int, str], Tuple[float, bytes]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    async def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    async def get(self, namespace: str, generation: int, key: str) -> Optional[bytes]:
+        entry_key = (namespace, generation, key)
+        entry = self._entries.get(entry_key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[entry_key]
+            return None
+        self._entries.move_to_end(entry_key)
+        return value
+
+    async def set(self, namespace: str, generation: int, key: str, value: bytes, ttl: float):
+        entry_key = (namespace, generation, key)
+        self._entries[entry_key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, namespace: str):
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        # Entries of older generations can't be read any more - free their slots now
+        stale = [entry_key for entry_key in self._entries if entry_key[0] == namespace]
+        for entry_key in stale:
+            del self._entries[entry_key]
+
+
+class RedisCache:
+    """Shared cache in Redis; generations are INCR counters so invalidation reaches every worker"""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url)
+
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        return f"{REDIS_KEY_PREFIX}:gen:{namespace}"
+
+    async def generation(self, namespace: str) -> int:
+        value = await self.client.get(self._generation_key(namespace))
+        return int(value) if value else 0
+
+    async def get(self, namespace: str, generation: int, key: str) -> Optional[bytes]:
+        return await self.client.get(f"{REDIS_KEY_PREFIX}:{namespace}:{generation}:{key}")
+
+    async def set(self, namespace: str, generation: int, key: str, value: bytes, ttl: float):
+        await self.client.set(f"{REDIS_KEY_PREFIX}:{namespace}:{generation}:{key}", value, px=int(ttl * 1000))
+
+    async def invalidate(self, namespace: str):
+        # Old entries expire on their own TTL
+        await self.client.incr(self._generation_key(namespace))
+
+
+def _create_cache():
+    """Backend selected by CACHE_BACKEND (falls back to memory if redis is unavailable)"""
+    if settings.CACHE_BACKEND == "redis":
+        try:
+            cache = RedisCache(settings.REDIS_URL)
+            logger.info(f"🗄️ Read cache: redis ({settings.REDIS_URL})")
+            return cache
+        except ImportError:
+            logger.warning("⚠️ CACHE_BACKEND=redis but the redis package is not installed - using in-process cache")
+    return MemoryCache(settings.CACHE_MAX_ENTRIES)
+
+
+async def invalidate(namespace: str):
+    """Drop every cached read of a collection (never raises)"""
+    try:
+        await read_cache.invalidate(namespace)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not invalidate read cache for {namespace}: {e}")
+
+
+def cached(ttl: float) -> Callable:
+    """
+    Cache a BaseCRUDService read method for ttl seconds, keyed by its arguments
+
+    Results must be JSON-serializable (serialized documents); each hit returns a fresh copy.
+    Cache errors fall back to the database.
+
+    Args:
+        ttl: Seconds an entry stays valid when its collection isn't written to
+    """
+    def decorator(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            if not settings.CACHE_ENABLED:
+                return await method(self, *args, **kwargs)
+
+            namespace = self.collection_name
+            key = f"{method.__name__}:{args!r}:{sorted(kwargs.items())!r}"
+            try:
+                generation = await read_cache.generation(namespace)
+                hit = await read_cache.get(namespace, generation, key)
+            except Exception as e:
+                logger.warning(f"⚠️ Read cache unavailable: {e}")
+                return await method(self, *args, **kwargs)
+            if hit is not None:
+                return orjson.loads(hit)
+
+            result = await method(self, *args, **kwargs)
+            try:
+                await read_cache.set(namespace, generation, key, dumps_bson(result), ttl)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not store read cache entry: {e}")
+            return result
+        return wrapper
+    return decorator
+
+
+# Global instance
+read_cache = _create_cache()
@@ -0,0 +1,352 @@
+"""
+Image Index - In-process image metadata lookups for chat-time image matching
+Images are loaded once at startup and indexed by category and by label token, so matching
+a question to images is a handful of dict lookups instead of a MongoDB query per message.
+
+A token inverted index over label, category and description (sorted term list for prefix
+lookups) serves admin image search without regex collection scans.
+
+Each image also has an embedding of its label and description (image_vectors collection),
+so chat can rank a category's images by cosine similarity to the question embedding.
+
+Workers stay in sync through a version counter document: every write bumps it, and each
+worker reloads when it notices the counter moved (checked at most every few seconds).
+"""
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import defaultdict
+from bisect import bisect_left, insort
+import heapq
+import logging
+import re
+import time
+
+import numpy as np
+
+from app.config import settings
+from app.database import mongodb, Collections
+from app.models.image import ImageMetadata
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+VERSION_DOC_ID = "images"
+
+# Search relevance weight of a term by the field it appears in
+FIELD_WEIGHTS = (("label", 3.0), ("category", 2.0), ("description", 1.0))
+PREFIX_MATCH_FACTOR = 0.5  # "chair" matching "chairman" counts half as much as an exact term
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens ("techfest_2024" -> ["techfest", "2024"])"""
+    return _TOKEN.findall((text or "").lower())
+
+
+def image_text(image: ImageMetadata) -> str:
+    """Text embedded for an image ("chairman_photo" + description -> "chairman photo. <description>")"""
+    label = " ".join(tokenize(image.label))
+    return f"{label}. {image.description}" if image.description else label
+
+
+def record_key(image: ImageMetadata) -> str:
+    """Unique key of an image record (several records may share one content-addressed file)"""
+    return f"{image.category}:{image.label}:{image.relative_path}"
+
+
+def _normalize(embedding) -> np.ndarray:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class ImageIndex:
+    """Category, label-token, search-term and embedding indexes over all stored image metadata"""
+
+    def __init__(self, refresh_seconds: float = settings.IMAGE_INDEX_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self.version: Optional[int] = None
+        self._by_key: Dict[str, ImageMetadata] = {}  # record_key -> image
+        self._by_category: Dict[str, List[ImageMetadata]] = {}
+        self._by_token: Dict[Tuple[str, str], List[ImageMetadata]] = {}
+        self._embeddings: Dict[str, np.ndarray] = {}  # record_key -> unit vector
+        self._vectors: Dict[str, Tuple[List[ImageMetadata], np.ndarray]] = {}  # category -> (images, matrix)
+        self._postings: Dict[str, Dict[str, float]] = {}  # term -> {record_key: field weight}
+        self._terms: List[str] = []  # Sorted, for prefix matching
+        self._uploaded: Dict[str, float] = {}  # record_key -> upload timestamp (search tie-break)
+        self._checked_at = 0.0
+        self.loaded = False
+
+    @staticmethod
+    def _images_collection():
+        db = mongodb.get_database()
+        return None if db is None else db[Collections.IMAGES]
+
+    @staticmethod
+    def _vectors_collection():
+        db = mongodb.get_database()
+        return None if db is None else db[Collections.IMAGE_VECTORS]
+
+    @staticmethod
+    def _versions_collection():
+        db = mongodb.get_database()
+        return None if db is None else db[Collections.CACHE_VERSIONS]
+
+    async def load(self):
+        """(Re)build the index from MongoDB"""
+        images = self._images_collection()
+        if images is None:
+            logger.warning("MongoDB not available - image index is empty")
+            return
+
+        try:
+            version = await self._read_version()
+            docs = await images.find({}, {"_id": 0}).sort("uploaded_at", -1).to_list(length=None)
+            vector_docs = await self._vectors_collection().find({}, {"embedding": 1}).to_list(length=None)
+            embeddings = {doc["_id"]: _normalize(doc["embedding"]) for doc in vector_docs if doc.get("embedding")}
+            self._rebuild((ImageMetadata(**doc) for doc in docs), embeddings)
+            self.version = version
+            self.loaded = True
+            self._checked_at = time.monotonic()
+            logger.info(
+                f"🖼️ Image index loaded: {len(self._by_key)} images in {len(self._by_category)} categories, "
+                f"{len(self._embeddings)} embedded (v{version})"
+            )
+        except Exception as e:
+            logger.error(f"❌ Error loading image index: {e}")
+
+    @staticmethod
+    def _label_tokens(image: ImageMetadata) -> Set[str]:
+        return set(tokenize(image.label))
+
+    @staticmethod
+    def _search_terms(image: ImageMetadata) -> Dict[str, float]:
+        """Search terms of an image with the weight of the best field each appears in"""
+        terms: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS:
+            for term in tokenize(getattr(image, field)):
+                if weight > terms.get(term, 0.0):
+                    terms[term] = weight
+        return terms
+
+    def _rebuild(self, images: Iterable[ImageMetadata], embeddings: Dict[str, np.ndarray]):
+        by_key: Dict[str, ImageMetadata] = {}
+        for image in images:
+            by_key.setdefault(record_key(image), image)
+        embeddings = {key: vector for key, vector in embeddings.items() if key in by_key}
+
+        # Newest first within each category (matches the old find() + "first image" fallback order)
+        ordered = sorted(by_key.values(), key=lambda img: img.uploaded_at, reverse=True)
+        by_category: Dict[str, List[ImageMetadata]] = defaultdict(list)
+        by_token: Dict[Tuple[str, str], List[ImageMetadata]] = defaultdict(list)
+        postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for image in ordered:
+            by_category[image.category].append(image)
+            for token in self._label_tokens(image):
+                by_token[(image.category, token)].append(image)
+            for term, weight in self._search_terms(image).items():
+                postings[term][record_key(image)] = weight
+
+        # One (n, dim) matrix per category: ranking is a single matrix-vector product
+        vectors: Dict[str, Tuple[List[ImageMetadata], np.ndarray]] = {}
+        for category, category_images in by_category.items():
+            embedded = [image for image in category_images if record_key(image) in embeddings]
+            if embedded:
+                vectors[category] = (embedded, np.stack([embeddings[record_key(image)] for image in embedded]))
+
+        # Swap in whole dicts so readers never see a half-built index
+        self._by_key = by_key
+        self._by_category = dict(by_category)
+        self._by_token = dict(by_token)
+        self._embeddings = embeddings
+        self._vectors = vectors
+        self._postings = dict(postings)
+        self._terms = sorted(postings)
+        self._uploaded = {key: image.uploaded_at.timestamp() for key, image in by_key.items()}
+
+    def _insert(self, image: ImageMetadata, embedding: Optional[np.ndarray]):
+        """Add one new (newest) image in place - O(category size) instead of a full rebuild"""
+        key = record_key(image)
+        self._by_key[key] = image
+        self._uploaded[key] = image.uploaded_at.timestamp()
+        self._by_category.setdefault(image.category, []).insert(0, image)
+        for token in self._label_tokens(image):
+            self._by_token.setdefault((image.category, token), []).insert(0, image)
+        for term, weight in self._search_terms(image).items():
+            if term not in self._postings:
+                self._postings[term] = {}
+                insort(self._terms, term)
+            self._postings[term][key] = weight
+
+        if embedding is not None:
+            self._embeddings[key] = embedding
+            images, matrix = self._vectors.get(image.category, ([], None))
+            matrix = embedding[None, :] if matrix is None else np.vstack([embedding, matrix])
+            self._vectors[image.category] = ([image, *images], matrix)
+
+    async def _read_version(self) -> int:
+        versions = self._versions_collection()
+        if versions is None:
+            return 0
+        doc = await versions.find_one({"_id": VERSION_DOC_ID})
+        return doc.get("version", 0) if doc else 0
+
+    async def ensure_fresh(self):
+        """Reload if another worker changed images (checks the version counter every refresh_seconds)"""
+        now = time.monotonic()
+        if now - self._checked_at < self.refresh_seconds:
+            return
+        self._checked_at = now
+        try:
+            if not self.loaded or await self._read_version() != self.version:
+                await self.load()
+        except Exception as e:
+            logger.warning(f"⚠️ Could not check image index version: {e}")
+
+    async def add(self, image: ImageMetadata, embedding: Optional[List[float]] = None):
+        """Index a newly stored image (and its embedding) and tell other workers to reload"""
+        vector = _normalize(embedding) if embedding is not None else None
+        key = record_key(image)
+        if key in self._by_key:
+            # Re-stored record: rebuild so no stale entries survive
+            embeddings = dict(self._embeddings)
+            if vector is not None:
+                embeddings[key] = vector
+            self._rebuild([image, *self._by_key.values()], embeddings)
+        else:
+            self._insert(image, vector)
+        new_version = await self.bump_version()
+        if new_version is not None and self.version is not None and new_version == self.version + 1:
+            # Nobody else wrote in between - we are current
+            self.version = new_version
+
+    async def bump_version(self) -> Optional[int]:
+        """Increment the shared version counter (other workers reload on their next check)"""
+        versions = self._versions_collection()
+        if versions is None:
+            return None
+        try:
+            doc = await versions.find_one_and_update(
+                {"_id": VERSION_DOC_ID},
+                {"$inc": {"version": 1}},
+                upsert=True,
+                return_document=True
+            )
+            return doc.get("version")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not bump image index version: {e}")
+            return None
+
+    def by_category(self, category: str) -> List[ImageMetadata]:
+        """Images in a category, newest first"""
+        return self._by_category.get(category, [])
+
+    def has_vectors(self, category: str) -> bool:
+        """Whether any image in the category has an embedding"""
+        return category in self._vectors
+
+    def rank(
+        self,
+        query_embedding: List[float],
+        category: str,
+        limit: int = 5,
+        min_score: float = 0.0
+    ) -> List[Tuple[ImageMetadata, float]]:
+        """
+        Images in a category ranked by cosine similarity to a query embedding
+
+        Args:
+            query_embedding: Embedding of the user question
+            category: Detected category
+            limit: Maximum images to return
+            min_score: Minimum cosine similarity
+
+        Returns:
+            (image, score) pairs, best first
+        """
+        entry = self._vectors.get(category)
+        if entry is None:
+            return []
+
+        images, matrix = entry
+        scores = matrix @ _normalize(query_embedding)
+        best = np.argsort(-scores)[:limit]
+        return [(images[i], float(scores[i])) for i in best if scores[i] >= min_score]
+
+    def match(self, question: str, category: str, limit: int = 5) -> List[ImageMetadata]:
+        """
+        Images in a category whose label shares a token with the question
+
+        Fallback for categories with no embedded images (stored before label embeddings existed -
+        scripts/backfill_image_embeddings.py embeds them); rank() handles everything else.
+
+        Args:
+            question: User question
+            category: Detected category
+            limit: Maximum images to return
+
+        Returns:
+            Matching images, newest first
+        """
+        tokens = set(tokenize(question))
+        seen: Set[str] = set()
+        matches: List[ImageMetadata] = []
+        for token in tokens:
+            for image in self._by_token.get((category, token), ()):
+                if image.relative_path not in seen:
+                    seen.add(image.relative_path)
+                    matches.append(image)
+
+        matches.sort(key=lambda img: img.uploaded_at, reverse=True)
+        return matches[:limit]
+
+    def search(self, query: str, skip: int = 0, limit: int = 20) -> Tuple[int, List[Tuple[ImageMetadata, float]]]:
+        """
+        Search images by label, category and description terms
+
+        Every query token must match a term exactly or as a prefix ("chair" finds "chairman").
+        Exact matches in the label rank highest; ties go to the newest image.
+
+        Args:
+            query: Search query
+            skip: Results to skip
+            limit: Maximum results to return
+
+        Returns:
+            (total matches, page of (image, score) pairs)
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return 0, []
+
+        scores: Optional[Dict[str, float]] = None
+        for token in tokens:
+            token_scores: Dict[str, float] = {}
+            terms = self._terms
+            for i in range(bisect_left(terms, token), len(terms)):
+                term = terms[i]
+                if not term.startswith(token):
+                    break
+                factor = 1.0 if term == token else PREFIX_MATCH_FACTOR
+                for key, weight in self._postings[term].items():
+                    if scores is None or key in scores:
+                        score = weight * factor
+                        if score > token_scores.get(key, 0.0):
+                            token_scores[key] = score
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {key: scores[key] + score for key, score in token_scores.items()}
+            if not scores:
+                return 0, []
+
+        uploaded = self._uploaded
+        ranked = heapq.nlargest(skip + limit, ((score, uploaded[key], key) for key, score in scores.items()))
+        return len(scores), [(self._by_key[key], score) for score, _, key in ranked[skip:]]
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+
+# Global instance
+image_index = ImageIndex()
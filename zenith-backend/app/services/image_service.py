@@ -2,19 +2,29 @@
 Image Storage Service
 Handle image uploads, storage, and retrieval for MLRIT chatbot
 """
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Set, Tuple
 from pathlib import Path
 from fastapi import UploadFile
-import logging
-from datetime import datetime
+import asyncio
 import hashlib
+import logging
+import os
+import time
+import uuid
 from PIL import Image
-import io
 from app.models.image import ImageMetadata
-from app.database import mongodb
+from app.database import mongodb, Collections
+from app.config import settings
+from app.utils.uploads import save_upload, discard_upload
+from app.utils.stat_cache import stat_cache
+from app.services.image_variants import image_variants, VARIANT_DIR
+from app.services.image_index import image_index, image_text, record_key
 
 logger = logging.getLogger(__name__)
 
+CAS_DIR = "_cas"  # Content-addressed originals live in uploads/images/_cas/
+_EXTENSION_ALIASES = {"jpeg": "jpg"}
+
 
 class ImageStorageService:
     """Service for managing image storage - supports dynamic categories"""
@@ -31,19 +41,62 @@ class ImageStorageService:
         
         logger.info(f"📁 Image storage initialized: {self.base_dir}")
     
-    def _ensure_category_dir(self, category: str) -> Path:
+    @staticmethod
+    def _collection():
+        """Images collection, or None when MongoDB is unavailable"""
+        db = mongodb.get_database()
+        return None if db is None else db[Collections.IMAGES]
+    
+    @property
+    def cas_dir(self) -> Path:
+        """Content-addressed store: one file per distinct image, named by its SHA-256"""
+        cas_dir = self.base_dir / CAS_DIR
+        cas_dir.mkdir(parents=True, exist_ok=True)
+        return cas_dir
+    
+    @staticmethod
+    def content_filename(sha256: str, ext: str) -> str:
+        """Stored filename for image content ("img_<sha256>.<ext>")"""
+        ext = ext.lower().lstrip(".")
+        return f"img_{sha256}.{_EXTENSION_ALIASES.get(ext, ext)}"
+    
+    def relative_path(self, path: Path) -> str:
+        """Path relative to the image base directory, as used in image URLs"""
+        return Path(path).relative_to(self.base_dir).as_posix()
+    
+    def _store_file(self, temp_path: Path, sha256: str, ext: str) -> Tuple[Path, bool]:
+        """Move a fully written temp file into the store, or drop it if the content is already stored"""
+        path = self.cas_dir / self.content_filename(sha256, ext)
+        if path.exists():
+            discard_upload(temp_path)
+            return path, False
+        os.replace(temp_path, path)
+        return path, True
+    
+    def store_bytes(self, data: bytes, ext: str, sha256: Optional[str] = None) -> Tuple[Path, bool]:
         """
-        Ensure category directory exists, create if needed
+        Store image bytes under their content hash (blocking)
         
         Args:
-            category: Category name
+            data: Image bytes
+            ext: File extension (e.g. "png")
+            sha256: Hex digest of data if the caller already has it
             
         Returns:
-            Path to category directory
+            (stored path, True if the file was written / False if identical bytes were already stored)
         """
-        category_dir = self.base_dir / category
-        category_dir.mkdir(parents=True, exist_ok=True)
-        return category_dir
+        sha256 = sha256 or hashlib.sha256(data).hexdigest()
+        path = self.cas_dir / self.content_filename(sha256, ext)
+        if path.exists():
+            return path, False
+        
+        temp_path = self.cas_dir / f".upload-{uuid.uuid4().hex}.part"
+        try:
+            temp_path.write_bytes(data)
+            return self._store_file(temp_path, sha256, ext)
+        except BaseException:
+            discard_upload(temp_path)
+            raise
     
     async def save_image(
         self,
@@ -56,6 +109,9 @@ class ImageStorageService:
         """
         Save uploaded image and store metadata
         
+        The file is stored by content hash, so uploading the same bytes again (under any
+        label or category) reuses the stored file and its variants.
+        
         Args:
             file: Uploaded image file
             category: Image category
@@ -70,49 +126,49 @@ class ImageStorageService:
             # Sanitize category name (no validation - allow any category)
             category = category.strip().lower().replace(' ', '_')
             
-            # Read image bytes
-            image_bytes = await file.read()
+            # Stream the upload into the content store's directory (hashing as it goes)
+            upload = await save_upload(file, self.cas_dir, max_bytes=settings.MAX_IMAGE_UPLOAD_MB * 1024 * 1024)
             
-            # Validate it's an actual image
             try:
-                image = Image.open(io.BytesIO(image_bytes))
-                width, height = image.size
-                img_format = image.format.lower() if image.format else "unknown"
-            except Exception as e:
-                raise ValueError(f"Invalid image file: {e}")
-            
-            # Generate unique filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            hash_suffix = hashlib.md5(image_bytes).hexdigest()[:8]
-            file_ext = Path(file.filename).suffix or f".{img_format}"
-            filename = f"{label}_{timestamp}_{hash_suffix}{file_ext}"
-            
-            # Ensure category directory exists and save
-            category_dir = self._ensure_category_dir(category)
-            file_path = category_dir / filename
+                # Validate it's an actual image (PIL only reads the header here)
+                try:
+                    with Image.open(upload.path) as image:
+                        width, height = image.size
+                        img_format = image.format.lower() if image.format else "unknown"
+                except Exception as e:
+                    raise ValueError(f"Invalid image file: {e}")
+                
+                file_path, created = self._store_file(upload.path, upload.sha256, img_format)
+            except BaseException:
+                discard_upload(upload.path)
+                raise
             
-            with open(file_path, "wb") as f:
-                f.write(image_bytes)
+            # Downscaled variants for ?w= requests (resized on the variant thread pool)
+            if created:
+                variants = await image_variants.generate_async(file_path)
+            else:
+                logger.info(f"♻️ Image content already stored: {file_path.name}")
+                variants = image_variants.existing(file_path, width, height)
             
             # Create metadata
             metadata = ImageMetadata(
-                filename=filename,
+                filename=file_path.name,
                 category=category,
                 label=label,
-                relative_path=f"{category}/{filename}",
+                relative_path=self.relative_path(file_path),
                 width=width,
                 height=height,
                 format=img_format,
                 source=source,
-                description=description
+                description=description,
+                variants=variants,
+                content_hash=upload.sha256,
+                size_bytes=upload.size
             )
             
-            # Store metadata in MongoDB
-            if mongodb.client:
-                await mongodb.db.images.insert_one(metadata.dict())
-                logger.info(f"✅ Saved image metadata to MongoDB: {label}")
+            await self.save_metadata(metadata)
             
-            logger.info(f"✅ Saved image: {filename} ({width}x{height}px) | Category: {category} | Label: {label}")
+            logger.info(f"✅ Saved image: {file_path.name} ({width}x{height}px) | Category: {category} | Label: {label}")
             
             return metadata
             
@@ -120,9 +176,65 @@ class ImageStorageService:
             logger.error(f"❌ Error saving image: {e}")
             raise
     
+    async def save_metadata(self, metadata: ImageMetadata) -> bool:
+        """
+        Store image metadata in MongoDB and the in-process image index
+        
+        Args:
+            metadata: Metadata of a stored image
+            
+        Returns:
+            False if the same file was already recorded under this category and label
+        """
+        images = self._collection()
+        if images is not None:
+            duplicate = await images.find_one(
+                {"relative_path": metadata.relative_path, "category": metadata.category, "label": metadata.label},
+                {"_id": 1}
+            )
+            if duplicate:
+                logger.info(f"♻️ Image already recorded: {metadata.category}/{metadata.label}")
+                return False
+            
+            await images.insert_one(metadata.dict())
+            logger.info(f"✅ Saved image metadata to MongoDB: {metadata.label}")
+        
+        embedding = await self._embed(metadata)
+        await image_index.add(metadata, embedding)
+        return True
+    
+    async def _embed(self, metadata: ImageMetadata) -> Optional[List[float]]:
+        """
+        Embed an image's label and description and store the vector (never raises)
+        
+        Args:
+            metadata: Metadata of a stored image
+            
+        Returns:
+            Embedding, or None if it could not be generated
+        """
+        # Imported here so scripts using the image service don't load the embedding model
+        from app.rag.embeddings import embedding_service
+        
+        text = image_text(metadata)
+        try:
+            embedding = await asyncio.to_thread(embedding_service.generate_embedding, text)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not embed image {metadata.relative_path}: {e}")
+            return None
+        
+        db = mongodb.get_database()
+        if db is not None:
+            await db[Collections.IMAGE_VECTORS].update_one(
+                {"_id": record_key(metadata)},
+                {"$set": {"category": metadata.category, "text": text, "embedding": embedding}},
+                upsert=True
+            )
+        return embedding
+    
     async def get_images_by_category(self, category: str) -> List[ImageMetadata]:
         """
-        Get all images for a specific category
+        Get all images for a specific category (newest first, from the image index)
         
         Args:
             category: Category name
@@ -130,12 +242,17 @@ class ImageStorageService:
         Returns:
             List of ImageMetadata objects
         """
+        await image_index.ensure_fresh()
+        if image_index.loaded:
+            return list(image_index.by_category(category))
+        
         try:
-            if not mongodb.client:
+            images_collection = self._collection()
+            if images_collection is None:
                 logger.warning("MongoDB not available")
                 return []
             
-            cursor = mongodb.db.images.find({"category": category})
+            cursor = images_collection.find({"category": category}).sort("uploaded_at", -1)
             images = []
             
             async for doc in cursor:
@@ -160,7 +277,8 @@ class ImageStorageService:
             ImageMetadata object or None
         """
         try:
-            if not mongodb.client:
+            images = self._collection()
+            if images is None:
                 logger.warning("MongoDB not available")
                 return None
             
@@ -169,7 +287,7 @@ class ImageStorageService:
                 query["category"] = category
             
             # Get most recent image with this label
-            doc = await mongodb.db.images.find_one(
+            doc = await images.find_one(
                 query,
                 sort=[("uploaded_at", -1)]
             )
@@ -184,55 +302,160 @@ class ImageStorageService:
             logger.error(f"❌ Error retrieving image by label: {e}")
             return None
     
-    async def search_images(self, query: str) -> List[ImageMetadata]:
+    async def search_images(self, query: str, skip: int = 0, limit: int = 20) -> Tuple[int, List[ImageMetadata]]:
         """
         Search images by label, description, or category
         
+        Served from the image index's term index (prefix matching, best matches first)
+        instead of unanchored $regex scans over the collection.
+        
         Args:
             query: Search query
+            skip: Results to skip
+            limit: Maximum results to return
             
         Returns:
-            List of matching ImageMetadata objects
+            (total matches, page of matching ImageMetadata objects)
         """
-        try:
-            if not mongodb.client:
-                logger.warning("MongoDB not available")
-                return []
-            
-            # Search in label, description, and category fields
-            search_query = {
-                "$or": [
-                    {"label": {"$regex": query, "$options": "i"}},
-                    {"description": {"$regex": query, "$options": "i"}},
-                    {"category": {"$regex": query, "$options": "i"}}
-                ]
-            }
-            
-            cursor = mongodb.db.images.find(search_query)
-            images = []
-            
-            async for doc in cursor:
-                doc.pop("_id", None)
-                images.append(ImageMetadata(**doc))
+        await image_index.ensure_fresh()
+        total, results = image_index.search(query, skip=skip, limit=limit)
+        return total, [image for image, _ in results]
+    
+    async def referenced_paths(self) -> Optional[Set[str]]:
+        """Relative paths of every file referenced by an image record (None if MongoDB is unavailable)"""
+        images = self._collection()
+        if images is None:
+            return None
+        return set(await images.distinct("relative_path"))
+    
+    def _scan_files(self) -> List[Dict[str, Any]]:
+        """Every stored original and variant with its size, age and owning original (blocking)"""
+        files = []
+        for folder in self.base_dir.iterdir():
+            if not folder.is_dir():
+                continue
+            for path in folder.iterdir():
+                if not path.is_file() or path.name.startswith(".upload-"):
+                    continue
+                stat = path.stat()
+                files.append({
+                    "relative_path": self.relative_path(path),
+                    "folder": folder.name,
+                    "stem": path.stem,
+                    "variant": False,
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime
+                })
             
-            return images
+            variant_dir = folder / VARIANT_DIR
+            if variant_dir.is_dir():
+                for path in variant_dir.iterdir():
+                    if not path.is_file():
+                        continue
+                    stat = path.stat()
+                    files.append({
+                        "relative_path": self.relative_path(path),
+                        "folder": folder.name,
+                        "stem": path.stem.rsplit("_w", 1)[0],  # Stem of the original it was made from
+                        "variant": True,
+                        "size": stat.st_size,
+                        "mtime": stat.st_mtime
+                    })
+        return files
+    
+    @staticmethod
+    def _unreferenced(files: List[Dict[str, Any]], referenced: Set[str]) -> List[Dict[str, Any]]:
+        """Originals no record points to, plus variants of originals that are not referenced"""
+        referenced_stems = {(Path(p).parent.as_posix(), Path(p).stem) for p in referenced}
+        unreferenced = []
+        for entry in files:
+            if entry["variant"]:
+                if (entry["folder"], entry["stem"]) not in referenced_stems:
+                    unreferenced.append(entry)
+            elif entry["relative_path"] not in referenced:
+                unreferenced.append(entry)
+        return unreferenced
+    
+    async def storage_report(self) -> Dict[str, Any]:
+        """
+        Disk usage of stored images
+        
+        Returns:
+            Dict with totals for originals, variants, content-addressed and legacy files,
+            per-folder bytes, and unreferenced files (None when MongoDB is unavailable)
+        """
+        files = await asyncio.to_thread(self._scan_files)
+        referenced = await self.referenced_paths()
+        
+        def totals(entries):
+            return {"files": len(entries), "bytes": sum(e["size"] for e in entries)}
+        
+        originals = [e for e in files if not e["variant"]]
+        by_folder: Dict[str, int] = {}
+        for entry in files:
+            by_folder[entry["folder"]] = by_folder.get(entry["folder"], 0) + entry["size"]
+        
+        return {
+            "total": totals(files),
+            "originals": totals(originals),
+            "variants": totals([e for e in files if e["variant"]]),
+            "content_addressed": totals([e for e in originals if e["folder"] == CAS_DIR]),
+            "legacy": totals([e for e in originals if e["folder"] != CAS_DIR]),
+            "by_folder": dict(sorted(by_folder.items(), key=lambda item: item[1], reverse=True)),
+            "referenced_files": None if referenced is None else len(referenced),
+            "unreferenced": None if referenced is None else totals(self._unreferenced(files, referenced))
+        }
+    
+    async def collect_garbage(self, dry_run: bool = True, min_age_seconds: float = 3600) -> Dict[str, Any]:
+        """
+        Delete stored files that no image record references
+        
+        Args:
+            dry_run: Only report what would be deleted
+            min_age_seconds: Skip files newer than this (their record may still be being written)
             
-        except Exception as e:
-            logger.error(f"❌ Error searching images: {e}")
-            return []
+        Returns:
+            Dict with removed relative paths, file count and bytes
+        """
+        referenced = await self.referenced_paths()
+        if referenced is None:
+            raise RuntimeError("MongoDB not available - cannot tell which images are referenced")
+        
+        files = await asyncio.to_thread(self._scan_files)
+        cutoff = time.time() - min_age_seconds
+        garbage = [e for e in self._unreferenced(files, referenced) if e["mtime"] < cutoff]
+        
+        if not dry_run:
+            for entry in garbage:
+                try:
+                    (self.base_dir / entry["relative_path"]).unlink()
+                except FileNotFoundError:
+                    pass
+            # The image router caches stats; don't keep serving headers for removed files
+            stat_cache.invalidate_many(self.base_dir / entry["relative_path"] for entry in garbage)
+            logger.info(f"🗑️ Removed {len(garbage)} unreferenced image files")
+        
+        return {
+            "dry_run": dry_run,
+            "files": len(garbage),
+            "bytes": sum(e["size"] for e in garbage),
+            "removed": [e["relative_path"] for e in garbage]
+        }
     
-    def get_image_url(self, relative_path: str, base_url: str = "http://localhost:8000") -> str:
+    def get_image_url(self, relative_path: str, base_url: str = "http://localhost:8000", width: Optional[int] = None) -> str:
         """
         Get full URL for an image
         
         Args:
             relative_path: Relative path (e.g., "management/chairman_20231210_abc123.jpg")
             base_url: Base URL of the API
+            width: Optional display width - the server picks a downscaled variant
             
         Returns:
             Full image URL
         """
-        return f"{base_url}/api/v1/images/{relative_path}"
+        url = f"{base_url}/api/v1/images/{relative_path}"
+        return f"{url}?w={width}" if width else url
 
 
 # Global instance
@@ -0,0 +1,184 @@
+"""
+Image Variant Service
+Generate downscaled WebP/JPEG variants of stored images so clients can fetch the size they display
+"""
+from typing import Callable, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+import asyncio
+import logging
+
+from PIL import Image
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+VARIANT_DIR = "_variants"  # Sub-folder of each category directory
+WEBP = "webp"
+JPEG = "jpg"
+
+_MEDIA_TYPES = {WEBP: "image/webp", JPEG: "image/jpeg"}
+
+
+class ImageVariantService:
+    """Creates and resolves responsive image variants (one WebP + one JPEG per width)"""
+
+    def __init__(self, base_dir: str = "uploads/images", widths: Optional[List[int]] = None):
+        """
+        Initialize variant service
+
+        Args:
+            base_dir: Base directory for image storage
+            widths: Variant widths in pixels (defaults to IMAGE_VARIANT_WIDTHS)
+        """
+        self.base_dir = Path(base_dir)
+        self.widths = sorted(widths or settings.image_variant_widths)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool for resizing (PIL releases the GIL while encoding)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.IMAGE_VARIANT_WORKERS,
+                thread_name_prefix="image-variants"
+            )
+        return self._executor
+
+    def variant_path(self, category: str, filename: str, width: int, fmt: str) -> Path:
+        """Path of one variant of an image"""
+        return self.base_dir / category / VARIANT_DIR / f"{Path(filename).stem}_w{width}.{fmt}"
+
+    def generate(self, image_path: Path) -> List[Dict]:
+        """
+        Create every variant narrower than the original (blocking)
+
+        Args:
+            image_path: Stored original, uploads/images/<category>/<filename>
+
+        Returns:
+            List of {width, height, format, relative_path, size_bytes}
+        """
+        image_path = Path(image_path)
+        category = image_path.parent.name
+        variants = []
+
+        with Image.open(image_path) as original:
+            original.load()
+            if original.mode not in ("RGB", "RGBA"):
+                original = original.convert("RGBA" if "transparency" in original.info else "RGB")
+
+            for width in self.widths:
+                if width >= original.width:
+                    break
+
+                height = max(1, round(original.height * width / original.width))
+                resized = original.resize((width, height), Image.LANCZOS)
+                out_dir = image_path.parent / VARIANT_DIR
+                out_dir.mkdir(parents=True, exist_ok=True)
+
+                # WebP keeps alpha; JPEG needs a flattened background
+                webp_path = self.variant_path(category, image_path.name, width, WEBP)
+                resized.save(webp_path, "WEBP", quality=settings.IMAGE_VARIANT_QUALITY, method=4)
+
+                flat = resized
+                if resized.mode == "RGBA":
+                    flat = Image.new("RGB", resized.size, (255, 255, 255))
+                    flat.paste(resized, mask=resized.split()[-1])
+                jpeg_path = self.variant_path(category, image_path.name, width, JPEG)
+                flat.save(jpeg_path, "JPEG", quality=settings.IMAGE_VARIANT_QUALITY, optimize=True, progressive=True)
+
+                for fmt, path in ((WEBP, webp_path), (JPEG, jpeg_path)):
+                    variants.append({
+                        "width": width,
+                        "height": height,
+                        "format": fmt,
+                        "relative_path": f"{category}/{VARIANT_DIR}/{path.name}",
+                        "size_bytes": path.stat().st_size
+                    })
+
+        logger.info(f"🖼️ Generated {len(variants)} variants for {image_path.name}")
+        return variants
+
+    def existing(self, image_path: Path, width: int, height: int) -> List[Dict]:
+        """
+        Describe variants already on disk (for deduplicated uploads of a stored original)
+
+        Args:
+            image_path: Stored original
+            width: Original width in pixels
+            height: Original height in pixels
+
+        Returns:
+            List of {width, height, format, relative_path, size_bytes}, like generate()
+        """
+        image_path = Path(image_path)
+        category = image_path.parent.name
+        variants = []
+        for variant_width in self.widths:
+            if variant_width >= width:
+                break
+            for fmt in (WEBP, JPEG):
+                path = self.variant_path(category, image_path.name, variant_width, fmt)
+                if path.is_file():
+                    variants.append({
+                        "width": variant_width,
+                        "height": max(1, round(height * variant_width / width)),
+                        "format": fmt,
+                        "relative_path": f"{category}/{VARIANT_DIR}/{path.name}",
+                        "size_bytes": path.stat().st_size
+                    })
+        return variants
+
+    def submit(self, image_path: Path) -> Future:
+        """Queue variant generation on the thread pool"""
+        return self.executor.submit(self.generate, image_path)
+
+    async def generate_async(self, image_path: Path) -> List[Dict]:
+        """Generate variants on the thread pool without blocking the event loop (never raises)"""
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self.generate, image_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not generate variants for {image_path}: {e}")
+            return []
+
+    def pick(
+        self,
+        category: str,
+        filename: str,
+        width: int,
+        accept_webp: bool,
+        exists: Callable[[Path], bool] = Path.is_file
+    ) -> Optional[Path]:
+        """
+        Choose the smallest variant at least `width` pixels wide
+
+        Args:
+            category: Image category
+            filename: Original filename
+            width: Requested display width
+            accept_webp: Whether the client accepts WebP
+            exists: File existence check (the image router passes its stat cache)
+
+        Returns:
+            Variant path, or None to serve the original
+        """
+        fmt = WEBP if accept_webp else JPEG
+        for candidate in self.widths:
+            if candidate >= width:
+                path = self.variant_path(category, filename, candidate, fmt)
+                # Variants stop below the original width - then the original is the best fit
+                return path if exists(path) else None
+        return None
+
+    @staticmethod
+    def media_type(path: Path) -> str:
+        """Content type for a stored image or variant"""
+        ext = path.suffix.lstrip(".").lower()
+        return _MEDIA_TYPES.get(ext, f"image/{ext}")
+
+
+# Global instance
+image_variants = ImageVariantService()
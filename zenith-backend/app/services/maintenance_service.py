@@ -0,0 +1,201 @@
+"""
+Maintenance Service
+Bulk Pinecone maintenance (clearing namespaces) run concurrently as background jobs
+
+A job runs in the worker that started it; its progress is also written to the maintenance_jobs
+collection so status lookups answered by any uvicorn worker see it.
+"""
+from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime
+import asyncio
+import logging
+import uuid
+
+from pymongo import DESCENDING
+
+from app.config import settings
+from app.database import mongodb, pinecone_db, Collections
+from app.utils.namespaces import delete_namespaces
+
+logger = logging.getLogger(__name__)
+
+# Job / namespace states
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+MAX_FINISHED_JOBS = 50  # Finished jobs kept for status lookups
+
+
+def _job_document(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Job as stored in MongoDB (namespaces as a list - "" is not a usable field name)"""
+    return {
+        **{key: value for key, value in job.items() if key != "namespaces"},
+        "_id": job["job_id"],
+        "namespaces": [{"name": ns, **state} for ns, state in job["namespaces"].items()]
+    }
+
+
+def _job_from_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of _job_document"""
+    job = {key: value for key, value in doc.items() if key != "_id"}
+    job["namespaces"] = {
+        entry["name"]: {key: value for key, value in entry.items() if key != "name"}
+        for entry in doc.get("namespaces", [])
+    }
+    return job
+
+
+class MaintenanceService:
+    """Runs namespace maintenance in the background and tracks job progress (memory + MongoDB)"""
+
+    def __init__(self, concurrency: int = settings.MAINTENANCE_CONCURRENCY):
+        self.concurrency = concurrency
+        self.jobs: Dict[str, Dict[str, Any]] = {}  # Jobs started by this worker
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def _collection():
+        """Jobs collection, or None when MongoDB is unavailable"""
+        db = mongodb.get_database()
+        return None if db is None else db[Collections.MAINTENANCE_JOBS]
+
+    async def _save(self, job: Dict[str, Any]):
+        """Write the job's current state to MongoDB (best effort - status lookups fall back to memory)"""
+        collection = self._collection()
+        if collection is None:
+            return
+        try:
+            await collection.replace_one({"_id": job["job_id"]}, _job_document(job), upsert=True)
+        except Exception as e:
+            logger.warning(f"⚠️ Maintenance job {job['job_id']} not saved: {e}")
+
+    def start_clear_namespaces(
+        self,
+        namespaces: List[str],
+        on_complete: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Start clearing namespaces in the background
+
+        Args:
+            namespaces: Namespaces to clear
+            on_complete: Optional coroutine function awaited with the finished job
+                (e.g. to clear MongoDB collections once Pinecone is empty)
+
+        Returns:
+            The new job (poll get_job for progress)
+        """
+        job_id = str(uuid.uuid4())
+        job = {
+            "job_id": job_id,
+            "type": "clear_namespaces",
+            "status": PENDING,
+            "total": len(namespaces),
+            "completed": 0,
+            "failed": 0,
+            "namespaces": {ns: {"status": PENDING, "error": None} for ns in namespaces},
+            "created_at": datetime.utcnow(),
+            "started_at": None,
+            "finished_at": None,
+            "error": None
+        }
+        self.jobs[job_id] = job
+        self._tasks[job_id] = asyncio.create_task(self._run_clear(job, on_complete))
+        self._prune()
+        logger.info(f"🧹 Started job {job_id}: clearing {len(namespaces)} namespaces")
+        return job
+
+    async def _run_clear(self, job: Dict[str, Any], on_complete):
+        job["status"] = RUNNING
+        job["started_at"] = datetime.utcnow()
+        for entry in job["namespaces"].values():
+            entry["status"] = RUNNING
+        await self._save(job)
+        loop = asyncio.get_running_loop()
+        saves = []  # Progress writes scheduled from the delete threads
+
+        def progress(namespace: str, error: Optional[Exception]):
+            # Called from the worker thread as each namespace finishes
+            entry = job["namespaces"][namespace]
+            if error is None:
+                entry["status"] = COMPLETED
+                job["completed"] += 1
+                logger.info(f"✅ Cleared namespace: {namespace or 'default'}")
+            else:
+                entry["status"] = FAILED
+                entry["error"] = str(error)
+                job["failed"] += 1
+                logger.warning(f"Could not clear namespace {namespace}: {error}")
+            saves.append(asyncio.run_coroutine_threadsafe(self._save(job), loop))
+
+        try:
+            index = pinecone_db.get_index()
+            await asyncio.to_thread(
+                delete_namespaces,
+                index,
+                list(job["namespaces"].keys()),
+                self.concurrency,
+                progress
+            )
+
+            # Keep the vector manifest in line with what was actually cleared
+            # (imported here so loading this service doesn't load the embedding model)
+            from app.rag.manifest import vector_manifest
+            for namespace, entry in job["namespaces"].items():
+                if entry["status"] == COMPLETED:
+                    await vector_manifest.clear(namespace)
+
+            if on_complete:
+                await on_complete(job)
+
+            job["status"] = FAILED if job["failed"] else COMPLETED
+        except Exception as e:
+            logger.error(f"❌ Maintenance job {job['job_id']} failed: {e}")
+            job["status"] = FAILED
+            job["error"] = str(e)
+            for entry in job["namespaces"].values():
+                if entry["status"] == RUNNING:
+                    entry["status"] = FAILED
+        finally:
+            job["finished_at"] = datetime.utcnow()
+            self._tasks.pop(job["job_id"], None)
+            # Let progress writes land first so they can't overwrite the final state
+            await asyncio.gather(*(asyncio.wrap_future(save) for save in saves), return_exceptions=True)
+            await self._save(job)
+            logger.info(f"🧹 Job {job['job_id']} {job['status']}: {job['completed']}/{job['total']} namespaces cleared")
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by ID (started by this worker or, via MongoDB, by another one)"""
+        job = self.jobs.get(job_id)
+        if job is not None:
+            return job
+        collection = self._collection()
+        if collection is None:
+            return None
+        doc = await collection.find_one({"_id": job_id})
+        return None if doc is None else _job_from_document(doc)
+
+    async def list_jobs(self) -> List[Dict[str, Any]]:
+        """Recent jobs from every worker, newest first"""
+        jobs = dict(self.jobs)
+        collection = self._collection()
+        if collection is not None:
+            docs = await collection.find({}).sort("created_at", DESCENDING).limit(MAX_FINISHED_JOBS).to_list(length=None)
+            for doc in docs:
+                jobs.setdefault(doc["_id"], _job_from_document(doc))
+        return sorted(jobs.values(), key=lambda j: j["created_at"], reverse=True)
+
+    def _prune(self):
+        """Forget the oldest finished jobs held in memory (MongoDB expires them by TTL index)"""
+        finished = sorted(
+            (j for j in self.jobs.values() if j["finished_at"] is not None),
+            key=lambda j: j["created_at"], reverse=True
+        )
+        for job in finished[MAX_FINISHED_JOBS:]:
+            self.jobs.pop(job["job_id"], None)
+
+
+# Global instance
+maintenance_service = MaintenanceService()
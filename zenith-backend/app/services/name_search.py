@@ -0,0 +1,108 @@
+"""
+Name Search - Normalized name keys and a trigram index for fuzzy name lookups
+Company names and role titles are stored with a normalized key (company_key, role_key) so exact
+and prefix lookups are indexed equality/range scans instead of unanchored case-insensitive $regex
+(which can't use an index and lets user input inject patterns). Substring matches scan the key
+index with the escaped key, and fuzzy matching comes from a small in-memory trigram index over
+the distinct keys of a collection.
+"""
+from typing import Dict, Iterable, List, Set, Tuple
+import re
+import unicodedata
+
+MATCH_AUTO = "auto"  # exact, then prefix, then contains, then fuzzy - whichever finds something first
+MATCH_EXACT = "exact"
+MATCH_PREFIX = "prefix"
+MATCH_CONTAINS = "contains"
+MATCH_FUZZY = "fuzzy"
+MATCH_MODES = (MATCH_AUTO, MATCH_EXACT, MATCH_PREFIX, MATCH_CONTAINS, MATCH_FUZZY)
+
+FUZZY_MIN_SIMILARITY = 0.3  # Trigram Jaccard similarity
+FUZZY_MAX_KEYS = 5  # Closest distinct names looked up per fuzzy query
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(text: str) -> str:
+    """
+    Lookup key for a name: lowercase ASCII letters and digits separated by single spaces
+
+    "Tata Consultancy Services (TCS)" -> "tata consultancy services tcs", "Zoho  Corp." -> "zoho corp"
+    """
+    ascii_text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii")
+    return _NON_ALNUM.sub(" ", ascii_text.lower()).strip()
+
+
+def prefix_filter(key: str) -> Dict[str, str]:
+    """Anchored, case-sensitive prefix match on a normalized key (served as an index range scan)"""
+    return {"$regex": f"^{re.escape(key)}"}
+
+
+def contains_filter(key: str) -> Dict[str, str]:
+    """Unanchored match on a normalized key (scans index keys only, never documents)"""
+    return {"$regex": re.escape(key)}
+
+
+def raw_name_filter(name: str, match: str) -> Dict[str, str]:
+    """
+    Case-insensitive match on the raw name field, for records stored without a normalized key
+
+    User input is escaped, so it is only ever matched literally.
+    """
+    pattern = re.escape(name.strip())
+    if match == MATCH_EXACT:
+        pattern = f"^{pattern}$"
+    elif match == MATCH_PREFIX:
+        pattern = f"^{pattern}"
+    return {"$regex": pattern, "$options": "i"}
+
+
+def trigrams(key: str) -> Set[str]:
+    """Character trigrams of a normalized key, padded so short names and word starts count"""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Inverted index from trigram to the names containing it"""
+
+    def __init__(self, keys: Iterable[str]):
+        self.keys: List[str] = sorted({key for key in keys if key})
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        for position, key in enumerate(self.keys):
+            grams = trigrams(key)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def suggest(
+        self,
+        text: str,
+        limit: int = FUZZY_MAX_KEYS,
+        min_similarity: float = FUZZY_MIN_SIMILARITY
+    ) -> List[Tuple[str, float]]:
+        """
+        Names most similar to text
+
+        Args:
+            text: Name as typed (normalized here)
+            limit: Maximum names to return
+            min_similarity: Minimum Jaccard similarity of the trigram sets
+
+        Returns:
+            (normalized key, similarity) pairs, most similar first
+        """
+        grams = trigrams(normalize_name(text))
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+
+        scored = []
+        for position, count in shared.items():
+            similarity = count / (len(grams) + self._sizes[position] - count)
+            if similarity >= min_similarity:
+                scored.append((self.keys[position], similarity))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
@@ -0,0 +1,254 @@
+"""
+Placement Analytics - Materialized year × department × company placement statistics
+One document per academic year in placement_analytics, rebuilt from that year's placement and
+company package records whenever one of them changes (see BaseCRUDService.on_change), so the
+analytics endpoints are a single _id lookup instead of a scan and per-row Python arithmetic.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from datetime import datetime
+import logging
+
+from app.database import mongodb, Collections
+from app.services.name_search import normalize_name
+from app.utils import calculate_percentage
+
+logger = logging.getLogger(__name__)
+
+# Fields read when rebuilding a year
+PLACEMENT_FIELDS = {
+    "_id": 0, "department": 1, "total_students": 1, "students_placed": 1,
+    "students_higher_studies": 1, "average_package": 1, "highest_package": 1,
+    "lowest_package": 1, "companies_visited": 1
+}
+PACKAGE_FIELDS = {
+    "_id": 0, "company_name": 1, "company_key": 1, "package_offered": 1,
+    "role": 1, "departments_allowed": 1, "students_selected": 1
+}
+
+
+def percentage(part: float, total: float) -> float:
+    """Percentage rounded to 2 decimals (0 when total is 0)"""
+    return round(calculate_percentage(part or 0, total or 0), 2)
+
+
+def package_stats(offers: Iterable[Tuple[float, int]]) -> Dict[str, Any]:
+    """
+    Package statistics over individual offers
+
+    Args:
+        offers: (package, students selected) pairs - each selected student is one offer
+
+    Returns:
+        {offers, average_package, median_package, highest_package, lowest_package}
+        (packages are None when there are no offers)
+    """
+    weighted = sorted((float(package), int(count)) for package, count in offers if package and count and count > 0)
+    total = sum(count for _, count in weighted)
+    if not total:
+        return {"offers": 0, "average_package": None, "median_package": None,
+                "highest_package": None, "lowest_package": None}
+
+    def nth(n: int) -> float:
+        """n-th offer (0-based) in package order, without expanding the counts"""
+        seen = 0
+        for package, count in weighted:
+            seen += count
+            if n < seen:
+                return package
+        return weighted[-1][0]
+
+    median = nth(total // 2) if total % 2 else (nth(total // 2 - 1) + nth(total // 2)) / 2
+    return {
+        "offers": total,
+        "average_package": round(sum(package * count for package, count in weighted) / total, 2),
+        "median_package": round(median, 2),
+        "highest_package": weighted[-1][0],
+        "lowest_package": weighted[0][0]
+    }
+
+
+def build_year(year: str, placements: List[Dict[str, Any]], packages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Analytics document for one academic year
+
+    Args:
+        year: Academic year, e.g. "2023-2024"
+        placements: That year's placement records (one per department, summed if there are more)
+        packages: That year's company package records
+
+    Returns:
+        {_id: year, summary, departments: {dept: ...}, companies: {company_key: ...}, updated_at}
+    """
+    departments: Dict[str, Dict[str, Any]] = {}
+    for row in placements:
+        dept = departments.setdefault(row.get("department"), {
+            "total_students": 0, "students_placed": 0, "students_higher_studies": 0,
+            "companies_visited": 0, "_package_sum": 0.0,
+            "highest_package": None, "lowest_package": None
+        })
+        placed = row.get("students_placed") or 0
+        dept["total_students"] += row.get("total_students") or 0
+        dept["students_placed"] += placed
+        dept["students_higher_studies"] += row.get("students_higher_studies") or 0
+        dept["companies_visited"] += row.get("companies_visited") or 0
+        dept["_package_sum"] += (row.get("average_package") or 0) * placed
+        for key, pick in (("highest_package", max), ("lowest_package", min)):
+            if row.get(key) is not None:
+                dept[key] = row[key] if dept[key] is None else pick(dept[key], row[key])
+
+    # Offers are attributed to every department a company is open to
+    company_offers: Dict[str, List[Tuple[float, int]]] = {}
+    department_offers: Dict[str, List[Tuple[float, int]]] = {}
+    department_companies: Dict[str, Set[str]] = {}
+    companies: Dict[str, Dict[str, Any]] = {}
+    for package in packages:
+        key = package.get("company_key") or normalize_name(package.get("company_name", ""))
+        if not key:
+            continue
+        offer = (package.get("package_offered"), package.get("students_selected") or 0)
+        company = companies.setdefault(key, {
+            "company_name": package.get("company_name"), "roles": set(), "departments": set(), "packages_listed": 0
+        })
+        company["packages_listed"] += 1
+        if package.get("role"):
+            company["roles"].add(package["role"])
+        company_offers.setdefault(key, []).append(offer)
+        for dept in package.get("departments_allowed") or []:
+            company["departments"].add(dept)
+            department_offers.setdefault(dept, []).append(offer)
+            department_companies.setdefault(dept, set()).add(key)
+
+    department_docs = {}
+    for name in sorted(set(departments) | set(department_offers), key=str):
+        if name is None:
+            continue
+        dept = departments.get(name, {})
+        total = dept.get("total_students", 0)
+        placed = dept.get("students_placed", 0)
+        department_docs[name] = {
+            "total_students": total,
+            "students_placed": placed,
+            "students_higher_studies": dept.get("students_higher_studies", 0),
+            "placement_percentage": percentage(placed, total),
+            "higher_studies_percentage": percentage(dept.get("students_higher_studies", 0), total),
+            "average_package": round(dept["_package_sum"] / placed, 2) if placed else None,  # Placed-weighted
+            "highest_package": dept.get("highest_package"),
+            "lowest_package": dept.get("lowest_package"),
+            "companies_visited": dept.get("companies_visited", 0),
+            "open_companies": len(department_companies.get(name, ())),
+            "open_offers": package_stats(department_offers.get(name, []))
+        }
+
+    company_docs = {
+        key: {
+            "company_name": company["company_name"],
+            "roles": sorted(company["roles"]),
+            "departments": sorted(company["departments"]),
+            "packages_listed": company["packages_listed"],
+            **package_stats(company_offers[key])
+        }
+        for key, company in companies.items()
+    }
+
+    total = sum(d["total_students"] for d in department_docs.values())
+    placed = sum(d["students_placed"] for d in department_docs.values())
+    higher = sum(d["students_higher_studies"] for d in department_docs.values())
+    summary = {
+        "total_students": total,
+        "students_placed": placed,
+        "students_higher_studies": higher,
+        "placement_percentage": percentage(placed, total),
+        "higher_studies_percentage": percentage(higher, total),
+        "departments": len(department_docs),
+        "companies": len(company_docs),
+        # Offer statistics come from company packages; department average_package from placement records
+        **package_stats(offer for offers in company_offers.values() for offer in offers)
+    }
+
+    return {
+        "_id": year,
+        "summary": summary,
+        "departments": department_docs,
+        "companies": company_docs,
+        "updated_at": datetime.utcnow()
+    }
+
+
+class PlacementAnalyticsService:
+    """Keeps placement_analytics in step with placements and company_packages"""
+
+    def __init__(self, collection_name: str = Collections.PLACEMENT_ANALYTICS):
+        self.collection_name = collection_name
+
+    @property
+    def collection(self):
+        """Get analytics collection (None when MongoDB is unavailable)"""
+        db = mongodb.get_database()
+        if db is None:
+            return None
+        return db[self.collection_name]
+
+    async def refresh_years(self, years: Set[Any]):
+        """
+        Rebuild the analytics of the given academic years from their source records
+        (registered as the on_change listener of the placement and company package services)
+        """
+        db = mongodb.get_database()
+        if db is None:
+            return
+        for year in years:
+            if not isinstance(year, str):
+                continue
+            placements = await db[Collections.PLACEMENTS].find({"academic_year": year}, PLACEMENT_FIELDS).to_list(length=None)
+            packages = await db[Collections.COMPANY_PACKAGES].find({"academic_year": year}, PACKAGE_FIELDS).to_list(length=None)
+            if not placements and not packages:
+                await self.collection.delete_one({"_id": year})
+                continue
+            await self.collection.replace_one({"_id": year}, build_year(year, placements, packages), upsert=True)
+
+    async def rebuild(self) -> int:
+        """
+        Rebuild every year and drop years with no records left
+
+        Returns:
+            Number of years materialized
+        """
+        db = mongodb.get_database()
+        if db is None:
+            return 0
+        years = set(await db[Collections.PLACEMENTS].distinct("academic_year"))
+        years |= set(await db[Collections.COMPANY_PACKAGES].distinct("academic_year"))
+        years = {year for year in years if isinstance(year, str)}
+
+        await self.refresh_years(years)
+        await self.collection.delete_many({"_id": {"$nin": list(years)}})
+        logger.info(f"📊 Placement analytics rebuilt for {len(years)} academic years")
+        return len(years)
+
+    async def ensure_built(self):
+        """Build analytics on first start (an empty collection with placement data to summarize)"""
+        if self.collection is None:
+            return
+        if await self.collection.estimated_document_count() == 0:
+            await self.rebuild()
+
+    async def get_years(self) -> List[Dict[str, Any]]:
+        """Summary of every academic year, newest first"""
+        if self.collection is None:
+            return []
+        docs = await self.collection.find({}, {"summary": 1, "updated_at": 1}).sort("_id", -1).to_list(length=None)
+        return [{"academic_year": doc["_id"], **doc["summary"], "updated_at": doc["updated_at"]} for doc in docs]
+
+    async def get_year(self, year: str) -> Optional[Dict[str, Any]]:
+        """Full analytics document for one academic year (summary, departments, companies)"""
+        if self.collection is None:
+            return None
+        doc = await self.collection.find_one({"_id": year})
+        if doc is None:
+            return None
+        doc["academic_year"] = doc.pop("_id")
+        return doc
+
+
+# Global instance
+placement_analytics = PlacementAnalyticsService()
@@ -3,6 +3,7 @@ Utility functions
 """
 from typing import Any, Dict
 import hashlib
+import re
 import uuid
 from datetime import datetime
 
@@ -22,6 +23,32 @@ def verify_password(password: str, hashed: str) -> bool:
     return hash_password(password) == hashed
 
 
+def sha256_hex(data: bytes) -> str:
+    """Hex SHA-256 digest of raw bytes (file content hashes)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def text_hash(text: str) -> str:
+    """
+    Stable hash of a text chunk
+    Whitespace is collapsed so re-extracted text with different line breaks hashes the same
+    """
+    normalized = " ".join(text.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def chunk_id(source: str, chunk_hash: str) -> str:
+    """
+    Deterministic vector ID for a chunk
+    The same source + same text always maps to the same ID, so re-indexing overwrites instead of duplicating
+    """
+    prefix = re.sub(r"[^A-Za-z0-9_-]+", "-", source).strip("-")[:64] or "chunk"
+    if prefix != source:
+        # Keep IDs unique for sources that slugify to the same prefix
+        prefix = f"{prefix}-{hashlib.sha256(source.encode('utf-8')).hexdigest()[:8]}"
+    return f"{prefix}_{chunk_hash[:16]}"
+
+
 def format_datetime(dt: datetime) -> str:
     """Format datetime to ISO string"""
     return dt.isoformat()
@@ -0,0 +1,52 @@
+"""
+Pinecone Namespace Helpers
+Dependency-free (only needs a Pinecone index object) so standalone scripts can use them
+without loading the app settings, MongoDB or the embedding model
+"""
+from typing import Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+def is_missing_namespace(error: Exception) -> bool:
+    """Pinecone answers 404 when a namespace is already empty"""
+    return "404" in str(error) or "Namespace not found" in str(error)
+
+
+def delete_namespaces(
+    index,
+    namespaces: List[str],
+    max_workers: int = 4,
+    on_progress: Optional[Callable[[str, Optional[Exception]], None]] = None
+) -> Dict[str, Optional[Exception]]:
+    """
+    Delete every vector in several namespaces with bounded parallelism (blocking)
+
+    Args:
+        index: Pinecone index
+        namespaces: Namespaces to clear
+        max_workers: Maximum concurrent delete requests
+        on_progress: Called with (namespace, error or None) as each namespace finishes
+
+    Returns:
+        Dict of namespace -> error (None when cleared or already empty)
+    """
+    def clear(namespace: str):
+        try:
+            index.delete(delete_all=True, namespace=namespace)
+        except Exception as e:
+            if not is_missing_namespace(e):
+                raise
+
+    results: Dict[str, Optional[Exception]] = {}
+    if not namespaces:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(namespaces)))) as pool:
+        futures = {pool.submit(clear, ns): ns for ns in namespaces}
+        for future in as_completed(futures):
+            namespace = futures[future]
+            error = future.exception()
+            results[namespace] = error
+            if on_progress:
+                on_progress(namespace, error)
+    return results
@@ -0,0 +1,117 @@
+"""
+Record Import Helpers
+Read NDJSON or CSV uploads one record at a time, so large imports never sit in memory whole
+"""
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Dict, Any
+import csv
+import io
+import json
+
+NDJSON = "ndjson"
+CSV = "csv"
+
+# Plain .json is left out: it usually holds one top-level array, which isn't NDJSON
+_FORMATS_BY_SUFFIX = {".ndjson": NDJSON, ".jsonl": NDJSON, ".csv": CSV}
+
+RecordResult = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str] = None) -> Optional[str]:
+    """
+    Guess the import format from the upload's filename or content type
+
+    Returns:
+        NDJSON, CSV, or None if neither matches
+    """
+    name = (filename or "").lower()
+    for suffix, fmt in _FORMATS_BY_SUFFIX.items():
+        if name.endswith(suffix):
+            return fmt
+    content_type = (content_type or "").lower()
+    if "csv" in content_type:
+        return CSV
+    if "ndjson" in content_type or "jsonl" in content_type:
+        return NDJSON
+    return None
+
+
+def _csv_value(cell: str) -> Any:
+    """CSV cells holding JSON arrays/objects (skills, projects, ...) are decoded; others stay strings"""
+    if cell[:1] in ("[", "{"):
+        try:
+            return json.loads(cell)
+        except ValueError:
+            pass
+    return cell
+
+
+def iter_records(stream: BinaryIO, fmt: str) -> Iterator[RecordResult]:
+    """
+    Iterate over the records of an NDJSON or CSV file
+
+    NDJSON: one JSON object per line, blank lines skipped.
+    CSV: header row of field names; empty cells are left out (so schema defaults apply) and
+    cells that start with [ or { are parsed as JSON.
+
+    Args:
+        stream: Binary file object (e.g. UploadFile.file), read sequentially
+        fmt: NDJSON or CSV
+
+    Yields:
+        (line number, record, None) for readable records, (line number, None, error) otherwise
+
+    Raises:
+        ValueError: If the file isn't UTF-8 or the CSV can't be parsed further
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="" if fmt == CSV else None)
+    try:
+        if fmt == CSV:
+            reader = csv.DictReader(text)
+            try:
+                for row in reader:
+                    if None in row:
+                        yield reader.line_num, None, "More values than header columns"
+                        continue
+                    record = {
+                        key.strip(): _csv_value(value.strip())
+                        for key, value in row.items()
+                        if key and value is not None and value.strip()
+                    }
+                    if record:
+                        yield reader.line_num, record, None
+            except csv.Error as e:
+                raise ValueError(f"line {reader.line_num}: {e}")
+        else:
+            for line_num, line in enumerate(text, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    yield line_num, None, f"Invalid JSON: {e}"
+                    continue
+                if not isinstance(record, dict):
+                    yield line_num, None, "Expected a JSON object"
+                    continue
+                yield line_num, record, None
+    finally:
+        text.detach()  # Leave the underlying upload open for its owner to close
+
+
+def read_batch(records: Iterator[RecordResult], size: int) -> Tuple[List[RecordResult], Optional[str]]:
+    """
+    Pull up to size results from iter_records (blocking - run it in a worker thread)
+
+    Returns:
+        (results, None), or (results read so far, message) once the file can't be read further;
+        an empty list means the file is exhausted
+    """
+    results = []
+    try:
+        for result in records:
+            results.append(result)
+            if len(results) >= size:
+                break
+    except (UnicodeDecodeError, ValueError) as e:
+        return results, f"Could not read file: {e}"
+    return results, None
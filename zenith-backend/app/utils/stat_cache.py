@@ -0,0 +1,72 @@
+"""
+File Stat Cache
+Bounded in-memory path -> os.stat_result cache for static file serving
+
+Entries expire after a short TTL (existing files too, so a file rewritten in place or removed
+outside the service is noticed), and writers that delete files invalidate their paths directly.
+"""
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Union
+import os
+import time
+
+PathLike = Union[str, Path]
+
+
+class StatCache:
+    """LRU cache of stat results for regular files (None for missing paths)"""
+
+    def __init__(self, max_entries: int = 4096, ttl: float = 60.0, missing_ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.missing_ttl = missing_ttl
+        self._entries: "OrderedDict[str, Tuple[Optional[os.stat_result], float]]" = OrderedDict()
+
+    @staticmethod
+    def _key(path: PathLike) -> str:
+        return os.path.normpath(str(path))
+
+    def stat(self, path: PathLike) -> Optional[os.stat_result]:
+        """Stat a regular file, or None if it doesn't exist"""
+        key = self._key(path)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            result, cached_at = entry
+            ttl = self.ttl if result is not None else self.missing_ttl
+            if now - cached_at < ttl:
+                self._entries.move_to_end(key)
+                return result
+
+        try:
+            result = os.stat(key)
+            if not os.path.isfile(key):
+                result = None
+        except OSError:
+            result = None
+
+        self._entries[key] = (result, now)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result
+
+    def exists(self, path: PathLike) -> bool:
+        return self.stat(path) is not None
+
+    def invalidate(self, path: Optional[PathLike] = None):
+        """Forget one path (or everything)"""
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(self._key(path), None)
+
+    def invalidate_many(self, paths: Iterable[PathLike]):
+        """Forget several paths (e.g. files removed by garbage collection)"""
+        for path in paths:
+            self.invalidate(path)
+
+
+# Global instance
+stat_cache = StatCache()
@@ -0,0 +1,95 @@
+"""
+Streaming Upload Helpers
+Write multipart uploads to disk in fixed-size chunks instead of reading whole files into memory
+"""
+from typing import NamedTuple, Optional, Union
+from pathlib import Path
+import hashlib
+import logging
+import os
+import uuid
+
+import aiofiles
+from fastapi import HTTPException, UploadFile
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB per read/write
+
+
+class StoredUpload(NamedTuple):
+    """An upload written to disk"""
+    path: Path
+    size: int
+    sha256: str
+    filename: str
+
+
+async def save_upload(
+    file: UploadFile,
+    dest_dir: Union[str, Path],
+    max_bytes: Optional[int] = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> StoredUpload:
+    """
+    Stream an upload to a temp file, hashing and size-checking as it goes
+
+    The temp file is created in dest_dir so callers can os.replace() it into place atomically.
+    Oversized uploads are rejected before (declared size) or while (actual size) being written.
+
+    Args:
+        file: Uploaded file
+        dest_dir: Directory to write the temp file in
+        max_bytes: Reject uploads larger than this (413)
+        chunk_size: Bytes read per iteration
+
+    Returns:
+        StoredUpload with the temp file path, byte size and SHA-256 hex digest
+    """
+    limit_mb = f"{max_bytes / (1024 * 1024):g}MB" if max_bytes else ""
+
+    # Starlette knows the part size once the multipart body is parsed
+    if max_bytes and file.size is not None and file.size > max_bytes:
+        raise HTTPException(413, f"File size exceeds {limit_mb} limit")
+
+    dest_dir = Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    temp_path = dest_dir / f".upload-{uuid.uuid4().hex}.part"
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(temp_path, "wb") as out:
+            while True:
+                chunk = await file.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_bytes and size > max_bytes:
+                    raise HTTPException(413, f"File size exceeds {limit_mb} limit")
+                digest.update(chunk)
+                await out.write(chunk)
+    except BaseException:
+        discard_upload(temp_path)
+        raise
+
+    return StoredUpload(temp_path, size, digest.hexdigest(), file.filename or "")
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = UPLOAD_CHUNK_SIZE) -> str:
+    """SHA-256 hex digest of a file on disk, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def discard_upload(path: Union[str, Path]):
+    """Remove a temp upload, ignoring files that are already gone"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"⚠️ Could not remove temp upload {path}: {e}")
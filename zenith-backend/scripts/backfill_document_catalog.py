@@ -0,0 +1,77 @@
+"""
+Document Catalog Backfill Script
+Registers PDFs already sitting in uploads/ that have no document catalog entry yet
+
+The documents API now finds files through the catalog instead of scanning the upload
+directory, so files uploaded before the catalog existed must be registered once.
+They are added with status "uploaded"; index them with POST /api/v1/documents/index.
+
+Usage:
+    python scripts/backfill_document_catalog.py [--dry-run]
+"""
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database import mongodb
+from app.rag.registry import document_registry, STATUS_UPLOADED
+
+UPLOAD_DIR = Path(__file__).parent.parent / "uploads"
+
+
+async def backfill(dry_run: bool = False) -> bool:
+    """Catalog every "<file_id>_<name>.pdf" in the upload directory that isn't registered"""
+    print("📚 Backfilling document catalog...")
+    print("=" * 60)
+
+    await mongodb.connect()
+    if document_registry.collection is None:
+        print("❌ MongoDB not available")
+        return False
+
+    await document_registry.ensure_indexes()
+
+    added = 0
+    for entry in os.scandir(UPLOAD_DIR):
+        if not entry.is_file() or not entry.name.endswith(".pdf") or "_" not in entry.name:
+            continue
+
+        file_id, filename = entry.name.split("_", 1)
+        if await document_registry.get(file_id):
+            continue
+
+        print(f"   • {entry.name}")
+        added += 1
+        if dry_run:
+            continue
+
+        stat = entry.stat()
+        await document_registry.update(file_id, {
+            "filename": filename,
+            "namespace": None,
+            "path": entry.name,
+            "size_bytes": stat.st_size,
+            "file_hash": None,
+            "chunks": [],
+            "status": STATUS_UPLOADED,
+            "error": None
+        })
+
+    action = "would be added" if dry_run else "added"
+    print(f"\n✅ {added} documents {action} to the catalog")
+    await mongodb.disconnect()
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Register existing uploads in the document catalog")
+    parser.add_argument("--dry-run", action="store_true", help="List files without registering them")
+    args = parser.parse_args()
+
+    success = asyncio.run(backfill(args.dry_run))
+    sys.exit(0 if success else 1)
@@ -0,0 +1,86 @@
+"""
+Image Embedding Backfill Script
+Embeds the label and description of images stored before chat ranked images by embedding
+
+Chat falls back to label keyword matching for categories with no embedded images, so run
+this once after upgrading. Running workers pick the new vectors up on their next version check.
+
+Usage:
+    python scripts/backfill_image_embeddings.py [--dry-run] [--all]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pymongo import UpdateOne
+
+from app.database import mongodb, Collections
+from app.models.image import ImageMetadata
+from app.services.image_index import image_index, image_text, record_key
+
+BATCH_SIZE = 64
+
+
+async def backfill(dry_run: bool = False, re_embed: bool = False) -> bool:
+    """Embed every image without a vector (or every image with --all)"""
+    print("🖼️ Backfilling image embeddings...")
+    print("=" * 60)
+
+    await mongodb.connect()
+    db = mongodb.get_database()
+    if db is None:
+        print("❌ MongoDB not available")
+        return False
+
+    embedded = set()
+    if not re_embed:
+        embedded = set(await db[Collections.IMAGE_VECTORS].distinct("_id"))
+
+    docs = await db[Collections.IMAGES].find({}, {"_id": 0}).to_list(length=None)
+    images = [ImageMetadata(**doc) for doc in docs]
+    pending = [image for image in images if record_key(image) not in embedded]
+    for image in pending:
+        print(f"   • {image.relative_path}: {image_text(image)!r}")
+
+    if dry_run or not pending:
+        action = "would be embedded" if dry_run else "embedded"
+        print(f"\n✅ {len(pending) if dry_run else 0} images {action}")
+        await mongodb.disconnect()
+        return True
+
+    # Imported here so --dry-run doesn't load the embedding model
+    from app.rag.embeddings import embedding_service
+
+    for start in range(0, len(pending), BATCH_SIZE):
+        batch = pending[start:start + BATCH_SIZE]
+        texts = [image_text(image) for image in batch]
+        embeddings = embedding_service.generate_embeddings(texts)
+        await db[Collections.IMAGE_VECTORS].bulk_write([
+            UpdateOne(
+                {"_id": record_key(image)},
+                {"$set": {"category": image.category, "text": text, "embedding": embedding}},
+                upsert=True
+            )
+            for image, text, embedding in zip(batch, texts, embeddings)
+        ])
+
+    # Tell running workers to reload their image index
+    await image_index.bump_version()
+
+    print(f"\n✅ {len(pending)} images embedded")
+    await mongodb.disconnect()
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Embed image labels/descriptions for chat image ranking")
+    parser.add_argument("--dry-run", action="store_true", help="List images without embedding them")
+    parser.add_argument("--all", action="store_true", help="Re-embed images that already have a vector")
+    args = parser.parse_args()
+
+    success = asyncio.run(backfill(args.dry_run, args.all))
+    sys.exit(0 if success else 1)
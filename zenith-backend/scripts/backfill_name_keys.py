@@ -0,0 +1,57 @@
+"""
+Name Key Backfill Script
+Adds the normalized company_key / role_key to records stored before name lookups used them
+
+The API backfills missing keys at startup (and finds keyless records through a slower raw-name
+match meanwhile); run this to do it ahead of a deploy, to preview it, or to recompute keys after
+changing normalize_name. New and updated records get their key on write.
+
+Usage:
+    python scripts/backfill_name_keys.py [--dry-run] [--all]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database import mongodb
+from app.services import NAME_KEY_SERVICES
+
+
+async def backfill(dry_run: bool = False, recompute: bool = False) -> bool:
+    """Set every missing name key (or recompute all keys with --all)"""
+    print("🔤 Backfilling normalized name keys...")
+    print("=" * 60)
+
+    await mongodb.connect()
+    db = mongodb.get_database()
+    if db is None:
+        print("❌ MongoDB not available")
+        return False
+
+    action = "would be updated" if dry_run else "updated"
+    for service in NAME_KEY_SERVICES:
+        updated = await service.backfill_name_keys(recompute=recompute, dry_run=dry_run)
+        for key_field, count in updated.items():
+            print(f"   • {service.collection_name}.{key_field}: {count} records {action}")
+
+    if not dry_run:
+        # Creates the key indexes if the API hasn't started since upgrading
+        await mongodb.ensure_indexes([service.collection_name for service in NAME_KEY_SERVICES])
+
+    print("\n✅ Done")
+    await mongodb.disconnect()
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add normalized company/role name keys to existing records")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would change")
+    parser.add_argument("--all", action="store_true", help="Recompute keys that already exist")
+    args = parser.parse_args()
+
+    success = asyncio.run(backfill(dry_run=args.dry_run, recompute=args.all))
+    sys.exit(0 if success else 1)
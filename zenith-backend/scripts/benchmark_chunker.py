@@ -0,0 +1,151 @@
+"""
+Chunker Benchmark - Throughput and retrieval quality
+Compares the legacy fixed 1000/200 character slicer against the token-aware structural chunker
+
+Usage:
+    python scripts/benchmark_chunker.py [--pages 200] [--no-retrieval]
+
+Throughput is measured on a synthetic brochure-style corpus (page markers, headings,
+lists, tables, long paragraphs). Retrieval quality embeds the chunks with the production
+mpnet model and checks whether the chunk holding each planted fact ranks in the top-k.
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.rag.chunker import TextChunker, ChunkingConfig
+
+DEPARTMENTS = ["CSE", "IT", "ECE", "EEE", "MECH", "CIVIL", "AIML", "DS"]
+COMPANIES = ["Infosys", "TCS", "Wipro", "Accenture", "Deloitte", "Amazon", "Microsoft", "Cognizant"]
+FILLER = (
+    "The institute encourages students to take part in technical clubs, hackathons and "
+    "industry workshops throughout the academic year. Faculty mentors guide every batch "
+    "through projects, internships and certification programs that build practical skills. "
+)
+
+
+def legacy_chunk(text: str, chunk_size: int = 1000, chunk_overlap: int = 200):
+    """The original TextChunker.chunk_text fixed character slicer"""
+    chunks = []
+    start = 0
+    while start < len(text):
+        chunks.append(text[start:start + chunk_size].strip())
+        start += chunk_size - chunk_overlap
+    return chunks
+
+
+def build_corpus(pages: int, seed: int = 7):
+    """Generate a brochure-like document with one planted fact per page"""
+    rng = random.Random(seed)
+    lines = []
+    facts = []
+    for page in range(1, pages + 1):
+        dept = DEPARTMENTS[page % len(DEPARTMENTS)]
+        company = COMPANIES[rng.randrange(len(COMPANIES))]
+        package = rng.randint(4, 45)
+        fact = f"In batch {2000 + page} the {dept} student recruited by {company} received a package of {package} LPA."
+        question = f"What package did {company} offer the {dept} student of batch {2000 + page}?"
+        facts.append((question, fact))
+
+        lines.append(f"Page {page} — {dept} Department Highlights")
+        lines.append(f"{dept} PLACEMENT SUMMARY")
+        lines.append(FILLER * rng.randint(1, 3) + fact + " " + FILLER * rng.randint(0, 2))
+        lines.append("")
+        lines.append("| Company | Offers | Package |")
+        for c in rng.sample(COMPANIES, 4):
+            lines.append(f"| {c} | {rng.randint(1, 40)} | {rng.randint(3, 40)} LPA |")
+        lines.append("")
+        for i in range(rng.randint(2, 5)):
+            lines.append(f"- Activity {i + 1}: {FILLER[:rng.randint(40, 120)].strip()}")
+        lines.append("")
+    return "\n".join(lines), facts
+
+
+def time_chunker(name, fn, text, repeat=3):
+    best = float("inf")
+    chunks = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunks = fn(text)
+        best = min(best, time.perf_counter() - start)
+    mb = len(text.encode("utf-8")) / (1024 * 1024)
+    print(f"  {name:<12} {len(chunks):>6} chunks  {best * 1000:>9.1f} ms  {mb / best:>8.2f} MB/s")
+    return chunks
+
+
+def fact_integrity(chunks, facts):
+    """Share of planted facts that appear unbroken inside at least one chunk"""
+    joined = [" ".join(c.split()) for c in chunks]
+    intact = sum(1 for _, fact in facts if any(fact in c for c in joined))
+    return intact / len(facts)
+
+
+def retrieval_quality(model, chunks, facts, ks=(1, 3)):
+    """Recall@k of the chunk containing each fact, using cosine similarity"""
+    import numpy as np
+
+    chunk_vecs = model.encode(chunks, convert_to_numpy=True, normalize_embeddings=True, batch_size=64)
+    questions = [q for q, _ in facts]
+    query_vecs = model.encode(questions, convert_to_numpy=True, normalize_embeddings=True, batch_size=64)
+    scores = query_vecs @ chunk_vecs.T
+
+    normalized = [" ".join(c.split()) for c in chunks]
+    recalls = {}
+    for k in ks:
+        hits = 0
+        for row, (_, fact) in zip(scores, facts):
+            top = np.argpartition(-row, min(k, len(row) - 1))[:k]
+            if any(fact in normalized[i] for i in top):
+                hits += 1
+        recalls[k] = hits / len(facts)
+    return recalls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chunking throughput and retrieval quality")
+    parser.add_argument("--pages", type=int, default=200, help="Synthetic pages to generate")
+    parser.add_argument("--no-retrieval", action="store_true", help="Skip the embedding-based quality check")
+    args = parser.parse_args()
+
+    text, facts = build_corpus(args.pages)
+    print("\n" + "=" * 60)
+    print(f"📊 CHUNKER BENCHMARK ({args.pages} pages, {len(text):,} chars)")
+    print("=" * 60)
+
+    model = None
+    token_counter = None
+    if not args.no_retrieval:
+        try:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer("sentence-transformers/all-mpnet-base-v2")
+            tokenizer = model.tokenizer
+            token_counter = lambda t: len(tokenizer.encode(t, add_special_tokens=False))
+        except Exception as e:
+            print(f"⚠️  Embedding model unavailable ({e}); using estimated token counts")
+
+    structural = TextChunker(ChunkingConfig(), {}, token_counter or (lambda t: max(1, len(t) // 4)))
+
+    print("\nThroughput (best of 3):")
+    legacy_chunks = time_chunker("legacy", legacy_chunk, text)
+    new_chunks = time_chunker("structural", structural.chunk_text, text)
+
+    print("\nFacts kept intact in a single chunk:")
+    print(f"  legacy       {fact_integrity(legacy_chunks, facts):.1%}")
+    print(f"  structural   {fact_integrity(new_chunks, facts):.1%}")
+
+    if model is not None:
+        print("\nRetrieval quality (recall@k of the chunk holding the fact):")
+        for name, chunks in (("legacy", legacy_chunks), ("structural", new_chunks)):
+            recalls = retrieval_quality(model, chunks, facts)
+            print(f"  {name:<12} " + "  ".join(f"R@{k}={v:.1%}" for k, v in recalls.items()))
+
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Image Variant Report - Bytes served before and after responsive variants
+Compares each stored original with the variant GET /api/v1/images/...?w=N would serve
+
+Usage:
+    python scripts/benchmark_image_variants.py [--width 300] [--generate] [--synthetic 20]
+
+--generate creates missing variants for images stored before variants existed.
+--synthetic builds a throwaway set of photo-like images when uploads/images is empty.
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from app.services.image_variants import ImageVariantService, WEBP, JPEG
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"}
+
+
+def build_synthetic(base_dir: Path, count: int, seed: int = 11):
+    """Photo-like PNG/JPEG originals at PDF-extraction sizes (1600-3200px wide)"""
+    rng = random.Random(seed)
+    category_dir = base_dir / "synthetic"
+    category_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        width = rng.randint(1600, 3200)
+        height = int(width * rng.uniform(0.6, 1.0))
+        image = Image.new("RGB", (width, height), tuple(rng.randint(0, 255) for _ in range(3)))
+        draw = ImageDraw.Draw(image)
+        for _ in range(60):
+            x, y = rng.randint(0, width), rng.randint(0, height)
+            r = rng.randint(20, width // 4)
+            draw.ellipse((x - r, y - r, x + r, y + r), fill=tuple(rng.randint(0, 255) for _ in range(3)))
+        image = image.filter(ImageFilter.GaussianBlur(3))
+        ext = "png" if i % 2 else "jpg"
+        image.save(category_dir / f"photo_{i}_{rng.getrandbits(32):08x}.{ext}")
+
+
+def iter_originals(base_dir: Path):
+    for path in sorted(base_dir.glob("*/*")):
+        if path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS:
+            yield path
+
+
+def human(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024:
+            return f"{n:.1f}{unit}"
+        n /= 1024
+    return f"{n:.1f}TB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare original vs variant image bytes")
+    parser.add_argument("--dir", default="uploads/images", help="Image storage directory")
+    parser.add_argument("--width", type=int, default=300, help="Display width requested by the client (?w=)")
+    parser.add_argument("--generate", action="store_true", help="Create missing variants first")
+    parser.add_argument("--synthetic", type=int, default=0, help="Use N generated images in a temp directory")
+    args = parser.parse_args()
+
+    temp = None
+    base_dir = Path(args.dir)
+    if args.synthetic:
+        temp = tempfile.TemporaryDirectory()
+        base_dir = Path(temp.name)
+        build_synthetic(base_dir, args.synthetic)
+        args.generate = True
+
+    service = ImageVariantService(base_dir=str(base_dir))
+    originals = list(iter_originals(base_dir))
+    if not originals:
+        print(f"❌ No images found in {base_dir} (try --synthetic 20)")
+        return
+
+    print("\n" + "=" * 72)
+    print(f"🖼️  IMAGE VARIANT REPORT ({len(originals)} images, ?w={args.width}, widths {service.widths})")
+    print("=" * 72)
+
+    if args.generate:
+        start = time.perf_counter()
+        futures = []
+        for path in originals:
+            if not service.variant_path(path.parent.name, path.name, service.widths[0], WEBP).exists():
+                futures.append(service.submit(path))
+        for future in futures:
+            future.result()
+        print(f"Generated variants for {len(futures)} images in {time.perf_counter() - start:.1f}s")
+
+    totals = {"original": 0, WEBP: 0, JPEG: 0}
+    print(f"\n{'image':<44} {'original':>10} {'webp':>10} {'jpeg':>10}")
+    for path in originals:
+        original = path.stat().st_size
+        served = {}
+        for fmt in (WEBP, JPEG):
+            variant = service.pick(path.parent.name, path.name, args.width, accept_webp=(fmt == WEBP))
+            served[fmt] = variant.stat().st_size if variant else original
+        totals["original"] += original
+        totals[WEBP] += served[WEBP]
+        totals[JPEG] += served[JPEG]
+        name = f"{path.parent.name}/{path.name}"
+        print(f"{name[-44:]:<44} {human(original):>10} {human(served[WEBP]):>10} {human(served[JPEG]):>10}")
+
+    print("-" * 72)
+    print(f"{'TOTAL':<44} {human(totals['original']):>10} {human(totals[WEBP]):>10} {human(totals[JPEG]):>10}")
+    for fmt in (WEBP, JPEG):
+        saved = 1 - totals[fmt] / totals["original"]
+        print(f"  {fmt:<5} variants serve {saved:.1%} fewer bytes than the originals")
+    print()
+
+    if temp:
+        temp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
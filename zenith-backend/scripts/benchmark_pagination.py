@@ -0,0 +1,122 @@
+"""
+Pagination Benchmark - skip/limit vs keyset cursors at 1M students
+Seeds a throwaway "<MONGODB_DB_NAME>_bench" database and times deep list pages
+the way GET /api/v1/students/ fetches them, plus count_documents vs the estimated total
+
+Usage:
+    python scripts/benchmark_pagination.py [--docs 1000000] [--page-size 20] [--keep]
+
+The bench database is dropped afterwards unless --keep is given (re-runs reuse a kept one).
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.database import MongoDB, mongodb, Collections
+from app.services import StudentService
+from app.services.base import LIST_SORT, encode_cursor
+
+DEPARTMENTS = ["CSE", "IT", "ECE", "EEE", "MECH", "CIVIL"]
+BATCH = 10_000
+
+
+async def seed(db, count: int):
+    students = db[Collections.STUDENTS]
+    existing = await students.estimated_document_count()
+    if existing >= count:
+        print(f"Reusing {existing:,} seeded students")
+        return
+
+    rng = random.Random(42)
+    start = datetime(2020, 1, 1)
+    t0 = time.perf_counter()
+    for offset in range(existing, count, BATCH):
+        docs = []
+        for i in range(offset, min(offset + BATCH, count)):
+            # Several students share each created_at second, like a bulk import
+            created = start + timedelta(seconds=i // 4)
+            docs.append({
+                "roll_number": f"BENCH{i:08d}",
+                "name": f"Student {i}",
+                "email": f"student{i}@example.com",
+                "department": rng.choice(DEPARTMENTS),
+                "year": rng.randint(1, 4),
+                "cgpa": round(rng.uniform(5, 10), 2),
+                "skills": ["python", "sql", "java"][: rng.randint(1, 3)],
+                "placement_status": "not_placed",
+                "created_at": created,
+                "updated_at": created
+            })
+        await students.insert_many(docs, ordered=False)
+        print(f"\r   seeded {offset + len(docs):,}/{count:,}", end="", flush=True)
+    print(f"\nSeeded in {time.perf_counter() - t0:.0f}s")
+
+
+async def timed(coro_fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        await coro_fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+async def run(count: int, page_size: int, keep: bool) -> bool:
+    await mongodb.connect()
+    if mongodb.client is None:
+        print("❌ MongoDB not available")
+        return False
+
+    bench_name = f"{settings.MONGODB_DB_NAME}_bench"
+    MongoDB.database = mongodb.client[bench_name]
+    db = MongoDB.database
+    await seed(db, count)
+    await mongodb.ensure_indexes([Collections.STUDENTS])
+
+    service = StudentService()
+    print("\n" + "=" * 72)
+    print(f"📄 PAGINATION BENCHMARK ({count:,} students, {page_size} per page, best of 3)")
+    print("=" * 72)
+    print(f"{'page':>10} {'skip/limit':>14} {'cursor':>12} {'speedup':>9}")
+
+    for page in sorted({1, 100, 1_000, 10_000, count // page_size // 2, count // page_size - 1}):
+        skip = page * page_size
+        if skip >= count:
+            continue
+        # Cursor the client would hold after reading the previous page
+        previous = await db[Collections.STUDENTS].find({}, {"created_at": 1}).sort(LIST_SORT).skip(skip - 1).limit(1).to_list(1) if skip else []
+        cursor = encode_cursor(previous[0]) if previous else None
+
+        skip_ms = await timed(lambda: service.get_page(limit=page_size, skip=skip))
+        cursor_ms = await timed(lambda: service.get_page(cursor=cursor, limit=page_size))
+        print(f"{page:>10,} {skip_ms:>12.1f}ms {cursor_ms:>10.1f}ms {skip_ms / max(cursor_ms, 1e-6):>8.1f}x")
+
+    count_ms = await timed(lambda: service.count())
+    estimated_ms = await timed(lambda: service.estimated_count())
+    print(f"\n{'total via count_documents':<34} {count_ms:>10.1f}ms")
+    print(f"{'total via estimated_document_count':<34} {estimated_ms:>10.1f}ms")
+
+    if not keep:
+        await mongodb.client.drop_database(bench_name)
+        print(f"\nDropped {bench_name}")
+    await mongodb.disconnect()
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark skip vs cursor pagination")
+    parser.add_argument("--docs", type=int, default=1_000_000, help="Students to seed")
+    parser.add_argument("--page-size", type=int, default=20, help="Page size")
+    parser.add_argument("--keep", action="store_true", help="Keep the bench database for re-runs")
+    args = parser.parse_args()
+
+    success = asyncio.run(run(args.docs, args.page_size, args.keep))
+    sys.exit(0 if success else 1)
@@ -0,0 +1,114 @@
+"""
+Serialization Benchmark - List page encoding throughput
+Compares the old list response path (serialize_doc, PaginatedResponse validation, json.dumps)
+against dumps_bson (orjson straight from the raw MongoDB documents)
+
+Usage:
+    python scripts/benchmark_serialization.py [--docs 10000] [--repeat 5]
+
+Documents are synthetic student records (ObjectIds, datetimes, skills and a projects array),
+the heaviest list payload in the API. No database is needed.
+"""
+import argparse
+import copy
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from bson import ObjectId
+
+from app.models import serialize_doc, dumps_bson
+from app.schemas import PaginatedResponse
+
+DEPARTMENTS = ["CSE", "IT", "ECE", "EEE", "MECH", "CIVIL"]
+SKILLS = ["Python", "Java", "SQL", "React", "Docker", "AWS", "ML", "C++", "Go", "Figma"]
+
+
+def build_docs(count: int, seed: int = 7):
+    """Student documents as Motor returns them"""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    docs = []
+    for i in range(count):
+        created = start + timedelta(seconds=i, microseconds=rng.randrange(1_000_000))
+        docs.append({
+            "_id": ObjectId(),
+            "name": f"Student {i}",
+            "roll_number": f"22R{i:05d}",
+            "department": DEPARTMENTS[i % len(DEPARTMENTS)],
+            "email": f"student{i}@mlrit.ac.in",
+            "phone": f"+91{rng.randrange(10**9, 10**10)}",
+            "cgpa": round(rng.uniform(5, 10), 2),
+            "skills": rng.sample(SKILLS, 4),
+            "certifications": [f"Cert {j}" for j in range(rng.randint(0, 4))],
+            "internships_completed": [],
+            "projects": [
+                {"title": f"Project {j}", "description": "A campus project " * 4, "link": f"https://example.com/{i}/{j}"}
+                for j in range(rng.randint(1, 4))
+            ],
+            "placement_status": "not_placed",
+            "created_at": created,
+            "updated_at": created
+        })
+    return docs
+
+
+def page(docs):
+    return {"total": len(docs), "skip": 0, "limit": len(docs), "next_cursor": None, "data": docs}
+
+
+def before(docs) -> bytes:
+    """serialize_doc per document, then what FastAPI did with response_model=PaginatedResponse"""
+    payload = page([serialize_doc(doc) for doc in docs])
+    validated = PaginatedResponse.model_validate(payload).model_dump(mode="json")
+    return json.dumps(validated, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def after(docs) -> bytes:
+    """BSONJSONResponse.render"""
+    return dumps_bson(page(docs))
+
+
+def measure(name, fn, docs, repeat):
+    best = float("inf")
+    body = b""
+    for _ in range(repeat):
+        fresh = copy.deepcopy(docs)  # serialize_doc mutates in place
+        start = time.perf_counter()
+        body = fn(fresh)
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:<8} {best * 1000:>9.1f} ms  {len(docs) / best:>12,.0f} docs/s  {len(body) / 1024:>8,.0f} KB")
+    return best, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list page serialization")
+    parser.add_argument("--docs", type=int, default=10000, help="Documents in the page")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per encoder (best is reported)")
+    args = parser.parse_args()
+
+    docs = build_docs(args.docs)
+    print("\n" + "=" * 60)
+    print(f"📊 SERIALIZATION BENCHMARK ({args.docs:,} student documents)")
+    print("=" * 60)
+
+    print(f"\nOne page, best of {args.repeat}:")
+    old_time, old_body = measure("before", before, docs, args.repeat)
+    new_time, new_body = measure("orjson", after, docs, args.repeat)
+
+    same = json.loads(old_body) == json.loads(new_body)
+    print(f"\n  Speed-up: {old_time / new_time:.1f}x")
+    print(f"  {'✅' if same else '❌'} Both produce the same JSON")
+    print()
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
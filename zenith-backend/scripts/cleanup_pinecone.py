@@ -16,6 +16,24 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+from app.utils.namespaces import delete_namespaces
+
+MAX_WORKERS = int(os.getenv("MAINTENANCE_CONCURRENCY", "4"))  # Concurrent namespace deletes
+
+
+def sync_manifest(removed):
+    """Drop deleted vectors from the MongoDB vector manifest (content listings and re-index skips read it)"""
+    try:
+        # Imported here so the script still runs without MongoDB
+        from app.rag.manifest import forget_deleted
+        updated = forget_deleted(removed)
+    except Exception as e:
+        print(f"⚠️  Vector manifest: {e}")
+        updated = False
+    if not updated:
+        print("⚠️  Vector manifest not updated - run scripts/rebuild_vector_manifest.py once MongoDB is reachable")
+
+
 def cleanup_pinecone():
     """Delete all vectors from all namespaces in Pinecone"""
     
@@ -58,17 +76,23 @@ def cleanup_pinecone():
         
         print("\n🗑️  Deleting vectors...")
         
-        # Delete all vectors from each namespace
+        # Delete all namespaces concurrently (bounded), reporting each as it finishes
         deleted_count = 0
-        for ns_name in namespaces.keys():
-            try:
-                # Delete all vectors in this namespace
-                index.delete(delete_all=True, namespace=ns_name)
+        cleared = []
+        
+        def progress(ns_name, error):
+            nonlocal deleted_count
+            if error is None:
                 vector_count = namespaces[ns_name].get('vector_count', 0)
                 deleted_count += vector_count
+                cleared.append(ns_name)
                 print(f"   ✅ Deleted {vector_count} vectors from '{ns_name}'")
-            except Exception as e:
-                print(f"   ❌ Error deleting from '{ns_name}': {e}")
+            else:
+                print(f"   ❌ Error deleting from '{ns_name}': {error}")
+        
+        delete_namespaces(index, list(namespaces.keys()), max_workers=MAX_WORKERS, on_progress=progress)
+        if cleared:
+            sync_manifest({ns_name: None for ns_name in cleared})
         
         print(f"\n✨ Cleanup complete! Deleted {deleted_count} total vectors")
         
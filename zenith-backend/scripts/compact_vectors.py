@@ -0,0 +1,162 @@
+"""
+Vector Compaction Script
+Finds chunks stored more than once in a namespace (same text, different vector IDs)
+and deletes the extra copies, keeping one vector per text hash.
+
+Older indexing code generated timestamp/uuid vector IDs, so re-indexing the same text
+left duplicates that crowd the top-k. New chunks use deterministic IDs and no longer duplicate.
+
+Usage:
+    python scripts/compact_vectors.py [--namespace NAME] [--dry-run] [--yes]
+"""
+import argparse
+import os
+import random
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from pinecone import Pinecone
+from dotenv import load_dotenv
+
+from app.utils import text_hash, chunk_id
+
+# Load environment variables
+load_dotenv()
+
+MAX_TOP_K = 10000  # Pinecone query limit
+DELETE_BATCH = 1000
+
+
+def sync_manifest(removed):
+    """Drop deleted vectors from the MongoDB vector manifest (content listings and re-index skips read it)"""
+    try:
+        # Imported here so --dry-run doesn't need MongoDB or the app settings
+        from app.rag.manifest import forget_deleted
+        updated = forget_deleted(removed)
+    except Exception as e:
+        print(f"⚠️  Vector manifest: {e}")
+        updated = False
+    if not updated:
+        print("⚠️  Vector manifest not updated - run scripts/rebuild_vector_manifest.py once MongoDB is reachable")
+
+
+def fetch_namespace(index, namespace: str, dimension: int):
+    """
+    Enumerate vectors in a namespace with a random-vector query
+    (pinecone-client 3.0 has no list API, so namespaces above 10,000 vectors are only partially scanned)
+    """
+    response = index.query(
+        vector=[random.uniform(-0.1, 0.1) for _ in range(dimension)],
+        namespace=namespace,
+        top_k=MAX_TOP_K,
+        include_metadata=True,
+        include_values=False
+    )
+    return response.matches or []
+
+
+def pick_keeper(namespace: str, matches):
+    """Prefer the vector already stored under its deterministic ID, then the one carrying a text hash"""
+    for match in matches:
+        meta = match.metadata or {}
+        h = meta.get("text_hash") or text_hash(meta.get("text", ""))
+        if match.id == chunk_id(str(meta.get("source") or namespace or "default"), h):
+            return match
+    for match in matches:
+        if (match.metadata or {}).get("text_hash"):
+            return match
+    return sorted(matches, key=lambda m: m.id)[0]
+
+
+def find_duplicates(namespace: str, matches):
+    """Group vectors by text hash and return (keeper, [duplicate ids]) for groups larger than one"""
+    groups = defaultdict(list)
+    for match in matches:
+        meta = match.metadata or {}
+        text = meta.get("text", "")
+        if not text:
+            continue
+        groups[meta.get("text_hash") or text_hash(text)].append(match)
+
+    duplicates = []
+    for group in groups.values():
+        if len(group) > 1:
+            keeper = pick_keeper(namespace, group)
+            duplicates.append((keeper, [m.id for m in group if m.id != keeper.id]))
+    return duplicates
+
+
+def compact(namespace_filter=None, dry_run=False, assume_yes=False):
+    """Remove duplicate chunks from every namespace (or just one)"""
+    print("🧹 Starting vector compaction...")
+    print("=" * 60)
+
+    api_key = os.getenv("PINECONE_API_KEY")
+    if not api_key:
+        print("❌ Error: PINECONE_API_KEY not found in environment")
+        return False
+
+    pc = Pinecone(api_key=api_key)
+    index_name = os.getenv("PINECONE_INDEX_NAME", "mlrit")
+    print(f"📍 Connecting to index: {index_name}")
+
+    try:
+        index = pc.Index(index_name)
+        stats = index.describe_index_stats()
+        dimension = stats.get("dimension", 768)
+        namespaces = list(stats.get("namespaces", {}).keys())
+        if namespace_filter is not None:
+            namespaces = [ns for ns in namespaces if ns == namespace_filter]
+
+        plan = {}
+        for ns in namespaces:
+            matches = fetch_namespace(index, ns, dimension)
+            duplicates = find_duplicates(ns, matches)
+            extra = sum(len(ids) for _, ids in duplicates)
+            print(f"   • {ns or 'default'}: {len(matches)} vectors scanned, {extra} duplicates in {len(duplicates)} groups")
+            if extra:
+                plan[ns] = [vid for _, ids in duplicates for vid in ids]
+
+        total = sum(len(ids) for ids in plan.values())
+        if not total:
+            print("\n✅ No duplicates found")
+            return True
+
+        if dry_run:
+            print(f"\n🔍 Dry run: {total} duplicate vectors would be deleted")
+            return True
+
+        if not assume_yes:
+            confirm = input(f"\nType 'YES' to delete {total} duplicate vectors: ")
+            if confirm.strip().upper() != "YES":
+                print("❌ Compaction cancelled")
+                return False
+
+        for ns, ids in plan.items():
+            for start in range(0, len(ids), DELETE_BATCH):
+                index.delete(ids=ids[start:start + DELETE_BATCH], namespace=ns)
+            print(f"   ✅ Deleted {len(ids)} duplicates from '{ns or 'default'}'")
+        sync_manifest(plan)
+
+        print(f"\n✨ Compaction complete! Removed {total} duplicate vectors")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Remove duplicate chunks from Pinecone")
+    parser.add_argument("--namespace", default=None, help="Only compact this namespace")
+    parser.add_argument("--dry-run", action="store_true", help="Report duplicates without deleting")
+    parser.add_argument("--yes", action="store_true", help="Skip the confirmation prompt")
+    args = parser.parse_args()
+
+    success = compact(args.namespace, dry_run=args.dry_run, assume_yes=args.yes)
+    sys.exit(0 if success else 1)
@@ -19,6 +19,23 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+from app.utils.namespaces import delete_namespaces
+
+MAX_WORKERS = int(os.getenv("MAINTENANCE_CONCURRENCY", "4"))  # Concurrent namespace deletes
+
+
+def sync_manifest(removed):
+    """Drop deleted vectors from the MongoDB vector manifest (content listings and re-index skips read it)"""
+    try:
+        # Imported here so the script still runs without MongoDB
+        from app.rag.manifest import forget_deleted
+        updated = forget_deleted(removed)
+    except Exception as e:
+        print(f"⚠️  Vector manifest: {e}")
+        updated = False
+    if not updated:
+        print("⚠️  Vector manifest not updated - run scripts/rebuild_vector_manifest.py once MongoDB is reachable")
+
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 PINECONE_INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "mlrit")
 
@@ -66,22 +83,21 @@ def main():
     
     print("\n🗑️  Deleting all embeddings...")
     
-    success_count = 0
-    for namespace in NAMESPACES:
-        try:
-            print(f"  Clearing namespace: {namespace}...", end=" ")
-            index.delete(delete_all=True, namespace=namespace)
-            print("✅")
-            success_count += 1
-        except Exception as e:
-            # 404 means namespace is empty/doesn't exist - that's fine
-            if "404" in str(e) or "Namespace not found" in str(e):
-                print("⚪ (empty)")
-                success_count += 1
-            else:
-                print(f"❌ Error: {e}")
+    cleared = []
+    
+    def progress(namespace, error):
+        if error is None:
+            # Empty/missing namespaces (404) count as cleared
+            print(f"  Cleared namespace: {namespace} ✅")
+            cleared.append(namespace)
+        else:
+            print(f"  Clearing namespace: {namespace} ❌ Error: {error}")
+    
+    delete_namespaces(index, NAMESPACES, max_workers=MAX_WORKERS, on_progress=progress)
+    if cleared:
+        sync_manifest({namespace: None for namespace in cleared})
     
-    print(f"\n✅ Successfully cleared {success_count}/{len(NAMESPACES)} namespaces")
+    print(f"\n✅ Successfully cleared {len(cleared)}/{len(NAMESPACES)} namespaces")
     print("🎉 Your Pinecone index is now empty and ready for fresh uploads!\n")
 
 if __name__ == "__main__":
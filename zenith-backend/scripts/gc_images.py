@@ -0,0 +1,74 @@
+"""
+Image Storage GC Script
+Reports image disk usage and deletes stored files that no image record references
+
+Images are stored by content hash (uploads/images/_cas/img_<sha256>.<ext>) and shared by
+every record with identical bytes, so files are never deleted with a record - run this instead.
+Originals in the older per-category folders are kept while a record still points at them.
+
+Usage:
+    python scripts/gc_images.py                 # Report + list what would be removed
+    python scripts/gc_images.py --delete        # Remove unreferenced files older than an hour
+    python scripts/gc_images.py --delete --min-age-hours 0
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database import mongodb
+from app.services.image_service import image_storage
+
+
+def human(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024:
+            return f"{n:.1f}{unit}"
+        n /= 1024
+    return f"{n:.1f}TB"
+
+
+async def run(delete: bool, min_age_hours: float, verbose: bool) -> bool:
+    await mongodb.connect()
+    if mongodb.get_database() is None:
+        print("❌ MongoDB not available - cannot tell which images are referenced")
+        return False
+
+    report = await image_storage.storage_report()
+    print("\n" + "=" * 60)
+    print("🖼️  IMAGE STORAGE")
+    print("=" * 60)
+    for key in ("total", "originals", "variants", "content_addressed", "legacy", "unreferenced"):
+        totals = report[key]
+        print(f"{key:<20} {totals['files']:>8} files {human(totals['bytes']):>10}")
+    print(f"{'referenced files':<20} {report['referenced_files']:>8}")
+    print("\nBy folder:")
+    for folder, size in report["by_folder"].items():
+        print(f"   {folder:<30} {human(size):>10}")
+
+    result = await image_storage.collect_garbage(dry_run=not delete, min_age_seconds=min_age_hours * 3600)
+    if verbose or not delete:
+        for path in result["removed"]:
+            print(f"   • {path}")
+
+    action = "Removed" if delete else "Would remove"
+    print(f"\n✅ {action} {result['files']} files ({human(result['bytes'])})")
+    if not delete and result["files"]:
+        print("   Run again with --delete to remove them")
+
+    await mongodb.disconnect()
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report image disk usage and remove unreferenced files")
+    parser.add_argument("--delete", action="store_true", help="Delete unreferenced files (default is a dry run)")
+    parser.add_argument("--min-age-hours", type=float, default=1.0, help="Keep files newer than this")
+    parser.add_argument("--verbose", action="store_true", help="List removed files")
+    args = parser.parse_args()
+
+    success = asyncio.run(run(args.delete, args.min_age_hours, args.verbose))
+    sys.exit(0 if success else 1)
@@ -0,0 +1,151 @@
+"""
+Index Report - explain() every service query and flag collection scans
+Runs the queries the service layer issues (same filters and sorts) with explain and reports
+the winning plan of each: IXSCAN is good, COLLSCAN means no index serves the query, and an
+in-memory SORT stage means the index doesn't cover the sort.
+
+Usage:
+    python scripts/index_report.py [--apply]
+
+--apply creates the declared indexes (app.database.COLLECTION_INDEXES) before explaining.
+Exits with status 1 when any query does a COLLSCAN.
+"""
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database import mongodb, Collections
+
+NOW = datetime.utcnow()
+NEWEST = [("created_at", -1), ("_id", -1)]
+PREFIX = {"$regex": "^info"}  # Anchored prefix on a normalized key
+
+
+def by_name(key_field, field, key_condition, raw_pattern):
+    """find_by_name's query: the normalized key, or the raw name on records stored without one"""
+    return {"$or": [{key_field: key_condition}, {key_field: None, field: {"$regex": raw_pattern, "$options": "i"}}]}
+
+
+# (service query, collection, filter, sort) - mirrors app/services and the catalog/manifest/image services
+SERVICE_QUERIES = [
+    ("events.get_all", Collections.EVENTS, {}, NEWEST),
+    ("events.get_events_by_type", Collections.EVENTS, {"event_type": "technical"}, NEWEST),
+    ("events.get_upcoming_events", Collections.EVENTS, {"date": {"$gte": NOW}, "is_active": True}, [("date", 1)]),
+    ("placements.get_all", Collections.PLACEMENTS, {}, NEWEST),
+    ("placements.get_by_year_and_dept", Collections.PLACEMENTS, {"academic_year": "2024-25", "department": "CSE"}, NEWEST),
+    ("placements.get_year_wise_stats", Collections.PLACEMENTS, {"academic_year": "2024-25"}, NEWEST),
+    ("companies.get_all", Collections.COMPANY_PACKAGES, {}, NEWEST),
+    ("companies.get_by_company", Collections.COMPANY_PACKAGES, by_name("company_key", "company_name", "infosys", "^infosys$"), NEWEST),
+    ("companies.get_by_company(prefix)", Collections.COMPANY_PACKAGES, by_name("company_key", "company_name", PREFIX, "^info"), NEWEST),
+    ("companies.get_top_packages", Collections.COMPANY_PACKAGES, {}, [("package_offered", -1)]),
+    ("companies.get_by_year", Collections.COMPANY_PACKAGES, {"academic_year": "2024-25"}, NEWEST),
+    ("interviews.get_all", Collections.INTERVIEW_QUESTIONS, {}, NEWEST),
+    ("interviews.get_by_company", Collections.INTERVIEW_QUESTIONS, by_name("company_key", "company_name", "infosys", "^infosys$"), NEWEST),
+    ("interviews.get_by_company(prefix)", Collections.INTERVIEW_QUESTIONS, by_name("company_key", "company_name", PREFIX, "^info"), NEWEST),
+    ("interviews.get_by_category", Collections.INTERVIEW_QUESTIONS, {"question_category": "technical"}, NEWEST),
+    ("interviews.get_by_difficulty", Collections.INTERVIEW_QUESTIONS, {"difficulty_level": "easy"}, NEWEST),
+    ("internships.get_all", Collections.INTERNSHIPS, {}, NEWEST),
+    ("internships.get_active_internships", Collections.INTERNSHIPS, {"is_active": True, "application_deadline": {"$gte": NOW}}, [("application_deadline", 1)]),
+    ("internships.get_by_company", Collections.INTERNSHIPS, by_name("company_key", "company_name", "infosys", "^infosys$"), NEWEST),
+    ("internships.get_by_company(prefix)", Collections.INTERNSHIPS, by_name("company_key", "company_name", PREFIX, "^info"), NEWEST),
+    ("roadmaps.get_all", Collections.SKILL_ROADMAPS, {}, NEWEST),
+    ("roadmaps.get_by_department", Collections.SKILL_ROADMAPS, {"department": "CSE"}, NEWEST),
+    ("roadmaps.get_by_role", Collections.SKILL_ROADMAPS, by_name("role_key", "role_title", "data scientist", "^data\\ scientist$"), NEWEST),
+    ("roadmaps.get_by_role(prefix)", Collections.SKILL_ROADMAPS, by_name("role_key", "role_title", {"$regex": "^data"}, "^data"), NEWEST),
+    ("guides.get_all", Collections.RESUME_GUIDES, {}, NEWEST),
+    ("guides.get_by_category", Collections.RESUME_GUIDES, {"category": "resume"}, NEWEST),
+    ("clubs.get_all", Collections.CLUBS, {}, NEWEST),
+    ("clubs.get_by_category", Collections.CLUBS, {"category": "technical"}, NEWEST),
+    ("clubs.get_open_memberships", Collections.CLUBS, {"membership_open": True}, NEWEST),
+    ("scholarships.get_all", Collections.SCHOLARSHIPS, {}, NEWEST),
+    ("scholarships.get_active_scholarships", Collections.SCHOLARSHIPS, {"is_active": True, "application_deadline": {"$gte": NOW}}, [("application_deadline", 1)]),
+    ("scholarships.get_by_category", Collections.SCHOLARSHIPS, {"category": "merit"}, NEWEST),
+    ("students.get_all", Collections.STUDENTS, {}, NEWEST),
+    ("students.get_by_roll_number", Collections.STUDENTS, {"roll_number": "21R21A0501"}, NEWEST),
+    ("students.get_by_department", Collections.STUDENTS, {"department": "CSE"}, NEWEST),
+    ("students.get_by_placement_status", Collections.STUDENTS, {"placement_status": "placed"}, NEWEST),
+    ("reports.get_by_student_id", Collections.STUDENT_REPORTS, {"student_id": "abc"}, NEWEST),
+    ("documents.find_by_file_hash", Collections.DOCUMENTS, {"file_hash": "x", "namespace": "chatbot"}, None),
+    ("documents.list_documents", Collections.DOCUMENTS, {"status": "indexed"}, NEWEST),
+    ("manifest.page", Collections.VECTOR_MANIFEST, {"namespace": "chatbot"}, [("namespace", 1), ("vector_id", 1)]),
+    ("manifest.page(category)", Collections.VECTOR_MANIFEST, {"category": "events"}, [("namespace", 1), ("vector_id", 1)]),
+    ("images.get_images_by_category", Collections.IMAGES, {"category": "events"}, [("uploaded_at", -1)]),
+    ("images.get_image_by_label", Collections.IMAGES, {"label": "chairman", "category": "management"}, [("uploaded_at", -1)]),
+    ("images.save_metadata(dedup)", Collections.IMAGES, {"relative_path": "_cas/x.jpg", "category": "events", "label": "x"}, None),
+]
+
+
+def plan_stages(plan) -> list:
+    """Every stage name in a query plan tree"""
+    stages = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        if "stage" in node:
+            stages.append(node["stage"])
+        if "inputStage" in node:
+            stack.append(node["inputStage"])
+        stack.extend(node.get("inputStages", []))
+        if "queryPlan" in node:  # Slot-based engine wraps the classic plan
+            stack.append(node["queryPlan"])
+    return stages
+
+
+async def explain(db, collection: str, query: dict, sort) -> dict:
+    cursor = db[collection].find(query).limit(10)
+    if sort:
+        cursor = cursor.sort(sort)
+    return await cursor.explain()
+
+
+async def report(apply: bool) -> bool:
+    await mongodb.connect()
+    db = mongodb.get_database()
+    if db is None:
+        print("❌ MongoDB not available")
+        return False
+
+    if apply:
+        await mongodb.ensure_indexes()
+
+    print("\n" + "=" * 90)
+    print("🔎 SERVICE QUERY PLANS")
+    print("=" * 90)
+
+    collscans = 0
+    for name, collection, query, sort in SERVICE_QUERIES:
+        result = await explain(db, collection, query, sort)
+        stages = plan_stages(result.get("queryPlanner", {}).get("winningPlan", {}))
+        if "COLLSCAN" in stages:
+            collscans += 1
+            verdict = "❌ COLLSCAN"
+        elif "EOF" in stages:
+            verdict = "⚪ no collection"
+        elif "SORT" in stages:
+            verdict = "⚠️ IXSCAN + in-memory SORT"
+        else:
+            verdict = "✅ IXSCAN"
+        print(f"{name:<42} {collection:<20} {verdict:<28} {' > '.join(reversed(stages))}")
+
+    print(f"\n{'❌' if collscans else '✅'} {collscans} of {len(SERVICE_QUERIES)} queries do a collection scan")
+    if collscans and not apply:
+        print("   Run with --apply (or start the API) to create the declared indexes")
+
+    await mongodb.disconnect()
+    return collscans == 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Explain service queries and flag COLLSCANs")
+    parser.add_argument("--apply", action="store_true", help="Create declared indexes first")
+    args = parser.parse_args()
+
+    success = asyncio.run(report(args.apply))
+    sys.exit(0 if success else 1)
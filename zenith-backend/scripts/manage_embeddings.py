@@ -49,6 +49,19 @@ NAMESPACES = [
 ]
 
 
+def sync_manifest(removed):
+    """Drop deleted vectors from the MongoDB vector manifest (content listings and re-index skips read it)"""
+    try:
+        # Imported here: the manifest needs the app settings and MongoDB, stats and listings don't
+        from app.rag.manifest import forget_deleted
+        updated = forget_deleted(removed)
+    except Exception as e:
+        logger.warning(f"⚠️  Vector manifest: {e}")
+        updated = False
+    if not updated:
+        logger.warning("⚠️  Vector manifest not updated - run scripts/rebuild_vector_manifest.py once MongoDB is reachable")
+
+
 def get_index_stats():
     """Get current index statistics"""
     try:
@@ -88,6 +101,7 @@ def delete_by_namespace(namespace):
         print(f"\n🗑️  Deleting all vectors from namespace: {namespace}")
         index.delete(delete_all=True, namespace=namespace)
         logger.info(f"✅ Successfully deleted all vectors from namespace '{namespace}'")
+        sync_manifest({namespace: None})
         return True
     except Exception as e:
         logger.error(f"❌ Error deleting namespace '{namespace}': {e}")
@@ -121,6 +135,7 @@ def delete_by_document_id(document_id, namespace):
         
         # Delete by IDs
         index.delete(ids=ids_to_delete, namespace=namespace)
+        sync_manifest({namespace: ids_to_delete})
         
         logger.info(f"✅ Successfully deleted {len(ids_to_delete)} chunks from document '{document_id}'")
         return True
@@ -140,16 +155,19 @@ def delete_all_embeddings():
         print("❌ Deletion cancelled")
         return False
     
-    success_count = 0
+    cleared = []
     for namespace in NAMESPACES:
         try:
             index.delete(delete_all=True, namespace=namespace)
             logger.info(f"✅ Cleared namespace: {namespace}")
-            success_count += 1
+            cleared.append(namespace)
         except Exception as e:
             logger.error(f"❌ Error clearing namespace '{namespace}': {e}")
     
-    print(f"\n✅ Successfully cleared {success_count}/{len(NAMESPACES)} namespaces")
+    if cleared:
+        sync_manifest({namespace: None for namespace in cleared})
+    
+    print(f"\n✅ Successfully cleared {len(cleared)}/{len(NAMESPACES)} namespaces")
     return True
 
 
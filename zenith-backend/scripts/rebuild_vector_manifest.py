@@ -0,0 +1,87 @@
+"""
+Vector Manifest Rebuild Script
+Seeds the MongoDB vector manifest (used by GET /api/content) from what is already in Pinecone
+
+New vectors are recorded at write time; run this once for vectors indexed before the
+manifest existed, or after changing Pinecone outside the app.
+
+Usage:
+    python scripts/rebuild_vector_manifest.py [--namespace NAME] [--keep]
+"""
+import argparse
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database import mongodb, pinecone_db
+from app.rag.manifest import vector_manifest
+
+MAX_TOP_K = 10000  # Pinecone query limit
+RECORD_BATCH = 500
+
+
+def scan_namespace(index, namespace: str, dimension: int):
+    """
+    Enumerate vectors with a random-vector query
+    (pinecone-client 3.0 has no list API, so namespaces above 10,000 vectors are only partially scanned)
+    """
+    response = index.query(
+        vector=[random.uniform(-0.1, 0.1) for _ in range(dimension)],
+        namespace=namespace,
+        top_k=MAX_TOP_K,
+        include_metadata=True,
+        include_values=False
+    )
+    return response.matches or []
+
+
+async def rebuild(namespace_filter=None, keep=False) -> bool:
+    """Replace manifest entries with the vectors currently in Pinecone"""
+    print("🗂️  Rebuilding vector manifest...")
+    print("=" * 60)
+
+    await mongodb.connect()
+    if vector_manifest.collection is None:
+        print("❌ MongoDB not available")
+        return False
+    await vector_manifest.ensure_indexes()
+
+    pinecone_db.connect()
+    index = pinecone_db.get_index()
+    stats = index.describe_index_stats()
+    dimension = stats.get("dimension", 768)
+    namespaces = stats.get("namespaces", {})
+
+    for ns, ns_stats in namespaces.items():
+        if namespace_filter is not None and ns != namespace_filter:
+            continue
+
+        matches = scan_namespace(index, ns, dimension)
+        if not keep:
+            await vector_manifest.clear(ns)
+
+        vectors = [(m.id, None, m.metadata or {}) for m in matches]
+        for start in range(0, len(vectors), RECORD_BATCH):
+            await vector_manifest.record(vectors[start:start + RECORD_BATCH], ns)
+
+        total = ns_stats.get("vector_count", 0)
+        note = "" if len(matches) >= total else f" ⚠️ only {len(matches)} of {total} reachable by query"
+        print(f"   • {ns or 'default'}: {len(matches)} vectors recorded{note}")
+
+    print("\n✅ Vector manifest rebuilt")
+    await mongodb.disconnect()
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed the vector manifest from Pinecone")
+    parser.add_argument("--namespace", default=None, help="Only rebuild this namespace")
+    parser.add_argument("--keep", action="store_true", help="Merge into existing entries instead of replacing them")
+    args = parser.parse_args()
+
+    success = asyncio.run(rebuild(args.namespace, keep=args.keep))
+    sys.exit(0 if success else 1)
@@ -0,0 +1,30 @@
+"""
+Shared test fixtures
+
+Settings require MongoDB/Pinecone credentials at import time; tests never connect to either,
+so placeholders are enough. MongoDB-backed tests run against mongomock_motor.
+"""
+import os
+
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+os.environ.setdefault("PINECONE_API_KEY", "test")
+os.environ.setdefault("PINECONE_HOST", "https://test.pinecone.io")
+
+import pytest
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def mongo():
+    """In-memory MongoDB wired into app.database.mongodb for the duration of a test"""
+    from mongomock_motor import AsyncMongoMockClient
+    from app.database import MongoDB
+
+    previous = MongoDB.database
+    MongoDB.database = AsyncMongoMockClient()["test"]
+    yield MongoDB.database
+    MongoDB.database = previous
@@ -0,0 +1,99 @@
+"""Structure-aware chunking"""
+from app.rag.chunker import (
+    ChunkingConfig, TextChunker, iter_blocks,
+    HEADING, PAGE, LIST_ITEM, TABLE_ROW, PARAGRAPH
+)
+
+
+def words(text):
+    """Deterministic token counter: one token per word"""
+    return len(text.split())
+
+
+def chunker(max_tokens=20, overlap_tokens=0, min_tokens=1, **namespace_configs):
+    return TextChunker(
+        ChunkingConfig(max_tokens=max_tokens, overlap_tokens=overlap_tokens, min_tokens=min_tokens),
+        namespace_configs,
+        token_counter=words
+    )
+
+
+def sentences(count, prefix="Sentence"):
+    return " ".join(f"{prefix} number {i} has some words." for i in range(count))
+
+
+def test_blocks_by_kind():
+    text = "\n".join([
+        "--- Page 2 ---",
+        "PLACEMENT STATISTICS",
+        "First line of a paragraph",
+        "continues here.",
+        "",
+        "- a list item",
+        "| Company | CTC |",
+    ])
+    blocks = list(iter_blocks(text))
+    assert [b.kind for b in blocks] == [PAGE, HEADING, PARAGRAPH, LIST_ITEM, TABLE_ROW]
+    assert blocks[2].text == "First line of a paragraph continues here."
+    assert all(b.page == 2 for b in blocks)
+
+
+def test_chunks_stay_within_budget():
+    chunks = list(chunker(max_tokens=20).iter_chunks(sentences(30)))
+    assert len(chunks) > 1
+    assert all(chunk.tokens <= 20 for chunk in chunks)
+    assert all(words(chunk.text) == chunk.tokens for chunk in chunks)
+
+
+def test_over_long_sentence_is_split_by_word():
+    chunks = list(chunker(max_tokens=20).iter_chunks(" ".join(f"w{i}" for i in range(70))))
+    assert all(chunk.tokens <= 20 for chunk in chunks)
+    assert " ".join(chunk.text for chunk in chunks).split() == [f"w{i}" for i in range(70)]
+
+
+def test_list_items_are_not_split():
+    items = [f"- item {i} with four words" for i in range(10)]
+    chunks = chunker(max_tokens=22).chunk_text("\n".join(items))
+    for chunk in chunks:
+        for line in chunk.split("\n"):
+            assert line in items
+
+
+def test_split_table_repeats_header():
+    rows = ["| Company | Package |"] + [f"| Company{i} | {i} LPA |" for i in range(12)]
+    chunks = chunker(max_tokens=20).chunk_text("\n".join(rows))
+    assert len(chunks) > 1
+    assert all(chunk.startswith(rows[0]) for chunk in chunks)
+
+
+def test_headings_and_pages_attach_to_chunks():
+    text = "\n".join([
+        "--- Page 1 ---",
+        "ABOUT MLRIT",
+        sentences(2, "About"),
+        "--- Page 3 ---",
+        "PLACEMENTS",
+        sentences(2, "Placed"),
+    ])
+    chunks = list(chunker(max_tokens=50).iter_chunks(text))
+    assert [(c.heading, c.page) for c in chunks] == [("ABOUT MLRIT", 1), ("PLACEMENTS", 3)]
+    # No overlap carried across a section boundary
+    assert "About" not in chunks[1].text
+
+
+def test_overlap_carries_trailing_sentences():
+    chunks = list(chunker(max_tokens=20, overlap_tokens=6).iter_chunks(sentences(8)))
+    for previous, current in zip(chunks, chunks[1:]):
+        assert current.text.split("\n")[0] == previous.text.split("\n")[-1]
+
+
+def test_namespace_config_overrides_default():
+    text = sentences(30)
+    small = chunker(max_tokens=100, clubs=ChunkingConfig(max_tokens=20, overlap_tokens=0, min_tokens=1))
+    assert small.config_for("clubs").max_tokens == 20
+    assert small.config_for("events").max_tokens == 100
+    assert len(small.chunk_text(text, "clubs")) > len(small.chunk_text(text, "events"))
+
+
+def test_empty_text_has_no_chunks():
+    assert chunker().chunk_text("   \n\n") == []
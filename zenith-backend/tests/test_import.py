@@ -0,0 +1,164 @@
+"""NDJSON/CSV import: record parsing and per-line error reporting"""
+import io
+from typing import List, Optional
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+from pydantic import BaseModel
+
+from app.config import settings
+from app.routers import _add_bulk_routes
+from app.services.base import BaseCRUDService
+from app.utils.records import CSV, NDJSON, detect_format, iter_records, read_batch
+
+
+class Item(BaseModel):
+    name: str
+    count: int = 0
+    tags: List[str] = []
+
+
+class ItemUpdate(BaseModel):
+    name: Optional[str] = None
+
+
+class FakeService(BaseCRUDService):
+    """Stores valid records; names starting with "dup" fail like a duplicate key"""
+
+    def __init__(self):
+        super().__init__("items")
+        self.stored = []
+        self.batches = 0
+
+    async def bulk_create(self, items):
+        self.batches += 1
+        errors = [{"index": i, "error": "Duplicate"} for i, item in enumerate(items) if item["name"].startswith("dup")]
+        self.stored += [item for item in items if not item["name"].startswith("dup")]
+        return {"succeeded": len(items) - len(errors), "errors": errors}
+
+
+@pytest.fixture
+def service():
+    return FakeService()
+
+
+@pytest.fixture
+async def client(service):
+    async with serve(service) as client:
+        yield client
+
+
+def serve(service):
+    router = APIRouter(prefix="/items")
+    _add_bulk_routes(router, service, Item, ItemUpdate, "items")
+    app = FastAPI()
+    app.include_router(router)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def upload(client, name, content):
+    response = await client.post("/items/import", files={"file": (name, content)})
+    return response.json()
+
+
+def test_detect_format():
+    assert detect_format("students.csv") == CSV
+    assert detect_format("students.JSONL") == NDJSON
+    assert detect_format("upload", "application/x-ndjson") == NDJSON
+    assert detect_format("students.json", "application/json") is None  # A JSON array isn't NDJSON
+
+
+def test_csv_cells():
+    rows = list(iter_records(io.BytesIO(b'name,count,tags\nA,3,"[""x"",""y""]"\nB,,\n'), CSV))
+    assert rows == [
+        (2, {"name": "A", "count": "3", "tags": ["x", "y"]}, None),
+        (3, {"name": "B"}, None),
+    ]
+
+
+def test_read_batch_keeps_records_before_a_read_error():
+    # Bad bytes past the first decode block (8 KB)
+    good = b'{"name": "a"}\n' * 1000
+    records = iter_records(io.BytesIO(good + b"\xff\xfe\n"), NDJSON)
+    results, error = read_batch(records, 5000)
+    assert len(results) >= 500
+    assert error.startswith("Could not read file")
+    assert read_batch(records, 10) == ([], None)
+
+
+@pytest.mark.anyio
+async def test_ndjson_errors_carry_line_numbers(client, service):
+    content = b'{"name": "a"}\n\nnot json\n[1, 2]\n{"count": 1}\n{"name": "dup"}\n{"name": "b", "count": 2}\n'
+    result = await upload(client, "items.ndjson", content)
+    assert result["succeeded"] == 2
+    assert result["failed"] == 4
+    assert [err["line"] for err in result["errors"]] == [3, 4, 5, 6]
+    assert "Invalid JSON" in result["errors"][0]["error"]
+    assert result["errors"][1]["error"] == "Expected a JSON object"
+    assert result["errors"][2]["error"].startswith("name:")
+    assert result["errors"][3]["error"] == "Duplicate"
+    assert [item["name"] for item in service.stored] == ["a", "b"]
+
+
+@pytest.mark.anyio
+async def test_csv_errors_carry_line_numbers(client):
+    content = b"name,count\na,1\nb,not-a-number\nc,2,extra\ndup,3\n"
+    result = await upload(client, "items.csv", content)
+    assert result["succeeded"] == 1
+    assert [(err["line"], err["error"]) for err in result["errors"]] == [
+        (3, result["errors"][0]["error"]),
+        (4, "More values than header columns"),
+        (5, "Duplicate"),
+    ]
+    assert result["errors"][0]["error"].startswith("count:")
+
+
+@pytest.mark.anyio
+async def test_reported_errors_are_capped_but_all_counted(client, service, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_MAX_REPORTED_ERRORS", 5)
+    monkeypatch.setattr(settings, "BULK_BATCH_SIZE", 4)
+    lines = [b'{"name": "ok%d"}' % i if i % 3 == 0 else b"{broken" for i in range(30)]
+    result = await upload(client, "items.ndjson", b"\n".join(lines))
+    assert result["succeeded"] == 10
+    assert result["failed"] == 20
+    assert len(result["errors"]) == 5
+    assert service.batches == 3
+
+
+@pytest.mark.anyio
+async def test_unreadable_file_keeps_earlier_batches(client, service, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_BATCH_SIZE", 2)
+    result = await upload(client, "items.ndjson", b'{"name": "a"}\n' * 1000 + b"\xff\n")
+    assert result["succeeded"] >= 500
+    assert result["errors"][0]["error"].startswith("Could not read file")
+
+
+@pytest.mark.anyio
+async def test_unknown_format_is_rejected(client):
+    response = await client.post("/items/import", files={"file": ("items.json", b'[{"name": "a"}]')})
+    assert response.status_code == 400
+
+
+class TaggedService(BaseCRUDService):
+    CHANGE_KEY = "name"
+
+
+@pytest.mark.anyio
+async def test_listeners_run_once_per_import(mongo, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_BATCH_SIZE", 3)
+    service = TaggedService("items")
+    calls = []
+
+    async def listener(values):
+        calls.append(values)
+
+    service.on_change(listener)
+    async with serve(service) as client:
+        result = await upload(client, "items.csv", b"name\n" + b"\n".join(b"n%d" % (i % 4) for i in range(10)))
+        assert result["succeeded"] == 10
+        assert calls == [{"n0", "n1", "n2", "n3"}]
+
+        # Writes outside an import still notify straight away
+        await service.create({"name": "solo"})
+        assert calls[-1] == {"solo"}
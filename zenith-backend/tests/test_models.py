@@ -0,0 +1,39 @@
+"""Raw-BSON JSON encoding"""
+import json
+from copy import deepcopy
+from datetime import datetime, timezone
+
+import orjson
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+from app.models import dumps_bson, serialize_doc
+
+
+def legacy_json(doc):
+    """What endpoints returned before dumps_bson: serialize_doc, then FastAPI's encoder"""
+    return json.loads(json.dumps(jsonable_encoder(serialize_doc(deepcopy(doc)))))
+
+
+def test_matches_serialize_doc_for_mongo_documents():
+    doc = {
+        "_id": ObjectId(),
+        "student_id": ObjectId(),
+        "name": "Asha",
+        "package_offered": 12.5,
+        "offers": 2,
+        "is_active": True,
+        "deadline": None,
+        "created_at": datetime(2024, 3, 1, 9, 30, 15, 123000),  # MongoDB keeps milliseconds
+        "updated_at": datetime(2024, 3, 1, 9, 30),
+        "aware": datetime(2024, 3, 1, 9, 30, 15, 500000, tzinfo=timezone.utc),  # tz_aware clients
+        "rounds": [{"name": "HR", "at": datetime(2024, 3, 2), "panel_id": ObjectId()}, "note"],
+        "meta": {"source": "upload", "uploaded_at": datetime(2024, 3, 3, 1, 2, 3)},
+        "tags": ["a", "b"],
+    }
+    assert orjson.loads(dumps_bson(doc)) == legacy_json(doc)
+
+
+def test_lists_of_documents():
+    docs = [{"_id": ObjectId(), "created_at": datetime(2024, 1, i + 1)} for i in range(3)]
+    assert orjson.loads(dumps_bson({"data": docs})) == {"data": [legacy_json(doc) for doc in docs]}
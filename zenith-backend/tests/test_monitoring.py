@@ -0,0 +1,26 @@
+"""MongoDB pool telemetry"""
+from app.monitoring import MongoMetrics
+
+
+def check_out(metrics, count=1):
+    for _ in range(count):
+        metrics.connection_check_out_started(None)
+        metrics.connection_checked_out(None)
+
+
+def test_reset_keeps_live_connection_gauge():
+    metrics = MongoMetrics()
+    check_out(metrics, 3)
+    metrics.connection_checked_in(None)
+    assert (metrics.in_use, metrics.max_in_use) == (2, 3)
+
+    metrics.reset()
+    pool = metrics.snapshot()["pool"]
+    assert (pool["in_use"], pool["max_in_use"], pool["checkouts"]) == (2, 2, 0)
+
+    # Connections checked out before the reset still come back without the gauge drifting
+    metrics.connection_checked_in(None)
+    metrics.connection_checked_in(None)
+    check_out(metrics)
+    pool = metrics.snapshot()["pool"]
+    assert (pool["in_use"], pool["max_in_use"], pool["checked_in"]) == (1, 2, 2)
@@ -0,0 +1,90 @@
+"""Normalized company/role name lookups"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.base import BaseCRUDService
+from app.services.name_search import TrigramIndex, normalize_name, raw_name_filter
+
+pytestmark = pytest.mark.anyio
+
+
+class Companies(BaseCRUDService):
+    NAME_KEYS = {"company_name": "company_key"}
+
+    def __init__(self):
+        super().__init__("companies")
+
+
+def test_normalize_name():
+    assert normalize_name("Tata Consultancy Services (TCS)") == "tata consultancy services tcs"
+    assert normalize_name("  Zoho  Corp. ") == "zoho corp"
+    assert normalize_name("Société Générale") == "societe generale"
+    assert normalize_name("C++ / .NET") == "c net"
+    assert normalize_name(None) == ""
+
+
+def test_trigram_suggestions():
+    index = TrigramIndex(["infosys", "infor", "wipro", "tata consultancy services", ""])
+    assert index.suggest("Infosis")[0][0] == "infosys"
+    assert [key for key, _ in index.suggest("wipr")] == ["wipro"]
+    assert index.suggest("zzzz") == []
+    assert len(index.suggest("info", limit=1)) == 1
+
+
+def test_raw_name_filter_is_literal():
+    assert raw_name_filter("A.B (C)", "exact") == {"$regex": r"^A\.B\ \(C\)$", "$options": "i"}
+    assert raw_name_filter(".*", "prefix")["$regex"] == r"^\.\*"
+    assert raw_name_filter("tcs", "contains")["$regex"] == "tcs"
+
+
+@pytest.fixture
+async def companies(mongo):
+    service = Companies()
+    now = datetime.utcnow()
+    for name in ["Infosys", "Tata Consultancy Services", "Wipro"]:
+        await service.create({"company_name": name})
+    # Stored before name keys existed
+    await mongo["companies"].insert_many([
+        {"company_name": "Zoho Corporation", "created_at": now - timedelta(days=1)},
+        {"company_name": "Infosys BPM", "created_at": now - timedelta(days=2)},
+    ])
+    return service
+
+
+def names(docs):
+    return [doc["company_name"] for doc in docs]
+
+
+async def test_exact_prefix_and_contains(companies):
+    assert names(await companies.find_by_name("company_name", "INFOSYS", "exact")) == ["Infosys"]
+    assert names(await companies.find_by_name("company_name", "tata consult", "prefix")) == ["Tata Consultancy Services"]
+    assert names(await companies.find_by_name("company_name", "consultancy", "contains")) == ["Tata Consultancy Services"]
+    assert await companies.find_by_name("company_name", "consultancy", "prefix") == []
+
+
+async def test_auto_falls_through_to_substring_then_fuzzy(companies):
+    assert names(await companies.find_by_name("company_name", "Consultancy Services")) == ["Tata Consultancy Services"]
+    assert names(await companies.find_by_name("company_name", "Wipra")) == ["Wipro"]
+
+
+async def test_records_without_keys_are_still_found(companies):
+    assert names(await companies.find_by_name("company_name", "zoho corporation", "exact")) == ["Zoho Corporation"]
+    assert names(await companies.find_by_name("company_name", "Info", "prefix")) == ["Infosys", "Infosys BPM"]
+    assert names(await companies.find_by_name("company_name", "corp")) == ["Zoho Corporation"]
+
+
+async def test_user_input_is_not_a_pattern(companies):
+    assert await companies.find_by_name("company_name", ".*", "contains") == []
+    assert await companies.find_by_name("company_name", "(", "prefix") == []
+
+
+async def test_backfill_name_keys(companies, mongo):
+    assert await companies.backfill_name_keys(dry_run=True) == {"company_key": 2}
+    assert await mongo["companies"].count_documents({"company_key": None}) == 2
+
+    assert await companies.backfill_name_keys() == {"company_key": 2}
+    assert await mongo["companies"].count_documents({"company_key": None}) == 0
+    assert await companies.backfill_name_keys() == {"company_key": 0}
+    # Backfilled records join fuzzy matching too
+    assert names(await companies.find_by_name("company_name", "Zoho Corporaton", "fuzzy")) == ["Zoho Corporation"]
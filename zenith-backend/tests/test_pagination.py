@@ -0,0 +1,81 @@
+"""Keyset cursors and list paging in BaseCRUDService"""
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from app.services.base import BaseCRUDService, decode_cursor, encode_cursor
+
+pytestmark = pytest.mark.anyio
+
+
+def test_cursor_round_trip():
+    doc = {"_id": ObjectId(), "created_at": datetime(2024, 3, 1, 12, 30, 5, 123000)}
+    assert decode_cursor(encode_cursor(doc)) == (doc["created_at"], doc["_id"])
+
+
+def test_cursor_without_created_at():
+    doc_id = ObjectId()
+    assert decode_cursor(encode_cursor({"_id": doc_id})) == (None, doc_id)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    base64.urlsafe_b64encode(b"{}").decode(),
+    base64.urlsafe_b64encode(b'["2024-01-01T00:00:00"]').decode(),
+    base64.urlsafe_b64encode(b'["2024-01-01T00:00:00","not-an-object-id"]').decode(),
+    base64.urlsafe_b64encode(b'["yesterday","65f1c0ffee0000000000abcd"]').decode(),
+])
+def test_malformed_cursor_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+async def _seed(mongo, count, created_at):
+    service = BaseCRUDService("items")
+    await mongo["items"].insert_many([{"n": i, "kind": i % 2, "created_at": created_at} for i in range(count)])
+    return service
+
+
+async def test_keyset_pages_with_equal_created_at(mongo):
+    # Every document shares one timestamp, so only the _id tie-break orders them
+    service = await _seed(mongo, 23, datetime(2024, 1, 1))
+    seen, cursor = [], None
+    while True:
+        docs, cursor = await service.get_page(cursor=cursor, limit=5)
+        seen += [doc["_id"] for doc in docs]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen)) == 23
+    assert seen == sorted(seen, reverse=True)
+
+
+async def test_keyset_pages_match_offset_pages(mongo):
+    service = await _seed(mongo, 12, datetime(2024, 1, 1))
+    await mongo["items"].insert_many(
+        [{"n": 100 + i, "kind": 0, "created_at": datetime(2024, 1, 1) + timedelta(minutes=i)} for i in range(4)]
+    )
+
+    first, cursor = await service.get_page(limit=6)
+    second, _ = await service.get_page(cursor=cursor, limit=6)
+    by_offset, _ = await service.get_page(skip=6, limit=6)
+    assert [doc["_id"] for doc in second] == [doc["_id"] for doc in by_offset]
+    assert [doc["n"] for doc in first[:4]] == [103, 102, 101, 100]
+
+
+async def test_filtered_page_reports_total_and_last_cursor(mongo):
+    service = await _seed(mongo, 10, datetime(2024, 1, 1))
+    docs, total, cursor = await service.page(limit=3, filters={"kind": 1})
+    assert (len(docs), total) == (3, 5)
+
+    docs, total, cursor = await service.page(cursor=cursor, limit=3, filters={"kind": 1})
+    assert (len(docs), total, cursor) == (2, 5, None)
+    assert all(doc["kind"] == 1 for doc in docs)
+
+
+async def test_page_rejects_malformed_cursor(mongo):
+    service = await _seed(mongo, 1, datetime(2024, 1, 1))
+    with pytest.raises(ValueError):
+        await service.page(cursor="garbage")
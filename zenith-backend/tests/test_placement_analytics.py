@@ -0,0 +1,74 @@
+"""Offer statistics for materialized placement analytics"""
+import random
+import statistics
+
+import pytest
+
+from app.services.placement_analytics import build_year, package_stats
+
+
+def expanded(offers):
+    """One entry per selected student - what package_stats computes without building"""
+    return [float(package) for package, count in offers if package and count and count > 0 for _ in range(count)]
+
+
+def test_odd_and_even_offer_counts():
+    assert package_stats([(10, 1), (4, 1), (6, 1)])["median_package"] == 6
+    assert package_stats([(10, 1), (4, 1), (6, 1), (8, 1)])["median_package"] == 7
+
+
+def test_median_is_weighted_by_students_selected():
+    # 1 offer at 50 LPA and 9 at 4 LPA: the typical offer is 4, not the midpoint of the packages
+    stats = package_stats([(50, 1), (4, 9)])
+    assert stats["offers"] == 10
+    assert stats["median_package"] == 4
+    assert stats["average_package"] == 8.6
+    assert (stats["lowest_package"], stats["highest_package"]) == (4, 50)
+
+
+def test_median_between_two_package_groups():
+    assert package_stats([(3, 2), (7, 2)])["median_package"] == 5
+
+
+def test_offers_without_package_or_selections_are_ignored():
+    stats = package_stats([(None, 5), (0, 3), (12, 0), (12, -1), (6, 2)])
+    assert stats["offers"] == 2
+    assert stats["median_package"] == 6
+
+
+@pytest.mark.parametrize("offers", [[], [(None, 2)], [(5, 0)]])
+def test_no_offers(offers):
+    assert package_stats(offers) == {
+        "offers": 0, "average_package": None, "median_package": None,
+        "highest_package": None, "lowest_package": None
+    }
+
+
+def test_matches_expanded_offers():
+    rng = random.Random(49)
+    for _ in range(200):
+        offers = [(round(rng.uniform(2, 40), 1), rng.randint(0, 6)) for _ in range(rng.randint(1, 12))]
+        values = expanded(offers)
+        stats = package_stats(offers)
+        if not values:
+            assert stats["offers"] == 0
+            continue
+        assert stats["offers"] == len(values)
+        assert stats["median_package"] == round(statistics.median(values), 2)
+        assert stats["average_package"] == pytest.approx(statistics.fmean(values), abs=0.006)
+
+
+def test_build_year_attributes_offers_to_open_departments():
+    packages = [
+        {"company_name": "Infosys", "package_offered": 4, "students_selected": 3, "departments_allowed": ["CSE", "ECE"]},
+        {"company_name": "Google", "package_offered": 40, "students_selected": 1, "departments_allowed": ["CSE"]},
+    ]
+    placements = [{"department": "CSE", "total_students": 100, "students_placed": 80, "average_package": 6}]
+    doc = build_year("2024-2025", placements, packages)
+
+    assert doc["summary"]["offers"] == 4
+    assert doc["summary"]["median_package"] == 4
+    assert doc["departments"]["CSE"]["open_offers"]["median_package"] == 4
+    assert doc["departments"]["ECE"]["open_offers"]["offers"] == 3
+    assert doc["departments"]["CSE"]["placement_percentage"] == 80
+    assert doc["companies"]["google"]["median_package"] == 40
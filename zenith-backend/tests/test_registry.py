@@ -0,0 +1,94 @@
+"""Chunk diffing and duplicate-upload claims for the document registry"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.database import Collections, mongodb
+from app.rag.registry import CLAIM_TIMEOUT, STATUS_INDEXING, DocumentRegistry
+from app.utils import text_hash
+
+
+def stored(*texts):
+    return [{"hash": text_hash(text), "id": f"vec-{text}"} for text in texts]
+
+
+def test_identical_upload_reuses_every_chunk():
+    added, kept, removed = DocumentRegistry.diff_chunks(stored("a", "b"), ["a", "b"])
+    assert added == []
+    assert [c["id"] for c in kept] == ["vec-a", "vec-b"]
+    assert removed == []
+
+
+def test_changed_upload_embeds_only_new_chunks():
+    added, kept, removed = DocumentRegistry.diff_chunks(stored("a", "b", "c"), ["a", "B2", "c", "d"])
+    assert added == [(1, text_hash("B2"), "B2"), (3, text_hash("d"), "d")]
+    assert [c["id"] for c in kept] == ["vec-a", "vec-c"]
+    assert removed == ["vec-b"]
+
+
+def test_repeated_chunk_is_embedded_once():
+    added, kept, removed = DocumentRegistry.diff_chunks([], ["x", "y", "x"])
+    assert [index for index, _, _ in added] == [0, 1]
+
+
+def test_first_upload_and_emptied_document():
+    added, _, removed = DocumentRegistry.diff_chunks([], ["only"])
+    assert [text for _, _, text in added] == ["only"] and removed == []
+
+    added, kept, removed = DocumentRegistry.diff_chunks(stored("a", "b"), [])
+    assert (added, kept, removed) == ([], [], ["vec-a", "vec-b"])
+
+
+def test_chunks_without_hash_are_removed():
+    previous = [{"hash": None, "id": "legacy"}, *stored("a")]
+    _, kept, removed = DocumentRegistry.diff_chunks(previous, ["a"])
+    assert [c["id"] for c in kept] == ["vec-a"]
+    assert removed == ["legacy"]
+
+
+@pytest.fixture
+async def registry(mongo):
+    await mongodb.ensure_indexes([Collections.DOCUMENTS])
+    return DocumentRegistry()
+
+
+def fields(name="report.pdf"):
+    return {"filename": name, "status": STATUS_INDEXING}
+
+
+@pytest.mark.anyio
+async def test_concurrent_identical_uploads_claim_once(registry):
+    results = await asyncio.gather(*(
+        registry.claim(doc_id, "hash-1", "events", fields()) for doc_id in ("doc-a", "doc-b", "doc-c")
+    ))
+    winners = [doc_id for doc_id, existing in zip(("doc-a", "doc-b", "doc-c"), results) if existing is None]
+    assert len(winners) == 1
+    assert all(existing["_id"] == winners[0] for existing in results if existing is not None)
+    # The same bytes in another namespace are a separate document
+    assert await registry.claim("doc-d", "hash-1", "placements", fields()) is None
+
+
+@pytest.mark.anyio
+async def test_new_version_claims_its_own_record(registry):
+    await registry.save("doc-a", "hash-1", "events", "report.pdf", [])
+    assert await registry.claim("doc-a", "hash-2", "events", fields()) is None
+    assert (await registry.get("doc-a"))["file_hash"] == "hash-2"
+    # A second identical upload of that version finds the claim instead of overwriting it
+    existing = await registry.claim("doc-a", "hash-2", "events", fields())
+    assert existing["_id"] == "doc-a" and existing["status"] == STATUS_INDEXING
+
+
+@pytest.mark.anyio
+async def test_released_and_stale_claims_can_be_retaken(registry, mongo):
+    assert await registry.claim("doc-a", "hash-1", "events", fields()) is None
+    await registry.save("doc-a", None, "events", "report.pdf", [])  # Partial indexing releases the hash
+    assert await registry.claim("doc-b", "hash-1", "events", fields()) is None
+
+    # doc-b's worker died mid-indexing
+    await mongo[Collections.DOCUMENTS].update_one(
+        {"_id": "doc-b"}, {"$set": {"updated_at": datetime.utcnow() - CLAIM_TIMEOUT - timedelta(minutes=1)}}
+    )
+    await mongo[Collections.DOCUMENTS].delete_one({"_id": "doc-a"})
+    assert await registry.claim("doc-c", "hash-1", "events", fields()) is None
+    assert (await registry.get("doc-b"))["file_hash"] is None